@@ -0,0 +1,68 @@
+"""Add revoked tokens.
+
+Revision ID: 3f1c2b7d9e04
+Revises: a6d7900b60c4
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2b7d9e04"
+down_revision: str | Sequence[str] | None = "a6d7900b60c4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "revoked_tokens",
+        sa.Column("token_id", sa.String(length=64), nullable=False),
+        sa.Column(
+            "is_consumed",
+            sa.Boolean(),
+            server_default=sa.text("false"),
+            nullable=False,
+        ),
+        sa.Column("expires_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_revoked_tokens")),
+        sa.UniqueConstraint(
+            "token_id", name=op.f("uq_revoked_tokens_token_id")
+        ),
+    )
+    op.create_index(
+        op.f("ix_revoked_tokens_created_at"),
+        "revoked_tokens",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_revoked_tokens_expires_at"),
+        "revoked_tokens",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_revoked_tokens_expires_at"), table_name="revoked_tokens"
+    )
+    op.drop_index(
+        op.f("ix_revoked_tokens_created_at"), table_name="revoked_tokens"
+    )
+    op.drop_table("revoked_tokens")
@@ -0,0 +1,115 @@
+from itertools import count
+
+from src.auth.domain.entities.user import User
+from src.auth.domain.entities.user_profile import UserProfile
+from src.auth.domain.interfaces import (
+    IPermissionRepository,
+    IRevocationStore,
+    IUserRepository,
+)
+from src.auth.infra.repositories.revocation_store import (
+    InMemoryRevocationStore,
+)
+from src.auth.infra.security import hash_password
+from src.core.utils import utcnow
+
+
+class InMemoryUserRepository(IUserRepository):
+    """Dict-backed user repository used to benchmark without Postgres."""
+
+    def __init__(self) -> None:
+        """Initialize an empty repository."""
+        self._ids = count(1)
+        self._by_id: dict[int, User] = {}
+        self._by_email: dict[str, User] = {}
+
+    async def add_user(self, user: User) -> User:
+        """Add user."""
+        user.id = next(self._ids)
+        user.created_at = user.updated_at = utcnow()
+        if user.profile is not None:
+            user.profile.user_id = user.id
+            user.profile.created_at = user.profile.updated_at = utcnow()
+        self._by_id[user.id] = user
+        self._by_email[user.email] = user
+        return user
+
+    async def get_by_id(self, id: int) -> User | None:
+        """Get user by id."""
+        return self._by_id.get(id)
+
+    async def get_by_email(self, email: str) -> User | None:
+        """Get user by email."""
+        return self._by_email.get(email)
+
+    async def update_hashed_password(
+        self, user: User, hashed_password: str
+    ) -> None:
+        """Replace the password hash of a user."""
+        if user.id is None or user.id not in self._by_id:
+            return
+        stored = self._by_id[user.id]
+        stored.hashed_password = hashed_password
+        self._by_email[stored.email] = stored
+
+
+class InMemoryPermissionRepository(IPermissionRepository):
+    """Permission repository without roles: users hold no permissions."""
+
+    def __init__(self, catalog: dict[str, int] | None = None) -> None:
+        """Initialize the repository with a permission catalog."""
+        self._catalog = catalog or {"users:read": 1}
+
+    async def get_catalog(self) -> dict[str, int]:
+        """Return the ids of the active permissions keyed by name."""
+        return dict(self._catalog)
+
+    async def get_user_permission_ids(self, user_id: int) -> list[int]:  # noqa: ARG002
+        """Return the ids of the active permissions granted to a user."""
+        return []
+
+
+class InMemoryAuthUnitOfWork:
+    """Unit of work over the in-memory repositories."""
+
+    def __init__(
+        self,
+        user_repo: InMemoryUserRepository,
+        permission_repo: InMemoryPermissionRepository | None = None,
+        revocation_store: IRevocationStore | None = None,
+    ) -> None:
+        """Initialize the unit of work.
+
+        Pass the same revocation store to every unit of work, so rotated
+        refresh tokens are seen across requests.
+        """
+        self.user_repo = user_repo
+        self.permission_repo = (
+            permission_repo or InMemoryPermissionRepository()
+        )
+        self.revocation_store = revocation_store or InMemoryRevocationStore()
+
+    async def __aenter__(self) -> "InMemoryAuthUnitOfWork":
+        """Enter the unit of work."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Exit the unit of work."""
+
+    async def commit(self) -> None:
+        """Commit the unit of work."""
+
+    async def rollback(self) -> None:
+        """Roll back the unit of work."""
+
+
+def make_user(email: str, password: str) -> User:
+    """Create an active user with a profile."""
+    return User(
+        email=email,
+        hashed_password=hash_password(password),
+        is_active=True,
+        is_superuser=False,
+        is_verified=True,
+        profile=UserProfile(first_name="Bench", last_name="User"),
+    )
@@ -0,0 +1,66 @@
+"""Per-call JWT encode/decode cost with PEM strings vs parsed key objects.
+
+Usage:
+    python -m benchmarks.jwt_keys --number 200
+"""
+
+import argparse
+import timeit
+from collections.abc import Callable
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+ALGORITHM = "RS256"
+
+
+def build_cases() -> dict[str, Callable[[], object]]:
+    """Build the benchmark cases for a freshly generated RSA key pair."""
+    private_key = rsa.generate_private_key(
+        public_exponent=65537, key_size=2048
+    )
+    public_key = private_key.public_key()
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    public_pem = public_key.public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+
+    payload = {"sub": "1", "token_type": "access"}
+    token = jwt.encode(payload, private_key, algorithm=ALGORITHM)
+
+    return {
+        "encode/pem": lambda: jwt.encode(
+            payload, private_pem, algorithm=ALGORITHM
+        ),
+        "encode/key": lambda: jwt.encode(
+            payload, private_key, algorithm=ALGORITHM
+        ),
+        "decode/pem": lambda: jwt.decode(
+            token, public_pem, algorithms=[ALGORITHM]
+        ),
+        "decode/key": lambda: jwt.decode(
+            token, public_key, algorithms=[ALGORITHM]
+        ),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the per-call cost of each case."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, case in build_cases().items():
+        best = min(timeit.repeat(case, number=args.number, repeat=args.repeat))
+        print(f"{name:<12} {best / args.number * 1e6:10.1f} us/call")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
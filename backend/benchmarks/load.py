@@ -0,0 +1,217 @@
+"""In-process load test for the auth endpoints.
+
+Requests are driven through httpx's ASGI transport, so no server or
+network is involved. By default the auth unit of work is replaced with an
+in-memory fake; pass ``--database`` to run against the configured
+Postgres (e.g. a local container).
+
+Usage:
+    python -m benchmarks.load --requests 2000 --concurrency 32
+    python -m benchmarks.load --scenario me --output load.json
+    python -m benchmarks.load --database --compare load.json
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from itertools import count
+
+import httpx
+
+from src.auth.dependencies import get_auth_uow, get_login_throttle
+from src.auth.infra.repositories.revocation_store import (
+    InMemoryRevocationStore,
+)
+from src.core.config import SERVER_SETTINGS as SETTINGS
+from src.main import app
+
+from .fakes import InMemoryAuthUnitOfWork, InMemoryUserRepository, make_user
+from .utils import (
+    BenchmarkResult,
+    compare_results,
+    print_results,
+    write_results,
+)
+
+SCENARIOS = ("login", "refresh", "me", "register")
+AUTH_PREFIX = (
+    f"{SETTINGS.API_PREFIX.prefix}{SETTINGS.API_PREFIX.v1.prefix}"
+    f"{SETTINGS.AUTH.prefix}"
+)
+PASSWORD = "benchmark-password"
+
+type RequestFactory = Callable[[], Awaitable[httpx.Response]]
+
+
+async def run_scenario(
+    name: str,
+    send: RequestFactory,
+    total: int,
+    concurrency: int,
+) -> BenchmarkResult:
+    """Send ``total`` requests with ``concurrency`` concurrent clients."""
+    remaining = count(total, -1)
+    samples: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        while next(remaining) > 0:
+            started = time.perf_counter()
+            response = await send()
+            samples.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return BenchmarkResult.from_samples(
+        name, samples, time.perf_counter() - started, errors=errors
+    )
+
+
+async def prepare_user(client: httpx.AsyncClient, email: str) -> None:
+    """Ensure the benchmark user exists."""
+    response = await client.post(
+        f"{AUTH_PREFIX}/register",
+        json={"email": email, "password": PASSWORD, "profile": {}},
+    )
+    if response.status_code not in {200, 409}:
+        raise RuntimeError(f"Cannot create benchmark user: {response.text}")
+
+
+async def run(
+    scenarios: list[str], total: int, concurrency: int, database: bool
+) -> list[BenchmarkResult]:
+    """Run the selected scenarios."""
+    run_id = uuid.uuid4().hex[:8]
+    email = "bench-user@example.com"
+    # A single user logs in on every request of the login scenario.
+    app.dependency_overrides[get_login_throttle] = lambda: None
+    if not database:
+        repository = InMemoryUserRepository()
+        revocation_store = InMemoryRevocationStore()
+        await repository.add_user(make_user(email, PASSWORD))
+        app.dependency_overrides[get_auth_uow] = lambda: (
+            InMemoryAuthUnitOfWork(
+                repository, revocation_store=revocation_store
+            )
+        )
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+        if database:
+            await prepare_user(client, email)
+
+        async def login() -> httpx.Response:
+            response = await client.post(
+                SETTINGS.AUTH.token_url,
+                data={"username": email, "password": PASSWORD},
+            )
+            response.raise_for_status()
+            return response
+
+        access_token = (await login()).json()["access_token"]
+        registrations = count()
+
+        # Refresh tokens are single use: each client follows its own
+        # rotation chain, sending the token it received last.
+        refresh_tokens: asyncio.Queue[str] = asyncio.Queue()
+        if "refresh" in scenarios:
+            for _ in range(concurrency):
+                refresh_tokens.put_nowait(
+                    (await login()).cookies[SETTINGS.AUTH.cookie_name]
+                )
+
+        async def refresh() -> httpx.Response:
+            refresh_token = await refresh_tokens.get()
+            response = await client.post(
+                f"{AUTH_PREFIX}/refresh",
+                headers={
+                    "Cookie": f"{SETTINGS.AUTH.cookie_name}={refresh_token}"
+                },
+            )
+            refresh_tokens.put_nowait(
+                response.cookies.get(SETTINGS.AUTH.cookie_name)
+                or refresh_token
+            )
+            return response
+
+        requests: dict[str, RequestFactory] = {
+            "login": lambda: client.post(
+                SETTINGS.AUTH.token_url,
+                data={"username": email, "password": PASSWORD},
+            ),
+            "refresh": refresh,
+            "me": lambda: client.get(
+                f"{AUTH_PREFIX}/user/me",
+                headers={"Authorization": f"Bearer {access_token}"},
+            ),
+            "register": lambda: client.post(
+                f"{AUTH_PREFIX}/register",
+                json={
+                    "email": (
+                        f"bench-{run_id}-{next(registrations)}@example.com"
+                    ),
+                    "password": PASSWORD,
+                    "profile": {},
+                },
+            ),
+        }
+
+        return [
+            await run_scenario(
+                f"{name}[c={concurrency}]",
+                requests[name],
+                total=total,
+                concurrency=concurrency,
+            )
+            for name in scenarios
+        ]
+
+
+def main() -> None:
+    """Run the load test from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="Scenario to run, repeatable (default: all)",
+    )
+    parser.add_argument("--requests", type=int, default=1_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--database",
+        action="store_true",
+        help="Use the configured Postgres instead of the in-memory fake",
+    )
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--compare", help="Baseline JSON to compare with")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(args.log_level)
+    results = asyncio.run(
+        run(
+            scenarios=args.scenario or list(SCENARIOS),
+            total=args.requests,
+            concurrency=args.concurrency,
+            database=args.database,
+        )
+    )
+    print_results(results)
+    if args.output:
+        write_results(args.output, suite="load", results=results)
+    if args.compare and not compare_results(args.compare, results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Micro-benchmarks for the auth hot paths.
+
+Usage:
+    python -m benchmarks.micro --iterations 1000 --output micro.json
+    python -m benchmarks.micro --compare micro.json
+"""
+
+import argparse
+import logging
+import sys
+from typing import TYPE_CHECKING, cast
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from src.auth.api.schemas import UserRead
+from src.auth.infra.models.user_orm import UserORM
+from src.auth.infra.models.user_profile_orm import UserProfileORM
+from src.auth.infra.repositories.user_repository import (
+    GET_USER_BY_ID_STMT,
+    SQLAUserRepository,
+)
+from src.auth.infra.security import hash_password, verify_password
+from src.auth.infra.strategies.rs256 import RS256JWTStrategy
+from src.core.config import SERVER_SETTINGS as SETTINGS
+from src.core.config.log_formatters import JsonFormatter
+from src.core.utils import utcnow
+
+from .utils import (
+    BenchmarkResult,
+    compare_results,
+    measure,
+    print_results,
+    write_results,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+PASSWORD = "benchmark-password"
+
+
+def make_strategy(decode_cache_size: int) -> RS256JWTStrategy:
+    """Create the RS256 strategy from settings."""
+    return RS256JWTStrategy(
+        private_key_path=SETTINGS.AUTH.jwt_private_key_path,
+        public_key_path=SETTINGS.AUTH.jwt_public_key_path,
+        decode_cache_size=decode_cache_size,
+    )
+
+
+def make_user_orm() -> UserORM:
+    """Create a detached user ORM object with a profile."""
+    now = utcnow()
+    return UserORM(
+        id=1,
+        email="bench@example.com",
+        hashed_password=hash_password(PASSWORD),
+        is_active=True,
+        is_superuser=False,
+        is_verified=True,
+        profile=UserProfileORM(
+            id=1,
+            user_id=1,
+            first_name="Bench",
+            last_name="User",
+            created_at=now,
+            updated_at=now,
+        ),
+    )
+
+
+def build_get_user_by_id_stmt() -> object:
+    """Build the user lookup the way it was built per call before."""
+    return (
+        select(UserORM)
+        .options(joinedload(UserORM.profile))
+        .where(UserORM.id == 1)
+        ._generate_cache_key()
+    )
+
+
+def make_log_record() -> logging.LogRecord:
+    """Create a login log record as emitted during a request."""
+    record = logging.LogRecord(
+        name="src.auth.application.auth_manager",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="User login successful | user_id=%r, email=%r",
+        args=(1, "bench@example.com"),
+        exc_info=None,
+        func="login",
+    )
+    record.request_id = "0f4c2b6e9a8d4f1e8b7c6d5e4f3a2b1c"
+    record.user_id = 1
+    return record
+
+
+def run(iterations: int) -> list[BenchmarkResult]:
+    """Run all micro-benchmarks."""
+    hashed_password = hash_password(PASSWORD)
+    strategy = make_strategy(decode_cache_size=0)
+    cached_strategy = make_strategy(decode_cache_size=1_000)
+    access_token = strategy.create_access_token(user_id=1)
+    repository = SQLAUserRepository(session=cast("AsyncSession", None))
+    user_orm = make_user_orm()
+    user = repository._to_domain(user_orm=user_orm)
+    hash_iterations = max(1, iterations // 50)
+    log_record = make_log_record()
+    text_formatter = logging.Formatter(
+        fmt=SETTINGS.LOGGING.log_format,
+        datefmt=SETTINGS.LOGGING.log_date_format,
+    )
+    json_formatter = JsonFormatter()
+
+    return [
+        measure(
+            "verify_password",
+            lambda: verify_password(PASSWORD, hashed_password),
+            iterations=hash_iterations,
+            warmup=1,
+        ),
+        measure(
+            "rs256.create_access_token",
+            lambda: strategy.create_access_token(user_id=1),
+            iterations=iterations,
+        ),
+        measure(
+            "rs256.decode_token",
+            lambda: strategy.decode_token(access_token),
+            iterations=iterations,
+        ),
+        measure(
+            "rs256.decode_token[cached]",
+            lambda: cached_strategy.decode_token(access_token),
+            iterations=iterations,
+        ),
+        measure(
+            "user_repository._to_domain",
+            lambda: repository._to_domain(user_orm=user_orm),
+            iterations=iterations,
+        ),
+        measure(
+            "get_user_by_id_stmt[fresh]",
+            build_get_user_by_id_stmt,
+            iterations=iterations,
+        ),
+        measure(
+            "get_user_by_id_stmt[prebuilt]",
+            # Look the method up on every call, as Session.execute does:
+            # SQLAlchemy memoizes the cache key on the instance attribute.
+            lambda: GET_USER_BY_ID_STMT._generate_cache_key(),  # noqa: PLW0108
+            iterations=iterations,
+        ),
+        measure(
+            "UserRead.model_validate",
+            lambda: UserRead.model_validate(user),
+            iterations=iterations,
+        ),
+        measure(
+            "log_format[text]",
+            lambda: text_formatter.format(log_record),
+            iterations=iterations,
+        ),
+        measure(
+            "log_format[json]",
+            lambda: json_formatter.format(log_record),
+            iterations=iterations,
+        ),
+    ]
+
+
+def main() -> None:
+    """Run the micro-benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=1_000)
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--compare", help="Baseline JSON to compare with")
+    args = parser.parse_args()
+
+    results = run(iterations=args.iterations)
+    print_results(results)
+    if args.output:
+        write_results(args.output, suite="micro", results=results)
+    if args.compare and not compare_results(args.compare, results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+import json
+import logging
+import math
+import platform
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class BenchmarkResult:
+    """Aggregated timings of one benchmark case."""
+
+    name: str
+    iterations: int
+    errors: int
+    total_seconds: float
+    ops_per_second: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    @classmethod
+    def from_samples(
+        cls,
+        name: str,
+        samples: Sequence[float],
+        total_seconds: float,
+        errors: int = 0,
+    ) -> "BenchmarkResult":
+        """Build a result from per-call durations in seconds."""
+        ordered = sorted(samples)
+        return cls(
+            name=name,
+            iterations=len(ordered),
+            errors=errors,
+            total_seconds=total_seconds,
+            ops_per_second=(
+                len(ordered) / total_seconds if total_seconds else 0.0
+            ),
+            mean_ms=statistics.fmean(ordered) * 1e3 if ordered else 0.0,
+            p50_ms=percentile(ordered, 50) * 1e3,
+            p95_ms=percentile(ordered, 95) * 1e3,
+            p99_ms=percentile(ordered, 99) * 1e3,
+        )
+
+
+def percentile(ordered: Sequence[float], percent: float) -> float:
+    """Return the nearest-rank percentile of sorted samples."""
+    if not ordered:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(ordered)) - 1
+    return ordered[max(0, min(len(ordered) - 1, rank))]
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    iterations: int = 1_000,
+    warmup: int = 10,
+) -> BenchmarkResult:
+    """Time a synchronous callable."""
+    for _ in range(warmup):
+        func()
+
+    samples: list[float] = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - call_started)
+    return BenchmarkResult.from_samples(
+        name, samples, time.perf_counter() - started
+    )
+
+
+async def measure_async(
+    name: str,
+    func: Callable[[], Awaitable[object]],
+    iterations: int = 1_000,
+    warmup: int = 10,
+) -> BenchmarkResult:
+    """Time an asynchronous callable sequentially."""
+    for _ in range(warmup):
+        await func()
+
+    samples: list[float] = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - call_started)
+    return BenchmarkResult.from_samples(
+        name, samples, time.perf_counter() - started
+    )
+
+
+def print_results(results: Sequence[BenchmarkResult]) -> None:
+    """Print results as a table."""
+    header = (
+        f"{'case':<32} {'ops/s':>10} {'mean ms':>9} {'p50 ms':>9} "
+        f"{'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"
+    )
+    print(header)  # noqa: T201
+    print("-" * len(header))  # noqa: T201
+    for r in results:
+        print(  # noqa: T201
+            f"{r.name:<32} {r.ops_per_second:>10.1f} {r.mean_ms:>9.3f} "
+            f"{r.p50_ms:>9.3f} {r.p95_ms:>9.3f} {r.p99_ms:>9.3f} "
+            f"{r.errors:>7}"
+        )
+
+
+def write_results(
+    path: str, suite: str, results: Sequence[BenchmarkResult]
+) -> None:
+    """Write results and environment metadata as JSON."""
+    document: dict[str, Any] = {
+        "suite": suite,
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": [asdict(r) for r in results],
+    }
+    Path(path).write_text(json.dumps(document, indent=2), encoding="utf-8")
+    log.info("Benchmark results written | path=%r", path)
+
+
+def compare_results(
+    baseline_path: str,
+    results: Sequence[BenchmarkResult],
+    threshold: float = 0.10,
+) -> bool:
+    """Print p50 changes against a baseline file.
+
+    Args:
+        baseline_path: JSON file written by ``write_results``.
+        results: Current results.
+        threshold: Relative p50 slowdown reported as a regression.
+
+    Returns:
+        True if no case regressed by more than ``threshold``.
+    """
+    baseline = {
+        r["name"]: r
+        for r in json.loads(Path(baseline_path).read_text(encoding="utf-8"))[
+            "results"
+        ]
+    }
+    ok = True
+    for r in results:
+        before = baseline.get(r.name)
+        if before is None or not before["p50_ms"]:
+            continue
+        change = r.p50_ms / before["p50_ms"] - 1
+        regressed = change > threshold
+        ok = ok and not regressed
+        print(  # noqa: T201
+            f"{r.name:<32} p50 {before['p50_ms']:.3f} -> {r.p50_ms:.3f} ms "
+            f"({change:+.1%}){'  REGRESSION' if regressed else ''}"
+        )
+    return ok
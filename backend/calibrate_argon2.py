@@ -0,0 +1,57 @@
+"""Choose argon2 parameters for this host and print them as settings."""
+
+import argparse
+import logging
+import sys
+
+from src.auth.infra.security import calibrate_argon2
+from src.core.config import SERVER_SETTINGS as SETTINGS
+from src.core.config.logging import setup_logging
+
+setup_logging()
+
+log = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Benchmark argon2 from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=250.0,
+        help="target verification time in milliseconds",
+    )
+    parser.add_argument(
+        "--memory-mib",
+        type=int,
+        default=256,
+        help="memory available to concurrent hashes per worker, in MiB",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=SETTINGS.AUTH.password_hash_max_workers,
+        help="hashes running at once, defaults to the hashing pool size",
+    )
+    parser.add_argument(
+        "--parallelism", type=int, default=1, help="lanes per hash"
+    )
+    args = parser.parse_args()
+
+    parameters = calibrate_argon2(
+        target_seconds=args.target_ms / 1000,
+        memory_budget_kib=args.memory_mib * 1024,
+        concurrency=args.concurrency,
+        parallelism=args.parallelism,
+    )
+    log.info("Argon2 parameters chosen | parameters=%r", parameters)
+    sys.stdout.write(
+        f"BACKEND__AUTH__ARGON2_TIME_COST={parameters.time_cost}\n"
+        f"BACKEND__AUTH__ARGON2_MEMORY_COST={parameters.memory_cost}\n"
+        f"BACKEND__AUTH__ARGON2_PARALLELISM={parameters.parallelism}\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Delete expired revoked and consumed token ids."""
+
+import argparse
+import asyncio
+import logging
+
+from src.auth.infra.repositories.revocation_store import SQLARevocationStore
+from src.core.config.logging import setup_logging
+from src.core.database.db_manager import DB_MANAGER
+
+setup_logging()
+
+log = logging.getLogger(__name__)
+
+
+async def cleanup(batch_size: int) -> int:
+    """Delete expired ids in batches, one transaction per batch.
+
+    Short transactions keep row locks brief, so cleanup can run while the
+    application revokes and consumes tokens.
+    """
+    deleted = 0
+    try:
+        while True:
+            async with DB_MANAGER.async_session_maker() as session:
+                count = await SQLARevocationStore(session).delete_expired(
+                    batch_size
+                )
+                await session.commit()
+            deleted += count
+            if count < batch_size:
+                return deleted
+    finally:
+        await DB_MANAGER.dispose_engine()
+
+
+def main() -> None:
+    """Delete expired token ids from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    args = parser.parse_args()
+
+    deleted = asyncio.run(cleanup(args.batch_size))
+    log.info("Expired token ids deleted | count=%r", deleted)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Bulk import users and profiles from a CSV or JSON Lines file."""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+from src.auth.application.user_import import (
+    ImportCheckpoint,
+    ImportReport,
+    UserImportService,
+)
+from src.auth.infra.unitofwork import UserImportUnitOfWork
+from src.core.config.logging import setup_logging
+from src.core.database.db_manager import DB_MANAGER
+
+setup_logging()
+
+log = logging.getLogger(__name__)
+
+
+async def import_users(args: argparse.Namespace) -> ImportReport:
+    """Run the import described by the command line arguments."""
+    service = UserImportService(
+        uow_factory=lambda: UserImportUnitOfWork(
+            DB_MANAGER.async_session_maker(), method=args.method
+        ),
+        chunk_size=args.chunk_size,
+        hash_workers=args.workers,
+    )
+    checkpoint = (
+        None
+        if args.no_checkpoint
+        else ImportCheckpoint(
+            path=args.checkpoint
+            or args.path.with_name(f"{args.path.name}.checkpoint"),
+            source=args.path,
+        )
+    )
+    try:
+        return await service.import_file(
+            args.path, file_format=args.format, checkpoint=checkpoint
+        )
+    finally:
+        await DB_MANAGER.dispose_engine()
+
+
+def main() -> None:
+    """Import users from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", type=Path, help="CSV or JSON Lines file")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None)
+    parser.add_argument("--chunk-size", type=int, default=1_000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="password hashing processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--method", choices=["copy", "executemany"], default="copy"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="checkpoint file (default: <path>.checkpoint)",
+    )
+    parser.add_argument("--no-checkpoint", action="store_true")
+    args = parser.parse_args()
+
+    report = asyncio.run(import_users(args))
+
+    for rejected in report.rejected:
+        log.warning(
+            "Rejected record | line=%r, reason=%s",
+            rejected.line,
+            rejected.reason,
+        )
+    for failure in report.failed_chunks:
+        log.error(
+            "Failed chunk | lines=%r-%r, error=%s",
+            failure.first_line,
+            failure.last_line,
+            failure.error,
+        )
+    log.info(
+        "Import finished | read=%r, imported=%r, existing=%r, "
+        "duplicates=%r, rejected=%r, failed_chunks=%r",
+        report.read,
+        report.imported,
+        report.existing,
+        report.duplicates,
+        len(report.rejected),
+        len(report.failed_chunks),
+    )
+    if report.failed_chunks:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
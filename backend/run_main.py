@@ -1,6 +1,7 @@
 from src.core.config import SERVER_SETTINGS as SETTINGS
 from src.core.gunicorn import GunicornApplication
 from src.core.gunicorn.application import get_gunicorn_options
+from src.core.metrics.multiprocess import MULTIPROCESS_COLLECTOR
 from src.main import app as main_app
 
 
@@ -17,4 +18,7 @@ def main() -> None:
         error_log=SETTINGS.GUNICORN.error_log,
     )
 
+    if MULTIPROCESS_COLLECTOR is not None:
+        # Counters of exited workers are kept until the next server start.
+        MULTIPROCESS_COLLECTOR.clear()
     GunicornApplication(app=main_app, options=options).run()
@@ -1,12 +1,14 @@
 import logging
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Request, Response
 
 from src.auth.api.docs import AuthDocsResponses
 
 from ..dependencies import (
+    AccessTokenDep,
     AuthManagerDep,
     CurrentUserDep,
+    CurrentUserFreshDep,
     FormDataDeps,
     RefreshTokenDep,
 )
@@ -22,12 +24,17 @@ router = APIRouter()
     responses=AuthDocsResponses.get_openapi_login_responses_success(),
 )
 async def login(
+    request: Request,
     form_data: FormDataDeps,
     auth_manager: AuthManagerDep,
 ) -> Response:
     """Login user."""
     log.info("Login attempt | email=%r", form_data.username)
-    return await auth_manager.login(form_data.username, form_data.password)
+    return await auth_manager.login(
+        form_data.username,
+        form_data.password,
+        client_ip=request.client.host if request.client else None,
+    )
 
 
 @router.post(
@@ -38,10 +45,16 @@ async def logout(
     auth_manager: AuthManagerDep,
     current_user: CurrentUserDep,
     response: Response,
+    refresh_token: RefreshTokenDep,
+    access_token: AccessTokenDep,
 ) -> SuccessResponse:
     """Logout user."""
     log.info("Logout requested, user_id=%r", current_user.id)
-    await auth_manager.logout(response=response)
+    await auth_manager.logout(
+        response=response,
+        refresh_token=refresh_token,
+        access_token=access_token,
+    )
     return SuccessResponse(message="Logged out")
 
 
@@ -57,7 +70,7 @@ async def register(
 
 @router.get("/user/me")
 async def user_me(
-    current_user: CurrentUserDep,
+    current_user: CurrentUserFreshDep,
 ) -> UserRead:
     """Get current user."""
     log.debug("User profile requested | user_id=%r", current_user.id)
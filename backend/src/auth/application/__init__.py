@@ -1,5 +1,18 @@
-__all__ = ["AuthManager", "AuthenticationBackend", "UserService"]
+__all__ = [
+    "AuthManager",
+    "AuthenticationBackend",
+    "LoginThrottle",
+    "PasswordVerifier",
+    "PermissionResolver",
+    "RevocationFilter",
+    "TokenRevocationService",
+    "UserService",
+]
 
 from .auth_backend import AuthenticationBackend
 from .auth_manager import AuthManager
+from .login_throttle import LoginThrottle
+from .password_verifier import PasswordVerifier
+from .permission_resolver import PermissionResolver
+from .token_revocation import RevocationFilter, TokenRevocationService
 from .user_service import UserService
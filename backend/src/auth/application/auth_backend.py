@@ -1,12 +1,19 @@
 import logging
+from datetime import timedelta
 
 from fastapi import Response
 
 from src.auth.domain.entities.user import User
 from src.auth.exceptions import InvalidTokenError
-from src.auth.infra.strategies.base import BaseJWTStrategy, TokenPayload
+from src.auth.infra.strategies.base import (
+    BaseJWTStrategy,
+    PermissionClaims,
+    TokenPayload,
+    UserClaims,
+)
 from src.auth.infra.transports.bearer import BearerTransport
 from src.auth.infra.transports.cookie import CookieTransport
+from src.core.timing import phase
 
 log = logging.getLogger(__name__)
 
@@ -22,6 +29,7 @@ class AuthenticationBackend:
         jwt_strategy: BaseJWTStrategy,
         bearer_transport: BearerTransport,
         cookie_transport: CookieTransport,
+        embed_user_claims: bool = False,
     ) -> None:
         """Initialize the authentication backend.
 
@@ -30,17 +38,52 @@ class AuthenticationBackend:
             jwt_strategy: Strategy for encoding/decoding JWT tokens.
             bearer_transport: Handles bearer token responses.
             cookie_transport: Manages refresh tokens in cookies.
+            embed_user_claims: Embed a user snapshot in access tokens
+                (claims mode).
         """
         self.name = name
         self._jwt_strategy = jwt_strategy
         self._bearer_transport = bearer_transport
         self._cookie_transport = cookie_transport
+        self._embed_user_claims = embed_user_claims
+
+    @property
+    def refresh_token_lifetime(self) -> timedelta:
+        """Return the lifetime of refresh tokens."""
+        return self._jwt_strategy.refresh_token_lifetime
+
+    @staticmethod
+    def _make_user_claims(user: User) -> UserClaims:
+        """Build the access token user snapshot for claims mode."""
+        profile_updated_at = (
+            user.profile.updated_at if user.profile is not None else None
+        )
+        return UserClaims(
+            email=user.email,
+            is_active=bool(user.is_active),
+            is_superuser=bool(user.is_superuser),
+            is_verified=bool(user.is_verified),
+            profile_version=(
+                int(profile_updated_at.timestamp())
+                if profile_updated_at is not None
+                else None
+            ),
+        )
 
-    async def make_authentication_response(self, user: User) -> Response:
+    async def make_authentication_response(
+        self,
+        user: User,
+        permission_claims: PermissionClaims | None = None,
+        refresh_family_id: str | None = None,
+    ) -> Response:
         """Generate a full authentication response with access and refresh tokens.
 
         Args:
             user: Authenticated user.
+            permission_claims: Effective permissions to embed in the
+                access token.
+            refresh_family_id: Family of the rotated refresh token; a new
+                family is started when omitted.
 
         Returns:
             HTTP response containing access token (in body) and refresh token (in cookie).
@@ -51,22 +94,28 @@ class AuthenticationBackend:
         if user.id is None:
             raise ValueError("User ID is None")
 
-        access_token: str = self._jwt_strategy.create_access_token(
-            user_id=user.id,
-            scopes=[],
-        )
-        refresh_token: str = self._jwt_strategy.create_refresh_token(
-            user_id=user.id
-        )
-
-        bearer_response = self._bearer_transport.make_login_response(
-            access_token
-        )
+        with phase("auth.tokens"):
+            access_token: str = self._jwt_strategy.create_access_token(
+                user_id=user.id,
+                user_claims=(
+                    self._make_user_claims(user)
+                    if self._embed_user_claims
+                    else None
+                ),
+                permission_claims=permission_claims,
+            )
+            refresh_token: str = self._jwt_strategy.create_refresh_token(
+                user_id=user.id, family_id=refresh_family_id
+            )
 
-        self._cookie_transport.set_token_in_response(
-            response=bearer_response,
-            token=refresh_token,
-        )
+        with phase("auth.response"):
+            bearer_response = self._bearer_transport.make_login_response(
+                access_token
+            )
+            self._cookie_transport.set_token_in_response(
+                response=bearer_response,
+                token=refresh_token,
+            )
 
         log.info(
             "Authentication response created | user_id=%r, backend=%r",
@@ -120,6 +169,32 @@ class AuthenticationBackend:
         )
         return payload
 
+    def decode_access_token(self, token: str | None) -> TokenPayload:
+        """Validate and decode an access token.
+
+        Args:
+            token: Access token string or None.
+
+        Returns:
+            Decoded token payload.
+
+        Raises:
+            InvalidTokenError: If token is missing, invalid, or not an access token.
+        """  # noqa: E501
+        if not token:
+            log.debug("Access token missing")
+            raise InvalidTokenError("Not authenticated")
+
+        payload: TokenPayload = self._jwt_strategy.decode_token(token=token)
+        if payload.token_type != "access":
+            log.warning(
+                "Invalid token type provided | token_type=%r",
+                payload.token_type,
+            )
+            raise InvalidTokenError("Not an access token")
+
+        return payload
+
     def __repr__(self) -> str:
         """Return a string representation of the object."""
         return f"<AuthenticationBackend name={self.name}>"
@@ -1,18 +1,22 @@
 import logging
-from typing import TYPE_CHECKING
 
 from fastapi import Response
 
 from src.auth.api.schemas import UserRegister
 from src.auth.application.user_service import UserService
+from src.auth.domain.entities.permission_set import PermissionSet
 from src.auth.domain.entities.user import User
+from src.auth.domain.interfaces import IPermissionRepository
 from src.auth.exceptions import InvalidTokenError
+from src.auth.infra.strategies.base import PermissionClaims, TokenPayload
+from src.auth.metrics import AUTH_METRICS
+from src.core.request_context import set_user_id
+from src.core.timing import phase
 
 from .auth_backend import AuthenticationBackend
-
-if TYPE_CHECKING:
-    from src.auth.infra.strategies.base import TokenPayload
-
+from .login_throttle import LoginThrottle
+from .permission_resolver import PermissionResolver
+from .token_revocation import TokenRevocationService
 
 log = logging.getLogger(__name__)
 
@@ -24,47 +28,152 @@ class AuthManager:
         self,
         authentication_backend: AuthenticationBackend,
         user_service: UserService,
+        permission_resolver: PermissionResolver | None = None,
+        permission_repository: IPermissionRepository | None = None,
+        token_revocation: TokenRevocationService | None = None,
+        login_throttle: LoginThrottle | None = None,
     ) -> None:
         """Initialize with required dependencies.
 
         Args:
             authentication_backend: Handles token and session responses.
             user_service: Manages user business logic.
+            permission_resolver: Resolves the permissions embedded in
+                access tokens; permissions are not embedded without it.
+            permission_repository: Repository used by the resolver.
+            token_revocation: Rotates refresh tokens and checks tokens
+                against the denylist; tokens stay valid until they expire
+                without it.
+            login_throttle: Limits login attempts; logins are not
+                throttled without it.
         """
         self._auth_backend = authentication_backend
         self._user_service = user_service
+        self._permission_resolver = permission_resolver
+        self._permission_repository = permission_repository
+        self._token_revocation = token_revocation
+        self._login_throttle = login_throttle
 
-    async def login(self, email: str, password: str) -> Response:
+    async def _permission_claims(self, user: User) -> PermissionClaims | None:
+        """Build the access token permissions of a user."""
+        resolver = self._permission_resolver
+        repository = self._permission_repository
+        if resolver is None or repository is None or user.id is None:
+            return None
+        with phase("auth.permissions"):
+            catalog = await resolver.get_catalog(repository)
+            permissions = (
+                PermissionSet.all()
+                if user.is_superuser
+                else await resolver.get_permissions(
+                    user.id, catalog, repository
+                )
+            )
+        return PermissionClaims.from_permission_set(
+            permissions, version=catalog.version
+        )
+
+    async def login(
+        self, email: str, password: str, client_ip: str | None = None
+    ) -> Response:
         """Authenticate user and return authentication response.
 
+        Throttled attempts are rejected before the password is verified.
+
         Args:
             email: User email.
             password: User password.
+            client_ip: Address of the client, if known.
 
         Returns:
             HTTP response containing tokens or cookies.
+
+        Raises:
+            TooManyLoginAttemptsError: If login attempts are throttled.
         """
-        try:
-            user: User = await self._user_service.authenticate(email, password)
-            log.info(
-                "User login successful | user_id=%r, email=%r", user.id, email
-            )
-            return await self._auth_backend.make_authentication_response(
-                user=user
-            )
-        except Exception:
-            log.warning("User login failed | email=%r", email)
-            raise
+        with AUTH_METRICS.track("login"):
+            try:
+                if self._login_throttle is not None:
+                    await self._login_throttle.check(email, client_ip)
+                user: User = await self._user_service.authenticate(
+                    email, password
+                )
+                set_user_id(user.id)
+                log.info(
+                    "User login successful | user_id=%r, email=%r",
+                    user.id,
+                    email,
+                )
+                return await self._auth_backend.make_authentication_response(
+                    user=user,
+                    permission_claims=await self._permission_claims(user),
+                )
+            except Exception:
+                log.warning("User login failed | email=%r", email)
+                raise
 
-    async def logout(self, response: Response) -> None:
+    async def logout(
+        self,
+        response: Response,
+        refresh_token: str | None = None,
+        access_token: str | None = None,
+    ) -> None:
         """Clear user session (e.g., delete refresh token).
 
+        The family of the refresh token is revoked, so neither the token
+        nor tokens rotated from it can be used again. The access token is
+        revoked until it expires.
+
         Args:
             response: Response object to modify with logout instructions.
+            refresh_token: Refresh token of the session, if any.
+            access_token: Access token of the session, if any.
         """
         log.info("User logout initiated")
+        revocation = self._token_revocation
+        if revocation is not None and refresh_token:
+            try:
+                payload = await self._auth_backend.decode_refresh_token(
+                    token=refresh_token
+                )
+            except InvalidTokenError:
+                log.debug("Logout with an invalid refresh token")
+            else:
+                if payload.family_id is not None:
+                    await revocation.revoke_family(payload.family_id)
+        if revocation is not None and access_token:
+            try:
+                payload = self._auth_backend.decode_access_token(
+                    token=access_token
+                )
+            except InvalidTokenError:
+                log.debug("Logout with an invalid access token")
+            else:
+                await revocation.revoke_token(payload)
         await self._auth_backend.make_logout_response(response=response)
 
+    async def revoke_user_tokens(self, user_id: int) -> None:
+        """Revoke every token issued to a user so far.
+
+        Meant for deactivation and password changes: access tokens in
+        claims mode are otherwise accepted until they expire.
+
+        Args:
+            user_id: Id of the user.
+        """
+        if self._token_revocation is None:
+            log.warning(
+                "Token revocation disabled, tokens not revoked | user_id=%r",
+                user_id,
+            )
+            return
+        await self._token_revocation.revoke_user_tokens(user_id)
+        log.info("User tokens revoked | user_id=%r", user_id)
+
+    async def _check_access_token(self, payload: TokenPayload) -> None:
+        if self._token_revocation is not None:
+            await self._token_revocation.check_access_token(payload)
+
     async def refresh_token(self, refresh_token: str | None) -> Response:
         """Issue new authentication tokens using a refresh token.
 
@@ -74,22 +183,27 @@ class AuthManager:
         Returns:
             HTTP response with new access (and optionally refresh) token(s).
         """
-        try:
-            payload: TokenPayload = (
-                await self._auth_backend.decode_refresh_token(
-                    token=refresh_token
+        with AUTH_METRICS.track("refresh_token"):
+            try:
+                payload: TokenPayload = (
+                    await self._auth_backend.decode_refresh_token(
+                        token=refresh_token
+                    )
                 )
-            )
-            user: User = await self._user_service.get_active_user_by_id(
-                user_id=payload.user_id
-            )
-            log.info("Token refresh successful | user_id=%r", user.id)
-            return await self._auth_backend.make_authentication_response(
-                user=user
-            )
-        except Exception:
-            log.warning("Token refresh failed")
-            raise
+                if self._token_revocation is not None:
+                    await self._token_revocation.rotate(payload)
+                user: User = await self._user_service.get_active_user_by_id(
+                    user_id=payload.user_id
+                )
+                log.info("Token refresh successful | user_id=%r", user.id)
+                return await self._auth_backend.make_authentication_response(
+                    user=user,
+                    permission_claims=await self._permission_claims(user),
+                    refresh_family_id=payload.family_id,
+                )
+            except Exception:
+                log.warning("Token refresh failed")
+                raise
 
     async def current_user(self, token: str | None) -> User:
         """Retrieve active user from access token.
@@ -103,29 +217,65 @@ class AuthManager:
         Raises:
             InvalidTokenError: If token is missing, invalid, or not an access token.
         """  # noqa: E501
-        if not token:
-            log.debug("Access token missing")
-            raise InvalidTokenError("Not authenticated")
-
-        try:
-            payload: TokenPayload = (
-                self._auth_backend._jwt_strategy.decode_token(token=token)
-            )
-            if payload.token_type != "access":
-                log.warning(
-                    "Invalid token type provided | token_type=%r",
-                    payload.token_type,
+        with AUTH_METRICS.track("current_user"):
+            try:
+                payload: TokenPayload = self._auth_backend.decode_access_token(
+                    token=token
+                )
+                await self._check_access_token(payload)
+                user: User = await self._user_service.get_active_user_by_id(
+                    payload.user_id
                 )
-                raise InvalidTokenError("Not an access token")
+                log.debug("Current user resolved | user_id=%r", user.id)
+                return user
+            except Exception:
+                log.warning("Failed to resolve current user from token")
+                raise
 
-            user: User = await self._user_service.get_active_user_by_id(
-                payload.user_id
-            )
-            log.debug("Current user resolved | user_id=%r", user.id)
-            return user
-        except Exception:
-            log.warning("Failed to resolve current user from token")
-            raise
+    async def current_principal(self, token: str | None) -> User:
+        """Retrieve the user snapshot embedded in an access token.
+
+        Tokens issued in claims mode carry the user's email and flags, so
+        the user is rebuilt without a database round-trip. The snapshot is
+        as fresh as the token; tokens without claims fall back to
+        ``current_user``.
+
+        Args:
+            token: JWT access token or None.
+
+        Returns:
+            Authenticated and active user, without profile.
+
+        Raises:
+            InvalidTokenError: If token is missing, invalid, or not an access token.
+        """  # noqa: E501
+        with AUTH_METRICS.track("current_principal"):
+            try:
+                payload: TokenPayload = self._auth_backend.decode_access_token(
+                    token=token
+                )
+                await self._check_access_token(payload)
+                if payload.user is None:
+                    user: User = (
+                        await self._user_service.get_active_user_by_id(
+                            payload.user_id
+                        )
+                    )
+                else:
+                    if not payload.user.is_active:
+                        raise InvalidTokenError("User inactive or not found")
+                    user = User(
+                        id=payload.user_id,
+                        email=payload.user.email,
+                        is_active=payload.user.is_active,
+                        is_superuser=payload.user.is_superuser,
+                        is_verified=payload.user.is_verified,
+                    )
+                log.debug("Current principal resolved | user_id=%r", user.id)
+                return user
+            except Exception:
+                log.warning("Failed to resolve current principal from token")
+                raise
 
     async def register(self, user_register: UserRegister) -> Response:
         """Register a new user and return authentication response.
@@ -136,20 +286,22 @@ class AuthManager:
         Returns:
             HTTP response with initial authentication tokens or cookies.
         """
-        try:
-            user: User = await self._user_service.registration(
-                user_register=user_register
-            )
-            log.info(
-                "User registration successful | user_id=%r, email=%r",
-                user.id,
-                user.email,
-            )
-            return await self._auth_backend.make_authentication_response(
-                user=user
-            )
-        except Exception:
-            log.error(
-                "User registration failed | email=%r", user_register.email
-            )
-            raise
+        with AUTH_METRICS.track("register"):
+            try:
+                user: User = await self._user_service.registration(
+                    user_register=user_register
+                )
+                log.info(
+                    "User registration successful | user_id=%r, email=%r",
+                    user.id,
+                    user.email,
+                )
+                return await self._auth_backend.make_authentication_response(
+                    user=user,
+                    permission_claims=await self._permission_claims(user),
+                )
+            except Exception:
+                log.error(
+                    "User registration failed | email=%r", user_register.email
+                )
+                raise
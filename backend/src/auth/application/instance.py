@@ -2,9 +2,15 @@ from src.auth.infra.strategies.base import BaseJWTStrategy
 from src.auth.infra.strategies.rs256 import RS256JWTStrategy
 from src.auth.infra.transports.bearer import BearerTransport
 from src.auth.infra.transports.cookie import CookieTransport
+from src.core.cache import InMemoryCache, ReadThroughCache
 from src.core.config import SERVER_SETTINGS as SETTINGS
+from src.core.rate_limit import InMemoryRateLimiter
 
 from .auth_backend import AuthenticationBackend
+from .login_throttle import LoginThrottle
+from .password_verifier import PasswordVerifier
+from .permission_resolver import PermissionResolver
+from .token_revocation import RevocationFilter
 
 access_token_transport = BearerTransport()
 
@@ -26,6 +32,9 @@ def get_jwt_strategy() -> BaseJWTStrategy:
         public_key_path=SETTINGS.AUTH.jwt_public_key_path,
         access_token_expire_minutes=SETTINGS.AUTH.jwt_access_token_expire_minutes,
         refresh_token_expire_days=SETTINGS.AUTH.jwt_refresh_token_expire_days,
+        decode_cache_size=SETTINGS.AUTH.jwt_decode_cache_size,
+        key_id=SETTINGS.AUTH.jwt_key_id,
+        previous_public_keys=SETTINGS.AUTH.jwt_previous_public_keys,
     )
 
 
@@ -34,4 +43,47 @@ authentication_backend = AuthenticationBackend(
     jwt_strategy=get_jwt_strategy(),
     bearer_transport=access_token_transport,
     cookie_transport=refresh_token_transport,
+    embed_user_claims=SETTINGS.AUTH.jwt_claims_mode,
+)
+
+permission_resolver = PermissionResolver(
+    cache=ReadThroughCache(
+        local=InMemoryCache(max_size=SETTINGS.AUTH.permission_cache_max_size),
+        ttl=SETTINGS.AUTH.permission_cache_ttl_seconds,
+    ),
+    ttl=SETTINGS.AUTH.permission_cache_ttl_seconds,
+)
+permission_resolver.listen()
+
+revocation_filter = RevocationFilter(
+    capacity=SETTINGS.AUTH.revocation_filter_capacity,
+    error_rate=SETTINGS.AUTH.revocation_filter_error_rate,
+    sync_interval=SETTINGS.AUTH.revocation_sync_interval_seconds,
+    rebuild_interval=SETTINGS.AUTH.revocation_rebuild_interval_seconds,
+)
+
+login_throttle = (
+    LoginThrottle(
+        by_email=InMemoryRateLimiter(
+            limit=SETTINGS.AUTH.login_rate_limit_per_email,
+            window=SETTINGS.AUTH.login_rate_limit_window_seconds,
+            max_keys=SETTINGS.AUTH.login_rate_limit_max_keys,
+        ),
+        by_ip=InMemoryRateLimiter(
+            limit=SETTINGS.AUTH.login_rate_limit_per_ip,
+            window=SETTINGS.AUTH.login_rate_limit_window_seconds,
+            max_keys=SETTINGS.AUTH.login_rate_limit_max_keys,
+        ),
+    )
+    if SETTINGS.AUTH.login_rate_limit_enabled
+    else None
+)
+
+password_verifier = PasswordVerifier(
+    strategy=SETTINGS.AUTH.unknown_user_strategy,
+    unknown_emails=InMemoryRateLimiter(
+        limit=SETTINGS.AUTH.unknown_user_verify_limit,
+        window=SETTINGS.AUTH.unknown_user_window_seconds,
+        max_keys=SETTINGS.AUTH.unknown_user_max_keys,
+    ),
 )
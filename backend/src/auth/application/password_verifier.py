@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import secrets
+import time
+from typing import Literal
+
+from src.auth.infra.security import hash_password_async, verify_password_async
+from src.core.rate_limit import RateLimiter
+
+log = logging.getLogger(__name__)
+
+type UnknownUserStrategy = Literal["dummy_hash", "delay", "none"]
+
+
+class PasswordVerifier:
+    """Verifies passwords and spends the same time on unknown users.
+
+    Answering at once when no active user has an email tells an attacker
+    which emails are registered. Depending on ``strategy``, a failed
+    lookup:
+
+    - ``"dummy_hash"``: verifies the password against a dummy hash in the
+      hashing pool, like for a real user. An email seen as unknown more
+      than ``unknown_emails.limit`` times within its window waits for the
+      average verification time instead, so repeating unknown emails
+      costs no CPU.
+    - ``"delay"``: waits for the average verification time.
+    - ``"none"``: returns at once.
+
+    The average is an exponentially weighted moving average of the
+    verifications of this worker, pool queueing included. Until the first
+    verification it is unknown, and a dummy hash is verified instead.
+
+    Call :meth:`prepare` at startup: hashing the dummy password on the
+    first unknown email would make that answer slower than any other.
+    """
+
+    def __init__(
+        self,
+        strategy: UnknownUserStrategy = "dummy_hash",
+        unknown_emails: RateLimiter | None = None,
+        smoothing: float = 0.2,
+    ) -> None:
+        """Initialize the verifier.
+
+        Args:
+            strategy: What a failed lookup does, see above.
+            unknown_emails: Limits dummy verifications per unknown email;
+                unlimited without it.
+            smoothing: Weight of the newest duration in the average.
+        """
+        self.strategy = strategy
+        self._unknown_emails = unknown_emails
+        self._smoothing = smoothing
+        self._latency: float | None = None
+        self._dummy_hash: str | None = None
+
+    @property
+    def latency(self) -> float | None:
+        """Return the average verification time in seconds, if known."""
+        return self._latency
+
+    def observe(self, elapsed: float) -> None:
+        """Add the duration of a verification to the average."""
+        if self._latency is None:
+            self._latency = elapsed
+        else:
+            self._latency += self._smoothing * (elapsed - self._latency)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the hashing pool and time it.
+
+        Raises:
+            PasswordHashingUnavailableError: If the hashing pool is
+                saturated.
+        """
+        start = time.perf_counter()
+        verified = await verify_password_async(plain_password, hashed_password)
+        self.observe(time.perf_counter() - start)
+        return verified
+
+    async def prepare(self) -> None:
+        """Hash the dummy password and time one verification of it.
+
+        The dummy hash uses the current parameters, so verifying it costs
+        as much as verifying a user's password, and the timed verification
+        seeds the average. Does nothing when already prepared or when
+        unknown users are not slowed down.
+
+        Raises:
+            PasswordHashingUnavailableError: If the hashing pool is
+                saturated.
+        """
+        if self.strategy == "none" or self._dummy_hash is not None:
+            return
+        password = secrets.token_urlsafe(16)
+        self._dummy_hash = await hash_password_async(password)
+        await self.verify(password, self._dummy_hash)
+
+    async def verify_unknown(self, email: str, plain_password: str) -> None:
+        """Spend the time of a verification on an unknown email.
+
+        Args:
+            email: Email no active user has.
+            plain_password: Password of the attempt.
+
+        Raises:
+            PasswordHashingUnavailableError: If the hashing pool is
+                saturated.
+        """
+        if self.strategy == "none":
+            return
+        delay = self.strategy == "delay" or (
+            self._unknown_emails is not None
+            and await self._unknown_emails.acquire(email.strip().lower()) > 0
+        )
+        latency = self._latency
+        if delay and latency is not None:
+            log.debug("Unknown user delayed | email=%r", email)
+            await asyncio.sleep(latency)
+            return
+        if self._dummy_hash is None:
+            # Not prepared at startup: preparing verifies the dummy once.
+            await self.prepare()
+            return
+        await self.verify(plain_password, self._dummy_hash)
+
+
+__all__ = ["PasswordVerifier", "UnknownUserStrategy"]
@@ -0,0 +1,246 @@
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Final
+
+from sqlalchemy import event
+from sqlalchemy.orm import (
+    ORMExecuteState,
+    Session,
+    SessionTransaction,
+    UOWTransaction,
+)
+
+from src.auth.domain.entities.permission_set import (
+    PermissionCatalog,
+    PermissionSet,
+)
+from src.auth.domain.interfaces import IPermissionRepository
+from src.auth.infra.models.association_role_permissions import (
+    association_role_permissions,
+)
+from src.auth.infra.models.auth_permission import AuthPermissionORM
+from src.auth.infra.models.auth_role import AuthRoleORM
+from src.auth.infra.models.user_role_assignment import UserRoleAssignmentORM
+from src.core.cache import ReadThroughCache
+
+log = logging.getLogger(__name__)
+
+CHANGED_USERS_KEY: Final = "rbac_changed_users"
+CHANGED_ALL_KEY: Final = "rbac_changed_all"
+
+# Catalogs kept by version for tokens issued against older catalogs.
+MAX_CATALOG_VERSIONS: Final = 8
+
+RBAC_TABLES: Final[frozenset[str]] = frozenset({
+    AuthPermissionORM.__tablename__,
+    AuthRoleORM.__tablename__,
+    UserRoleAssignmentORM.__tablename__,
+    association_role_permissions.name,
+})
+
+
+class PermissionResolver:
+    """Resolves and caches the effective permissions of users.
+
+    A user's permissions are loaded with one query over their role
+    assignments and cached as a ``PermissionSet`` bitset, so checks do not
+    touch the database. The bits are relative to a catalog, whose version
+    is part of the cache key. Keys also carry a global and a per-user
+    version:
+    invalidation only bumps a version, so it is synchronous and values
+    loaded concurrently with it are stored under keys nobody reads again.
+
+    Invalidation is driven by session events (see ``listen``) and is
+    local to the process; other workers pick changes up within ``ttl``.
+    """
+
+    def __init__(
+        self,
+        cache: ReadThroughCache[PermissionSet],
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the resolver.
+
+        Args:
+            cache: Cache of the users' permission sets.
+            ttl: Lifetime of the cached permission catalog in seconds.
+            clock: Function returning the current time in seconds.
+        """
+        self._cache = cache
+        self._ttl = ttl
+        self._clock = clock
+        self._version = 0
+        self._user_versions: dict[int, int] = {}
+        self._catalog: tuple[int, float, PermissionCatalog] | None = None
+        self._catalogs: OrderedDict[str, PermissionCatalog] = OrderedDict()
+
+    def _key(self, user_id: int, catalog: PermissionCatalog) -> str:
+        user_version = self._user_versions.get(user_id, 0)
+        return (
+            f"permissions:{catalog.version}:{self._version}:{user_version}"
+            f":{user_id}"
+        )
+
+    async def get_catalog(
+        self,
+        repository: IPermissionRepository,
+        version: str | None = None,
+    ) -> PermissionCatalog:
+        """Return the active permissions, loading them when stale.
+
+        Args:
+            repository: Repository used when the catalog is stale.
+            version: Catalog version a token was issued against. A version
+                identifies immutable content, so known versions are served
+                from memory; unknown ones fall back to the current catalog.
+        """
+        if version is not None:
+            known = self._catalogs.get(version)
+            if known is not None:
+                return known
+
+        if self._catalog is not None:
+            cache_version, expires_at, catalog = self._catalog
+            if cache_version == self._version and expires_at > self._clock():
+                return catalog
+
+        cache_version = self._version
+        catalog = PermissionCatalog.create(await repository.get_catalog())
+        if cache_version == self._version:
+            self._catalog = (cache_version, self._clock() + self._ttl, catalog)
+        self._catalogs[catalog.version] = catalog
+        self._catalogs.move_to_end(catalog.version)
+        if len(self._catalogs) > MAX_CATALOG_VERSIONS:
+            self._catalogs.popitem(last=False)
+        return catalog
+
+    async def get_permissions(
+        self,
+        user_id: int,
+        catalog: PermissionCatalog,
+        repository: IPermissionRepository,
+    ) -> PermissionSet:
+        """Return the effective permissions of a user.
+
+        Args:
+            user_id: User id.
+            catalog: Catalog the bits of the set refer to.
+            repository: Repository used on cache misses.
+        """
+
+        async def load() -> PermissionSet:
+            permissions = catalog.permission_set(
+                await repository.get_user_permission_ids(user_id)
+            )
+            log.debug("User permissions loaded | user_id=%r", user_id)
+            return permissions
+
+        permissions = await self._cache.get_or_load(
+            self._key(user_id, catalog), load
+        )
+        return PermissionSet() if permissions is None else permissions
+
+    async def has_permissions(
+        self,
+        user_id: int,
+        names: Iterable[str],
+        repository: IPermissionRepository,
+    ) -> bool:
+        """Return whether a user holds all the named permissions.
+
+        Unknown or inactive permission names are never granted.
+
+        Args:
+            user_id: User id.
+            names: Permission names.
+            repository: Repository used on cache misses.
+        """
+        catalog = await self.get_catalog(repository)
+        required = catalog.mask(names)
+        if required is None:
+            return False
+        permissions = await self.get_permissions(user_id, catalog, repository)
+        return permissions.has_all(required)
+
+    def invalidate_user(self, *user_ids: int) -> None:
+        """Drop the cached permissions of the given users."""
+        for user_id in user_ids:
+            self._user_versions[user_id] = (
+                self._user_versions.get(user_id, 0) + 1
+            )
+        log.debug("User permissions invalidated | user_ids=%r", user_ids)
+
+    def invalidate_all(self) -> None:
+        """Drop the catalog and the cached permissions of all users."""
+        self._version += 1
+        self._user_versions.clear()
+        self._catalog = None
+        log.debug("All permissions invalidated | version=%r", self._version)
+
+    def listen(self, session_class: type[Session] = Session) -> None:
+        """Invalidate the cache when sessions commit RBAC changes.
+
+        Changes are collected on flush and on bulk statements against the
+        RBAC tables, then applied after the outermost transaction commits.
+        A changed role assignment invalidates its user; any other change
+        invalidates everything.
+
+        Args:
+            session_class: Session class to listen on.
+        """
+        event.listen(session_class, "after_flush", self._collect_flush)
+        event.listen(session_class, "do_orm_execute", self._collect_execute)
+        event.listen(session_class, "after_commit", self._apply_changes)
+        event.listen(
+            session_class, "after_transaction_end", self._discard_changes
+        )
+
+    def _collect_flush(
+        self,
+        session: Session,
+        flush_context: UOWTransaction,  # noqa: ARG002
+    ) -> None:
+        for obj in (*session.new, *session.deleted):
+            if isinstance(obj, UserRoleAssignmentORM):
+                session.info.setdefault(CHANGED_USERS_KEY, set()).add(
+                    obj.user_id
+                )
+            elif isinstance(obj, AuthRoleORM | AuthPermissionORM):
+                session.info[CHANGED_ALL_KEY] = True
+        for obj in session.dirty:
+            if isinstance(
+                obj, UserRoleAssignmentORM | AuthRoleORM | AuthPermissionORM
+            ) and session.is_modified(obj):
+                session.info[CHANGED_ALL_KEY] = True
+
+    def _collect_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        if not (
+            orm_execute_state.is_insert
+            or orm_execute_state.is_update
+            or orm_execute_state.is_delete
+        ):
+            return
+        table = getattr(orm_execute_state.statement, "table", None)
+        if getattr(table, "name", None) in RBAC_TABLES:
+            orm_execute_state.session.info[CHANGED_ALL_KEY] = True
+
+    def _apply_changes(self, session: Session) -> None:
+        # Changes are only read here, every resolver listening on the
+        # session sees them; they are dropped when the transaction ends.
+        if session.info.get(CHANGED_ALL_KEY, False):
+            self.invalidate_all()
+        elif user_ids := session.info.get(CHANGED_USERS_KEY):
+            self.invalidate_user(*user_ids)
+
+    def _discard_changes(
+        self, session: Session, transaction: SessionTransaction
+    ) -> None:
+        if transaction.parent is None:
+            session.info.pop(CHANGED_ALL_KEY, None)
+            session.info.pop(CHANGED_USERS_KEY, None)
+
+
+__all__ = ["PermissionResolver"]
@@ -0,0 +1,307 @@
+import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from src.auth.domain.interfaces import IRevocationStore
+from src.auth.exceptions import InvalidTokenError
+from src.auth.infra.strategies.base import TokenPayload
+from src.auth.infra.unitofwork import AuthUnitOfWork
+from src.core.bloom import BloomFilter
+
+log = logging.getLogger(__name__)
+
+# Revocations are re-read this far behind the newest one seen, so rows
+# committed after a sync with an earlier timestamp are not missed.
+SYNC_OVERLAP_SECONDS = 60.0
+
+
+class RevocationFilter:
+    """Per-worker bloom filter in front of a revocation store.
+
+    Almost every checked id is not revoked; the filter answers those
+    without a store lookup, and only possible hits reach the store. The
+    filter is loaded from the store on first use, catches up with ids
+    revoked by other workers every ``sync_interval`` seconds, and is
+    rebuilt every ``rebuild_interval`` seconds (or when it is full) to
+    drop expired ids. Ids revoked by this worker are added immediately,
+    so other workers see a revocation within ``sync_interval``.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        sync_interval: float = 5.0,
+        rebuild_interval: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the filter.
+
+        Args:
+            capacity: Expected number of unexpired revoked ids.
+            error_rate: False positive rate of the bloom filter.
+            sync_interval: Seconds between reads of new revocations.
+            rebuild_interval: Seconds between full reloads.
+            clock: Function returning the current time in seconds.
+        """
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._sync_interval = sync_interval
+        self._rebuild_interval = rebuild_interval
+        self._clock = clock
+        self._bloom: BloomFilter | None = None
+        self._watermark: float | None = None
+        self._next_sync = 0.0
+        self._next_rebuild = 0.0
+
+    def add(self, token_id: str) -> None:
+        """Add an id revoked by this worker."""
+        if self._bloom is not None:
+            self._bloom.add(token_id)
+
+    def reset(self) -> None:
+        """Forget all ids; the next check reloads them from the store."""
+        self._bloom = None
+        self._watermark = None
+        self._next_sync = 0.0
+
+    async def sync(self, store: IRevocationStore) -> None:
+        """Read new revocations from the store when a sync is due."""
+        now = self._clock()
+        if now < self._next_sync:
+            return
+        # Scheduled before awaiting, so concurrent checks do not pile up.
+        self._next_sync = now + self._sync_interval
+
+        bloom = self._bloom
+        if bloom is None or bloom.saturated or now >= self._next_rebuild:
+            rows = await store.revoked_since()
+            bloom = BloomFilter(
+                max(self._capacity, 2 * len(rows)), self._error_rate
+            )
+            self._next_rebuild = now + self._rebuild_interval
+            self._bloom = bloom
+        else:
+            since = (
+                None
+                if self._watermark is None
+                else self._watermark - SYNC_OVERLAP_SECONDS
+            )
+            rows = await store.revoked_since(since)
+
+        bloom.update(token_id for token_id, _ in rows)
+        if rows:
+            newest = max(revoked_at for _, revoked_at in rows)
+            self._watermark = max(self._watermark or newest, newest)
+
+    async def _may_contain(
+        self, token_id: str, store: IRevocationStore
+    ) -> bool:
+        await self.sync(store)
+        return self._bloom is None or token_id in self._bloom
+
+    async def is_revoked(self, token_id: str, store: IRevocationStore) -> bool:
+        """Return whether an id is revoked.
+
+        Args:
+            token_id: Token or family id.
+            store: Store consulted on bloom filter hits.
+        """
+        if not await self._may_contain(token_id, store):
+            return False
+        return await store.is_revoked(token_id)
+
+    async def revoked_at(
+        self, token_id: str, store: IRevocationStore
+    ) -> float | None:
+        """Return when an id was last revoked, if it was.
+
+        Args:
+            token_id: Token, family or user revocation id.
+            store: Store consulted on bloom filter hits.
+        """
+        if not await self._may_contain(token_id, store):
+            return None
+        return await store.revoked_at(token_id)
+
+
+def user_revocation_id(user_id: int) -> str:
+    """Return the id revoking the tokens issued to a user until now."""
+    return f"user:{user_id}"
+
+
+class TokenRevocationService:
+    """Rotates refresh tokens and checks tokens against the denylist.
+
+    Refresh tokens are single use. Exchanging a token consumes its
+    ``jti``; presenting a consumed token again means it was copied, so
+    the whole family (every token rotated from the same login) is
+    revoked and the legitimate holder has to log in again as well.
+    Within ``reuse_grace_seconds`` of the first use, a reuse is exchanged
+    again instead: a client refreshing from two tabs at once, or retrying
+    after losing the response, is not logged out.
+
+    Access tokens are rejected when their ``jti`` is revoked (logout) or
+    when they were issued before the user's tokens were revoked (user
+    deactivated, password changed). Both checks are bloom filter probes
+    unless the filter reports a possible hit.
+    """
+
+    def __init__(
+        self,
+        uow: AuthUnitOfWork,
+        revocation_filter: RevocationFilter,
+        refresh_token_lifetime: timedelta,
+        rotate_refresh_tokens: bool = True,
+        check_access_tokens: bool = True,
+        reuse_grace_seconds: float = 10.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            uow: Unit of work providing the revocation store.
+            revocation_filter: Filter shared by the requests of the worker.
+            refresh_token_lifetime: Lifetime of refresh tokens, for which
+                revoked families and users are kept.
+            rotate_refresh_tokens: Make refresh tokens single use.
+            check_access_tokens: Check access tokens against the
+                denylist.
+            reuse_grace_seconds: Seconds after its first use during which
+                a refresh token may be exchanged again.
+            clock: Function returning the current POSIX time. Revocation
+                times are compared with the ``iat`` of tokens, so it must
+                be the clock that issues them, not the database's.
+        """
+        self.uow = uow
+        self._filter = revocation_filter
+        self._family_lifetime = refresh_token_lifetime.total_seconds()
+        self.rotate_refresh_tokens = rotate_refresh_tokens
+        self.check_access_tokens = check_access_tokens
+        self._reuse_grace = reuse_grace_seconds
+        self._clock = clock
+
+    async def is_revoked(self, token_id: str) -> bool:
+        """Return whether a token or family id is revoked."""
+        return await self._filter.is_revoked(
+            token_id, self.uow.revocation_store
+        )
+
+    async def revoke(self, token_id: str, expires_at: float) -> None:
+        """Revoke a token or family id until ``expires_at``."""
+        async with self.uow:
+            await self.uow.revocation_store.revoke(
+                token_id, expires_at, revoked_at=self._clock()
+            )
+        self._filter.add(token_id)
+
+    async def revoke_family(self, family_id: str) -> None:
+        """Revoke every refresh token of a family."""
+        await self.revoke(family_id, self._clock() + self._family_lifetime)
+
+    async def revoke_token(self, payload: TokenPayload) -> None:
+        """Revoke a single token until it expires."""
+        if payload.token_id is not None and payload.expires_at is not None:
+            await self.revoke(payload.token_id, payload.expires_at)
+
+    async def revoke_user_tokens(self, user_id: int) -> None:
+        """Revoke every access and refresh token issued to a user so far."""
+        await self.revoke(
+            user_revocation_id(user_id),
+            self._clock() + self._family_lifetime,
+        )
+
+    async def check_token(self, payload: TokenPayload) -> None:
+        """Reject a revoked token.
+
+        Args:
+            payload: Decoded access or refresh token.
+
+        Raises:
+            InvalidTokenError: If the token or its user's tokens are
+                revoked.
+        """
+        if payload.token_id is not None and await self.is_revoked(
+            payload.token_id
+        ):
+            raise InvalidTokenError("Token revoked")
+        revoked_at = await self._filter.revoked_at(
+            user_revocation_id(payload.user_id), self.uow.revocation_store
+        )
+        if revoked_at is not None and (
+            payload.issued_at is None or payload.issued_at <= revoked_at
+        ):
+            log.info(
+                "Token issued before user revocation | user_id=%r",
+                payload.user_id,
+            )
+            raise InvalidTokenError("Token revoked")
+
+    async def check_access_token(self, payload: TokenPayload) -> None:
+        """Reject a revoked access token, if the denylist is enabled."""
+        if self.check_access_tokens:
+            await self.check_token(payload)
+
+    async def rotate(self, payload: TokenPayload) -> None:
+        """Consume a refresh token before it is exchanged.
+
+        Args:
+            payload: Decoded refresh token.
+
+        Raises:
+            InvalidTokenError: If the token has no ``jti``, it or its
+                family is revoked, or it was already used before the
+                grace window.
+        """
+        if not self.rotate_refresh_tokens:
+            return
+        token_id, family_id = payload.token_id, payload.family_id
+        if token_id is None or family_id is None or payload.expires_at is None:
+            raise InvalidTokenError("Invalid refresh token")
+        await self.check_token(payload)
+        if await self.is_revoked(family_id):
+            log.warning(
+                "Revoked refresh token family | user_id=%r, family_id=%r",
+                payload.user_id,
+                family_id,
+            )
+            raise InvalidTokenError("Refresh token revoked")
+
+        store = self.uow.revocation_store
+        async with self.uow:
+            now = self._clock()
+            if await store.consume(
+                token_id, payload.expires_at, consumed_at=now
+            ):
+                return
+            consumed_at = await store.consumed_at(token_id)
+            if (
+                consumed_at is not None
+                and now - consumed_at <= self._reuse_grace
+            ):
+                log.info(
+                    "Refresh token reused within grace window | "
+                    "user_id=%r, family_id=%r",
+                    payload.user_id,
+                    family_id,
+                )
+                return
+            await store.revoke(
+                family_id, now + self._family_lifetime, revoked_at=now
+            )
+        self._filter.add(family_id)
+        log.warning(
+            "Refresh token reuse detected, family revoked | "
+            "user_id=%r, family_id=%r",
+            payload.user_id,
+            family_id,
+        )
+        raise InvalidTokenError("Refresh token reuse detected")
+
+
+__all__ = [
+    "RevocationFilter",
+    "TokenRevocationService",
+    "user_revocation_id",
+]
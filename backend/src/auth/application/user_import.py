@@ -0,0 +1,502 @@
+import asyncio
+import csv
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal, Self
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    SecretStr,
+    ValidationError,
+    model_validator,
+)
+
+from src.auth.domain.entities.user import User
+from src.auth.domain.entities.user_profile import UserProfile
+from src.auth.infra.security import hash_passwords, is_password_hash
+from src.auth.infra.unitofwork import UserImportUnitOfWork
+
+log = logging.getLogger(__name__)
+
+type ImportFormat = Literal["csv", "jsonl"]
+
+FORMAT_BY_SUFFIX: dict[str, ImportFormat] = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+class UserImportRecord(BaseModel):
+    """Single user in an import file.
+
+    Either a plain ``password`` or an already computed ``hashed_password``
+    (any scheme supported by the password context) is required. Hashes of
+    other schemes are rejected, as nobody could log in with them.
+    """
+
+    email: EmailStr
+    password: SecretStr | None = None
+    hashed_password: str | None = None
+    first_name: str | None = None
+    patronymic: str | None = None
+    last_name: str | None = None
+    bio: str | None = None
+    avatar_url: str | None = None
+    timezone: str | None = None
+    locale: str | None = None
+    is_active: bool = True
+    is_superuser: bool = False
+    is_verified: bool = False
+
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
+    @model_validator(mode="after")
+    def check_password(self) -> Self:
+        """Require a password or a supported password hash."""
+        if self.password is None and self.hashed_password is None:
+            raise ValueError("password or hashed_password is required")
+        if self.hashed_password is not None and not is_password_hash(
+            self.hashed_password
+        ):
+            raise ValueError("hashed_password has an unsupported scheme")
+        return self
+
+    def to_user(self, hashed_password: str) -> User:
+        """Convert the record to a user entity."""
+        return User(
+            email=self.email,
+            hashed_password=hashed_password,
+            is_active=self.is_active,
+            is_superuser=self.is_superuser,
+            is_verified=self.is_verified,
+            profile=UserProfile(
+                first_name=self.first_name,
+                patronymic=self.patronymic,
+                last_name=self.last_name,
+                bio=self.bio,
+                avatar_url=self.avatar_url,
+                timezone=self.timezone,
+                locale=self.locale,
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SourceRecord:
+    """Raw record read from an import file."""
+
+    line: int
+    data: dict[str, Any] | None
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RejectedRecord:
+    """Record skipped because it could not be parsed or validated."""
+
+    line: int
+    reason: str
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkFailure:
+    """Chunk that could not be loaded; its rows were rolled back."""
+
+    first_line: int
+    last_line: int
+    error: str
+
+
+@dataclass(slots=True)
+class ImportReport:
+    """Progress and outcome of an import."""
+
+    read: int = 0
+    imported: int = 0
+    existing: int = 0
+    duplicates: int = 0
+    rejected: list[RejectedRecord] = field(default_factory=list)
+    failed_chunks: list[ChunkFailure] = field(default_factory=list)
+    last_line: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def rate(self) -> float:
+        """Return the number of imported users per second."""
+        elapsed = time.monotonic() - self.started_at
+        return self.imported / elapsed if elapsed > 0 else 0.0
+
+
+@dataclass(slots=True)
+class _Chunk:
+    """Validated, deduplicated records of one chunk."""
+
+    first_line: int
+    last_line: int
+    records: list[UserImportRecord]
+
+
+@dataclass(slots=True)
+class _PreparedChunk:
+    """Chunk with existing users removed and passwords hashed."""
+
+    chunk: _Chunk
+    users: list[User] = field(default_factory=list)
+    existing: int = 0
+    error: str | None = None
+
+
+class ImportCheckpoint:
+    """Last fully imported line of a source file, persisted as JSON.
+
+    Lines up to the checkpoint are skipped when the import is restarted.
+    Rows after it are safe to replay: users that already exist are
+    skipped.
+    """
+
+    def __init__(self, path: Path, source: Path) -> None:
+        """Initialize the checkpoint.
+
+        Args:
+            path: Checkpoint file.
+            source: Import file the checkpoint belongs to.
+        """
+        self.path = path
+        self.source = str(source)
+
+    def load(self) -> int:
+        """Return the last imported line, 0 if there is no checkpoint.
+
+        Raises:
+            ValueError: If the checkpoint belongs to another source file.
+        """
+        if not self.path.exists():
+            return 0
+        data = json.loads(self.path.read_text())
+        if data["source"] != self.source:
+            raise ValueError(
+                f"Checkpoint {self.path} belongs to {data['source']!r}"
+            )
+        return int(data["line"])
+
+    def save(self, line: int) -> None:
+        """Atomically store the last imported line."""
+        tmp_path = self.path.with_suffix(f"{self.path.suffix}.tmp")
+        tmp_path.write_text(json.dumps({"source": self.source, "line": line}))
+        tmp_path.replace(self.path)
+
+
+def detect_format(path: Path) -> ImportFormat:
+    """Infer the import format from the file suffix.
+
+    Raises:
+        ValueError: If the suffix is not recognized.
+    """
+    try:
+        return FORMAT_BY_SUFFIX[path.suffix.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown import format: {path.name}") from None
+
+
+def read_records(
+    path: Path,
+    file_format: ImportFormat | None = None,
+    start_after: int = 0,
+) -> Iterator[SourceRecord]:
+    """Stream records from a CSV or JSON Lines file.
+
+    Empty CSV cells are treated as missing values.
+
+    Args:
+        path: Import file.
+        file_format: File format, inferred from the suffix when omitted.
+        start_after: Skip records ending on or before this line.
+
+    Yields:
+        Records with the line number they end on.
+    """
+    file_format = file_format or detect_format(path)
+    with path.open(encoding="utf-8", newline="") as file:
+        if file_format == "csv":
+            reader = csv.DictReader(file)
+            for row in reader:
+                if reader.line_num <= start_after:
+                    continue
+                yield SourceRecord(
+                    line=reader.line_num,
+                    data={
+                        k: v
+                        for k, v in row.items()
+                        if k and v not in ("", None)
+                    },
+                )
+            return
+
+        for line_number, line in enumerate(file, start=1):
+            if line_number <= start_after or not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield SourceRecord(line_number, None, f"invalid JSON: {e}")
+                continue
+            if not isinstance(data, dict):
+                yield SourceRecord(line_number, None, "expected an object")
+                continue
+            yield SourceRecord(line_number, data)
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, e['loc'])) or 'record'}: {e['msg']}"
+        for e in error.errors(include_url=False)
+    )
+
+
+class UserImportService:
+    """Streams users from a file into the database in chunks.
+
+    Each chunk goes through two stages: *prepare* (drop users that already
+    exist, hash plain passwords in a process pool) and *load* (bulk insert
+    users and profiles in one transaction). The next chunk is prepared
+    while the current one is loaded. A failing chunk is rolled back and
+    reported without stopping the import.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], UserImportUnitOfWork],
+        chunk_size: int = 1_000,
+        hash_workers: int | None = None,
+        executor: Executor | None = None,
+        on_progress: Callable[[ImportReport], None] | None = None,
+    ) -> None:
+        """Initialize the import service.
+
+        Args:
+            uow_factory: Creates a unit of work (with its own session) per
+                database round.
+            chunk_size: Number of users per transaction.
+            hash_workers: Size of the hashing process pool, defaults to the
+                number of CPUs.
+            executor: Executor used for hashing instead of a new process
+                pool.
+            on_progress: Called after every chunk, logs progress when
+                omitted.
+        """
+        self._uow_factory = uow_factory
+        self._chunk_size = max(1, chunk_size)
+        self._hash_workers = max(1, hash_workers or os.cpu_count() or 1)
+        self._executor = executor
+        self._on_progress = on_progress or self._log_progress
+
+    @staticmethod
+    def _log_progress(report: ImportReport) -> None:
+        log.info(
+            "Import progress | line=%r, read=%r, imported=%r, existing=%r, "
+            "duplicates=%r, rejected=%r, failed_chunks=%r, rate=%.0f/s",
+            report.last_line,
+            report.read,
+            report.imported,
+            report.existing,
+            report.duplicates,
+            len(report.rejected),
+            len(report.failed_chunks),
+            report.rate,
+        )
+
+    async def import_file(
+        self,
+        path: Path,
+        file_format: ImportFormat | None = None,
+        checkpoint: ImportCheckpoint | None = None,
+    ) -> ImportReport:
+        """Import users from a CSV or JSON Lines file.
+
+        Args:
+            path: Import file.
+            file_format: File format, inferred from the suffix when omitted.
+            checkpoint: Resume from and record progress in a checkpoint.
+
+        Returns:
+            Import report.
+        """
+        start_after = checkpoint.load() if checkpoint is not None else 0
+        report = ImportReport(last_line=start_after)
+        if start_after:
+            log.info("Resuming import | path=%r, line=%r", path, start_after)
+
+        executor = self._executor or ProcessPoolExecutor(
+            max_workers=self._hash_workers
+        )
+        try:
+            chunks = self._chunks(
+                read_records(path, file_format, start_after), report
+            )
+            pending: asyncio.Task[_PreparedChunk] | None = None
+            for chunk in chunks:
+                task = asyncio.create_task(self._prepare(chunk, executor))
+                if pending is not None:
+                    await self._load(await pending, report, checkpoint)
+                pending = task
+            if pending is not None:
+                await self._load(await pending, report, checkpoint)
+        finally:
+            if self._executor is None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        return report
+
+    def _chunks(
+        self, records: Iterator[SourceRecord], report: ImportReport
+    ) -> Iterator[_Chunk]:
+        """Validate and deduplicate records and group them into chunks."""
+        seen: set[str] = set()
+        chunk: _Chunk | None = None
+        for record in records:
+            report.read += 1
+            if record.data is None:
+                report.rejected.append(
+                    RejectedRecord(record.line, record.error or "empty")
+                )
+                continue
+            try:
+                user = UserImportRecord.model_validate(record.data)
+            except ValidationError as e:
+                report.rejected.append(
+                    RejectedRecord(record.line, _format_validation_error(e))
+                )
+                continue
+
+            if user.email in seen:
+                report.duplicates += 1
+                continue
+            seen.add(user.email)
+
+            if chunk is None:
+                chunk = _Chunk(record.line, record.line, [])
+            chunk.records.append(user)
+            chunk.last_line = record.line
+            if len(chunk.records) >= self._chunk_size:
+                yield chunk
+                chunk = None
+
+        if chunk is not None:
+            yield chunk
+
+    async def _prepare(
+        self, chunk: _Chunk, executor: Executor
+    ) -> _PreparedChunk:
+        """Drop existing users and hash the passwords of a chunk."""
+        prepared = _PreparedChunk(chunk=chunk)
+        try:
+            async with self._uow_factory() as uow:
+                existing = await uow.user_bulk_repo.existing_emails([
+                    record.email for record in chunk.records
+                ])
+            records = [r for r in chunk.records if r.email not in existing]
+            prepared.existing = len(chunk.records) - len(records)
+
+            plain = [r for r in records if r.hashed_password is None]
+            hashes = dict(
+                zip(
+                    (r.email for r in plain),
+                    await self._hash(
+                        [
+                            r.password.get_secret_value()
+                            for r in plain
+                            if r.password is not None
+                        ],
+                        executor,
+                    ),
+                    strict=True,
+                )
+            )
+            prepared.users = [
+                r.to_user(r.hashed_password or hashes[r.email])
+                for r in records
+            ]
+        except Exception as e:
+            log.exception(
+                "Import chunk preparation failed | lines=%r-%r",
+                chunk.first_line,
+                chunk.last_line,
+            )
+            prepared.error = repr(e)
+        return prepared
+
+    async def _hash(
+        self, passwords: Sequence[str], executor: Executor
+    ) -> list[str]:
+        """Hash passwords, one batch per worker."""
+        if not passwords:
+            return []
+        batch_size = -(-len(passwords) // self._hash_workers)
+        loop = asyncio.get_running_loop()
+        batches = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor, hash_passwords, passwords[i : i + batch_size]
+                )
+                for i in range(0, len(passwords), batch_size)
+            )
+        )
+        return [hashed for batch in batches for hashed in batch]
+
+    async def _load(
+        self,
+        prepared: _PreparedChunk,
+        report: ImportReport,
+        checkpoint: ImportCheckpoint | None,
+    ) -> None:
+        """Insert a prepared chunk in its own transaction."""
+        chunk = prepared.chunk
+        error = prepared.error
+        if error is None:
+            try:
+                async with self._uow_factory() as uow:
+                    await uow.user_bulk_repo.add_users(prepared.users)
+            except Exception as e:
+                log.exception(
+                    "Import chunk failed | lines=%r-%r",
+                    chunk.first_line,
+                    chunk.last_line,
+                )
+                error = repr(e)
+
+        if error is not None:
+            report.failed_chunks.append(
+                ChunkFailure(chunk.first_line, chunk.last_line, error)
+            )
+        else:
+            report.imported += len(prepared.users)
+            report.existing += prepared.existing
+            # The checkpoint only covers the prefix without failures, so a
+            # restart retries failed chunks.
+            if not report.failed_chunks:
+                report.last_line = chunk.last_line
+                if checkpoint is not None:
+                    checkpoint.save(chunk.last_line)
+        self._on_progress(report)
+
+
+__all__ = [
+    "ChunkFailure",
+    "ImportCheckpoint",
+    "ImportFormat",
+    "ImportReport",
+    "RejectedRecord",
+    "UserImportRecord",
+    "UserImportService",
+    "detect_format",
+    "read_records",
+]
@@ -1,14 +1,24 @@
 import logging
 
 from fastapi import Request
+from sqlalchemy.exc import SQLAlchemyError
 
 from src.auth.api.schemas import UserRegister
 from src.auth.domain.entities.user import User
 from src.auth.domain.entities.user_profile import UserProfile
 from src.auth.exceptions import InvalidCredentialsError, InvalidTokenError
-from src.auth.infra.security import hash_password, verify_password
+from src.auth.infra.security import (
+    hash_password_async,
+    password_needs_update,
+)
 from src.auth.infra.unitofwork import AuthUnitOfWork
-from src.core.exceptions.exceptions import EntityAlreadyExistsError
+from src.core.exceptions.exceptions import (
+    EntityAlreadyExistsError,
+    ServerError,
+)
+from src.core.timing import phase
+
+from .password_verifier import PasswordVerifier
 
 log = logging.getLogger(__name__)
 
@@ -16,17 +26,28 @@ log = logging.getLogger(__name__)
 class UserService:
     """Manages user-related business logic including authentication and registration."""  # noqa: E501
 
-    def __init__(self, uow: AuthUnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: AuthUnitOfWork,
+        password_verifier: PasswordVerifier | None = None,
+    ) -> None:
         """Initialize the user service with a unit of work.
 
         Args:
             uow: Unit of work providing access to repositories.
+            password_verifier: Verifies passwords, shared by the requests
+                of the worker; unknown emails fail at once without it.
         """
         self.uow = uow
+        self.password_verifier = password_verifier or PasswordVerifier(
+            strategy="none"
+        )
 
     async def authenticate(self, email: str, password: str) -> User:
         """Authenticate user by email and password.
 
+        A password hashed with outdated parameters or scheme is rehashed.
+
         Args:
             email: User email.
             password: Plain-text password.
@@ -38,17 +59,22 @@ class UserService:
             InvalidCredentialsError: If credentials are invalid or user is inactive.
         """  # noqa: E501
         user: User | None = await self.uow.user_repo.get_by_email(email)
-        if (
-            not user
-            or not user.is_active
-            or not user.hashed_password
-            or not verify_password(
-                plain_password=password,
-                hashed_password=user.hashed_password,
-            )
-        ):
+        verified = False
+        with phase("password.verify"):
+            if user and user.is_active and user.hashed_password:
+                verified = await self.password_verifier.verify(
+                    plain_password=password,
+                    hashed_password=user.hashed_password,
+                )
+            else:
+                await self.password_verifier.verify_unknown(email, password)
+        if not user or not verified:
             log.warning("Authentication failed | email=%r", email)
             raise InvalidCredentialsError()
+        if user.hashed_password and password_needs_update(
+            user.hashed_password
+        ):
+            await self._rehash_password(user, password)
 
         log.info(
             "User authenticated successfully | user_id=%r, email=%r",
@@ -57,6 +83,26 @@ class UserService:
         )
         return user
 
+    async def _rehash_password(self, user: User, password: str) -> None:
+        """Rehash a verified password with the current parameters.
+
+        Failures are logged and the login proceeds; the password is
+        rehashed on a later login.
+        """
+        try:
+            with phase("password.rehash"):
+                hashed_password = await hash_password_async(password)
+            async with self.uow:
+                await self.uow.user_repo.update_hashed_password(
+                    user, hashed_password
+                )
+        except (ServerError, SQLAlchemyError):
+            log.warning(
+                "Password rehash failed | user_id=%r", user.id, exc_info=True
+            )
+            return
+        log.info("Password rehashed | user_id=%r", user.id)
+
     async def get_user_by_email(self, email: str) -> User | None:
         """Retrieve an active user by email.
 
@@ -134,7 +180,8 @@ class UserService:
             raise EntityAlreadyExistsError("User already exists")
 
         plain_password = user_register.password.get_secret_value()
-        hashed_password = hash_password(plain_password)
+        with phase("password.hash"):
+            hashed_password = await hash_password_async(plain_password)
         user_entity = User(
             **user_register.model_dump(exclude={"password", "profile"})
         )
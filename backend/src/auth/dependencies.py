@@ -1,17 +1,31 @@
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import TYPE_CHECKING, Annotated
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.security.api_key import APIKeyCookie
 
-from src.auth.application import AuthManager, UserService
+from src.auth.application import (
+    AuthManager,
+    LoginThrottle,
+    TokenRevocationService,
+    UserService,
+)
 from src.core.config import SERVER_SETTINGS as SETTINGS
 from src.core.database.db_manager import DBSessionDep
+from src.core.request_context import set_user_id
 
 from .api.schemas import UserRead
-from .application.instance import authentication_backend
+from .application.instance import (
+    authentication_backend,
+    login_throttle,
+    password_verifier,
+    permission_resolver,
+    revocation_filter,
+)
+from .exceptions import PermissionDeniedError
+from .infra.strategies.base import TokenPayload
 from .infra.unitofwork import AuthUnitOfWork
 
 if TYPE_CHECKING:
@@ -51,19 +65,63 @@ async def get_user_service(  # noqa: RUF029
     uow: AuthUOWDep,
 ) -> AsyncGenerator[UserService]:
     """Get user manager."""
-    yield UserService(uow=uow)
+    yield UserService(uow=uow, password_verifier=password_verifier)
 
 
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 
 
+async def get_token_revocation(  # noqa: RUF029
+    uow: AuthUOWDep,
+) -> AsyncGenerator[TokenRevocationService | None]:
+    """Get token revocation service, if rotation or the denylist is on."""
+    if not (
+        SETTINGS.AUTH.refresh_token_rotation
+        or SETTINGS.AUTH.access_token_denylist
+    ):
+        yield None
+        return
+    yield TokenRevocationService(
+        uow=uow,
+        revocation_filter=revocation_filter,
+        refresh_token_lifetime=authentication_backend.refresh_token_lifetime,
+        rotate_refresh_tokens=SETTINGS.AUTH.refresh_token_rotation,
+        check_access_tokens=SETTINGS.AUTH.access_token_denylist,
+        reuse_grace_seconds=SETTINGS.AUTH.refresh_token_reuse_grace_seconds,
+    )
+
+
+TokenRevocationDep = Annotated[
+    TokenRevocationService | None, Depends(get_token_revocation)
+]
+
+
+async def get_login_throttle() -> AsyncGenerator[LoginThrottle | None]:  # noqa: RUF029
+    """Get login throttle, if login rate limiting is on."""
+    yield login_throttle
+
+
+LoginThrottleDep = Annotated[LoginThrottle | None, Depends(get_login_throttle)]
+
+
 async def get_auth_manager(  # noqa: RUF029
     user_service: UserServiceDep,
+    uow: AuthUOWDep,
+    token_revocation: TokenRevocationDep,
+    login_throttle: LoginThrottleDep,
 ) -> AsyncGenerator[AuthManager]:
     """Get auth manager."""
     yield AuthManager(
         authentication_backend=authentication_backend,
         user_service=user_service,
+        permission_resolver=(
+            permission_resolver
+            if SETTINGS.AUTH.jwt_embed_permissions
+            else None
+        ),
+        permission_repository=uow.permission_repo,
+        token_revocation=token_revocation,
+        login_throttle=login_throttle,
     )
 
 
@@ -74,11 +132,16 @@ async def get_current_user(
     token: AccessTokenDep,
     auth_manager: AuthManagerDep,
 ) -> UserRead:
-    """Get current user db model."""
+    """Get current user principal.
+
+    In claims mode the user is rebuilt from the verified access token
+    without a database query; the profile is not included.
+    """
     if not token:
         log.debug("Access token missing in request")
     try:
-        user: User = await auth_manager.current_user(token)
+        user: User = await auth_manager.current_principal(token)
+        set_user_id(user.id)
         log.debug("Current user resolved | user_id=%r", user.id)
         return UserRead.model_validate(user)
     except Exception:
@@ -89,12 +152,123 @@ async def get_current_user(
 CurrentUserDep = Annotated[UserRead, Depends(get_current_user)]
 
 
+async def get_current_user_fresh(
+    token: AccessTokenDep,
+    auth_manager: AuthManagerDep,
+) -> UserRead:
+    """Get current user db model, always loaded from the database."""
+    if not token:
+        log.debug("Access token missing in request")
+    try:
+        user: User = await auth_manager.current_user(token)
+        set_user_id(user.id)
+        log.debug("Current user loaded | user_id=%r", user.id)
+        return UserRead.model_validate(user)
+    except Exception:
+        log.debug("Failed to load current user from token")
+        raise
+
+
+CurrentUserFreshDep = Annotated[UserRead, Depends(get_current_user_fresh)]
+
+
+def require_permissions(
+    *permissions: str,
+) -> Callable[..., Awaitable[UserRead]]:
+    """Create a dependency requiring the current user to hold permissions.
+
+    Superusers hold every permission. Other users are checked against
+    their cached permission bitset, so a check is a single mask
+    comparison once the cache is warm.
+
+    Example:
+        ``user: Annotated[UserRead, Depends(require_permissions("a:b"))]``
+
+    Args:
+        permissions: Names of the required permissions.
+
+    Returns:
+        Dependency returning the current user.
+    """
+
+    async def check_permissions(
+        current_user: CurrentUserDep,
+        uow: AuthUOWDep,
+    ) -> UserRead:
+        if (
+            current_user.is_superuser
+            or await permission_resolver.has_permissions(
+                current_user.id, permissions, uow.permission_repo
+            )
+        ):
+            return current_user
+        log.warning(
+            "Permission denied | user_id=%r, permissions=%r",
+            current_user.id,
+            permissions,
+        )
+        raise PermissionDeniedError()
+
+    return check_permissions
+
+
+def require_scopes(
+    *permissions: str,
+) -> Callable[..., Awaitable[TokenPayload]]:
+    """Create a dependency authorizing from the access token alone.
+
+    The permissions embedded in the access token are checked against the
+    permission catalog version the token was issued with. Catalogs are
+    kept in memory by version, so a request only reaches the database
+    when the worker has not seen that catalog yet. Grants are as fresh as
+    the token; use ``require_permissions`` where revocations must apply
+    immediately. Revoked tokens are rejected when the denylist is on.
+
+    Args:
+        permissions: Names of the required permissions.
+
+    Returns:
+        Dependency returning the access token payload.
+    """
+
+    async def check_scopes(
+        token: AccessTokenDep,
+        uow: AuthUOWDep,
+        token_revocation: TokenRevocationDep,
+    ) -> TokenPayload:
+        payload = authentication_backend.decode_access_token(token=token)
+        if token_revocation is not None:
+            await token_revocation.check_access_token(payload)
+        claims = payload.permissions
+        if claims is not None:
+            catalog = await permission_resolver.get_catalog(
+                uow.permission_repo, version=claims.version
+            )
+            required = catalog.mask(permissions)
+            if required is not None and (
+                claims.to_permission_set().has_all(required)
+            ):
+                return payload
+        log.warning(
+            "Token scopes denied | user_id=%r, permissions=%r",
+            payload.user_id,
+            permissions,
+        )
+        raise PermissionDeniedError()
+
+    return check_scopes
+
+
 __all__ = [
     "AccessTokenDep",
     "AuthManagerDep",
     "AuthUOWDep",
     "CurrentUserDep",
+    "CurrentUserFreshDep",
     "FormDataDeps",
     "RefreshTokenDep",
+    "TokenRevocationDep",
     "UserServiceDep",
+    "require_permissions",
+    "require_scopes",
 ]
@@ -1,6 +1,9 @@
 __all__ = [
+    "PermissionCatalog",
+    "PermissionSet",
     "User",
     "UserProfile",
 ]
+from .permission_set import PermissionCatalog, PermissionSet
 from .user import User
 from .user_profile import UserProfile
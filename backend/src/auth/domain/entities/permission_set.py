@@ -0,0 +1,121 @@
+import base64
+import hashlib
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+# Bitmap of a permission set granting everything (superusers).
+ALL_PERMISSIONS_BITMAP = "*"
+
+
+@dataclass(frozen=True, slots=True)
+class PermissionSet:
+    """Effective permissions of a user as a bitset.
+
+    Bit ``n`` is set when the user holds the permission at index ``n`` of
+    a ``PermissionCatalog``, so membership and subset checks are a single
+    integer operation. A set is only meaningful with the catalog it was
+    built against. A negative mask (all bits set) grants every permission.
+    """
+
+    mask: int = 0
+
+    @classmethod
+    def from_bits(cls, bits: Iterable[int]) -> "PermissionSet":
+        """Build a permission set from catalog bit indexes."""
+        mask = 0
+        for bit in bits:
+            mask |= 1 << bit
+        return cls(mask)
+
+    @classmethod
+    def all(cls) -> "PermissionSet":
+        """Return a permission set granting every permission."""
+        return cls(-1)
+
+    @classmethod
+    def from_bitmap(cls, bitmap: str) -> "PermissionSet":
+        """Decode a permission set encoded with ``to_bitmap``.
+
+        Raises:
+            ValueError: If the bitmap is malformed.
+        """
+        if bitmap == ALL_PERMISSIONS_BITMAP:
+            return cls.all()
+        data = base64.urlsafe_b64decode(bitmap + "=" * (-len(bitmap) % 4))
+        return cls(int.from_bytes(data, "little"))
+
+    def to_bitmap(self) -> str:
+        """Encode the set as an unpadded URL-safe base64 bitmap."""
+        if self.mask < 0:
+            return ALL_PERMISSIONS_BITMAP
+        data = self.mask.to_bytes((self.mask.bit_length() + 7) // 8, "little")
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+    def __contains__(self, bit: int) -> bool:
+        """Return whether the permission at the given bit index is held."""
+        return bool(self.mask >> bit & 1)
+
+    def has_all(self, required: int) -> bool:
+        """Return whether every permission in the ``required`` mask is held."""
+        return self.mask & required == required
+
+
+@dataclass(frozen=True, slots=True)
+class PermissionCatalog:
+    """Active permissions, mapping permission names to ids and bits.
+
+    Permissions get dense bit indexes in the order of their ids, so
+    bitmaps stay as short as the catalog however large the ids grow. The
+    version covers the ids, hence the bit layout as well.
+
+    Attributes:
+        ids_by_name: Permission ids keyed by name.
+        bits_by_id: Bit indexes keyed by permission id.
+        version: Digest of the catalog content, equal in every worker
+            that loaded the same catalog.
+    """
+
+    ids_by_name: Mapping[str, int]
+    bits_by_id: Mapping[int, int]
+    version: str
+
+    @classmethod
+    def create(cls, ids_by_name: Mapping[str, int]) -> "PermissionCatalog":
+        """Build a catalog, deriving its bits and version from the content."""
+        digest = hashlib.blake2b(digest_size=6)
+        for name, permission_id in sorted(ids_by_name.items()):
+            digest.update(f"{name}={permission_id};".encode())
+        bits_by_id = {
+            permission_id: bit
+            for bit, permission_id in enumerate(sorted(ids_by_name.values()))
+        }
+        return cls(
+            ids_by_name=dict(ids_by_name),
+            bits_by_id=bits_by_id,
+            version=digest.hexdigest(),
+        )
+
+    def permission_set(self, permission_ids: Iterable[int]) -> PermissionSet:
+        """Build the permission set of permission ids.
+
+        Ids missing from the catalog (inactive permissions) are ignored.
+        """
+        return PermissionSet.from_bits(
+            self.bits_by_id[permission_id]
+            for permission_id in permission_ids
+            if permission_id in self.bits_by_id
+        )
+
+    def mask(self, names: Iterable[str]) -> int | None:
+        """Return the bitmask of the named permissions.
+
+        Returns:
+            The mask, or None if any name is not an active permission.
+        """
+        mask = 0
+        for name in names:
+            permission_id = self.ids_by_name.get(name)
+            if permission_id is None:
+                return None
+            mask |= 1 << self.bits_by_id[permission_id]
+        return mask
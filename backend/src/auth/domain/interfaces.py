@@ -15,5 +15,98 @@ class IUserRepository(ABC):
     @abstractmethod
     async def get_by_id(self, id: int) -> User | None: ...  # noqa: D102
 
+    @abstractmethod
+    async def update_hashed_password(
+        self, user: User, hashed_password: str
+    ) -> None:
+        """Replace the password hash of a user."""
+        ...
+
     # @abstractmethod
     # async def save(self, user: User) -> None: ...
+
+
+class IPermissionRepository(ABC):
+    """Role based access control repository."""
+
+    @abstractmethod
+    async def get_catalog(self) -> dict[str, int]:
+        """Return the ids of the active permissions keyed by name."""
+        ...
+
+    @abstractmethod
+    async def get_user_permission_ids(self, user_id: int) -> list[int]:
+        """Return the ids of the active permissions granted to a user."""
+        ...
+
+
+class IRevocationStore(ABC):
+    """Store of revoked and consumed token ids.
+
+    A revoked id (a token or a token family) must be rejected until it
+    expires. A consumed id belongs to a single-use token, such as a
+    rotated refresh token, that has already been exchanged. Times are
+    POSIX timestamps.
+    """
+
+    @abstractmethod
+    async def revoke(
+        self, token_id: str, expires_at: float, revoked_at: float
+    ) -> None:
+        """Revoke an id until ``expires_at``.
+
+        Args:
+            token_id: Token, family or user revocation id.
+            expires_at: Time until which the id is revoked.
+            revoked_at: Time of the revocation, from the clock that sets
+                the ``iat`` of tokens, since tokens issued until then are
+                rejected.
+        """
+        ...
+
+    @abstractmethod
+    async def consume(
+        self, token_id: str, expires_at: float, consumed_at: float
+    ) -> bool:
+        """Mark a single-use id as used.
+
+        Args:
+            token_id: Id of the single-use token.
+            expires_at: Time until which the use is remembered.
+            consumed_at: Time of the use.
+
+        Returns:
+            True on first use, False if the id was used or revoked before.
+        """
+        ...
+
+    @abstractmethod
+    async def consumed_at(self, token_id: str) -> float | None:
+        """Return when an unexpired single-use id was used, if it was."""
+        ...
+
+    @abstractmethod
+    async def is_revoked(self, token_id: str) -> bool:
+        """Return whether an id is revoked and not yet expired."""
+        ...
+
+    @abstractmethod
+    async def revoked_at(self, token_id: str) -> float | None:
+        """Return when an unexpired id was last revoked, if it was."""
+        ...
+
+    @abstractmethod
+    async def revoked_since(
+        self, since: float | None = None
+    ) -> list[tuple[str, float]]:
+        """Return the unexpired revoked ids with their revocation time.
+
+        Args:
+            since: Only return ids revoked after this time.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_expired(self, batch_size: int = 1000) -> int:
+        """Delete up to ``batch_size`` expired ids, returning the count."""
+        ...
@@ -1,3 +1,5 @@
+import math
+
 from fastapi import FastAPI, Request
 from starlette.responses import JSONResponse
 
@@ -7,9 +9,14 @@ from src.core.exceptions import ServerError
 class AuthBaseError(ServerError):
     """Base auth exception."""
 
-    def __init__(self, message: str, status_code: int = 400) -> None:
+    def __init__(
+        self,
+        message: str,
+        status_code: int = 400,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         """Initialize the AuthBaseError."""
-        super().__init__(message, status_code)
+        super().__init__(message, status_code, headers)
 
 
 class TransportLogoutNotSupportedError(AuthBaseError):
@@ -55,6 +62,47 @@ class InactiveUserError(AuthBaseError):
         super().__init__(message, 403)
 
 
+class PermissionDeniedError(AuthBaseError):
+    """Raised when the user lacks a required permission."""
+
+    def __init__(self, message: str = "Not enough permissions") -> None:
+        """Initialize the PermissionDeniedError."""
+        super().__init__(message, 403)
+
+
+class PasswordHashingUnavailableError(AuthBaseError):
+    """Raised when the password hashing pool is saturated."""
+
+    def __init__(
+        self,
+        message: str = "Authentication service is busy, try again later",
+    ) -> None:
+        """Initialize the PasswordHashingUnavailableError."""
+        super().__init__(message, 503)
+
+
+class TooManyLoginAttemptsError(AuthBaseError):
+    """Raised when login attempts are throttled."""
+
+    def __init__(
+        self,
+        retry_after: float,
+        message: str = "Too many login attempts, try again later",
+    ) -> None:
+        """Initialize the TooManyLoginAttemptsError.
+
+        Args:
+            retry_after: Seconds until the next attempt is allowed.
+            message: Error message.
+        """
+        self.retry_after = retry_after
+        super().__init__(
+            message,
+            429,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
 def register_auth_exception_handlers(app: FastAPI) -> None:
     """Register auth exception handlers."""
 
@@ -66,4 +114,5 @@ def register_auth_exception_handlers(app: FastAPI) -> None:
         return JSONResponse(
             status_code=exc.status_code,
             content={"detail": exc.message},
+            headers=exc.headers,
         )
@@ -1,6 +1,7 @@
 __all__ = [
     "AuthPermissionORM",
     "AuthRoleORM",
+    "RevokedTokenORM",
     "UserORM",
     "UserProfileORM",
     "UserRoleAssignmentORM",
@@ -9,6 +10,7 @@ __all__ = [
 from .association_role_permissions import association_role_permissions
 from .auth_permission import AuthPermissionORM
 from .auth_role import AuthRoleORM
+from .revoked_token import RevokedTokenORM
 from .user_orm import UserORM
 from .user_profile_orm import UserProfileORM
 from .user_role_assignment import UserRoleAssignmentORM
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from sqlalchemy import TIMESTAMP, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database.base import Base
+from src.core.database.types import CreatedAt, DefaultFalse
+
+
+class RevokedTokenORM(Base):
+    """Revoked or consumed token id.
+
+    Rows are only needed until ``expires_at``, when the token they refer
+    to would be rejected anyway; expired rows are deleted in batches.
+    """
+
+    token_id: Mapped[str] = mapped_column(String(length=64), unique=True)
+    is_consumed: Mapped[DefaultFalse]
+    expires_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), index=True
+    )
+    created_at: Mapped[CreatedAt] = mapped_column(index=True)
+
+    def __repr__(self) -> str:
+        """Represent instance as a unique string."""
+        return (
+            f"<RevokedToken(token_id='{self.token_id}', "
+            f"is_consumed={self.is_consumed}, "
+            f"expires_at={self.expires_at})>"
+        )
@@ -1,7 +1,22 @@
 __all__ = [
+    "MEMORY_REVOCATION_STORE",
+    "USER_CACHE",
+    "CachedUserRepository",
+    "InMemoryRevocationStore",
+    "SQLAPermissionRepository",
+    "SQLARevocationStore",
+    "SQLAUserBulkRepository",
     "SQLAUserProfileRepository",
     "SQLAUserRepository",
 ]
 
+from .cached_user_repository import USER_CACHE, CachedUserRepository
+from .permission_repository import SQLAPermissionRepository
+from .revocation_store import (
+    MEMORY_REVOCATION_STORE,
+    InMemoryRevocationStore,
+    SQLARevocationStore,
+)
+from .user_bulk_repository import SQLAUserBulkRepository
 from .user_profile_repository import SQLAUserProfileRepository
 from .user_repository import SQLAUserRepository
@@ -0,0 +1,118 @@
+from typing import Final
+
+from src.auth.domain.entities.user import User
+from src.auth.domain.interfaces import IUserRepository
+from src.core.batch_loader import BatchLoader
+from src.core.cache import InMemoryCache, ReadThroughCache
+from src.core.config import SERVER_SETTINGS as SETTINGS
+
+
+class CachedUserRepository(IUserRepository):
+    """Read-through cache in front of a user repository.
+
+    Users are cached under both their id and email key. Written users are
+    invalidated by ``apply_invalidations`` once the transaction commits;
+    invalidating earlier would let a concurrent read cache the old row
+    again. Any future update path must call ``invalidate_user`` or queue
+    the user the same way.
+
+    With a ``loader``, lookups by id that miss the cache during the same
+    event loop iteration are loaded together in one batch.
+    """
+
+    def __init__(
+        self,
+        repository: IUserRepository,
+        cache: ReadThroughCache[User],
+        loader: BatchLoader[int, User] | None = None,
+    ) -> None:
+        """Initialize the cached user repository.
+
+        Args:
+            repository: Repository used on cache misses.
+            cache: Cache shared between requests.
+            loader: Loader of one request batching the id cache misses.
+        """
+        self._repository = repository
+        self._cache = cache
+        self._loader = loader
+        self._written: list[User] = []
+
+    @staticmethod
+    def id_key(id: int) -> str:
+        """Return the cache key for a user id."""
+        return f"user:id:{id}"
+
+    @staticmethod
+    def email_key(email: str) -> str:
+        """Return the cache key for a user email.
+
+        The email is used as is, like in the lookup by email, so a key
+        never holds a user the repository would not return for it.
+        """
+        return f"user:email:{email}"
+
+    def _all_keys(self, user: User) -> tuple[str, ...]:
+        keys: tuple[str, ...] = (self.email_key(user.email),)
+        if user.id is not None:
+            keys += (self.id_key(user.id),)
+        return keys
+
+    async def add_user(self, user: User) -> User:
+        """Add user and queue the invalidation of its cache keys."""
+        new_user = await self._repository.add_user(user)
+        self._written.append(new_user)
+        return new_user
+
+    async def update_hashed_password(
+        self, user: User, hashed_password: str
+    ) -> None:
+        """Replace the password hash and queue the user's invalidation."""
+        await self._repository.update_hashed_password(user, hashed_password)
+        self._written.append(user)
+        if self._loader is not None and user.id is not None:
+            self._loader.clear(user.id)
+
+    async def get_by_id(self, id: int) -> User | None:
+        """Get user by id, loading it on a cache miss."""
+
+        async def load() -> User | None:
+            if self._loader is not None:
+                return await self._loader.load(id)
+            return await self._repository.get_by_id(id)
+
+        return await self._cache.get_or_load(
+            self.id_key(id), load, aliases=self._all_keys
+        )
+
+    async def get_by_email(self, email: str) -> User | None:
+        """Get user by email, loading it on a cache miss."""
+        return await self._cache.get_or_load(
+            self.email_key(email),
+            lambda: self._repository.get_by_email(email),
+            aliases=self._all_keys,
+        )
+
+    async def invalidate_user(self, user: User) -> None:
+        """Remove a user from the cache after it has been modified."""
+        await self._cache.invalidate(*self._all_keys(user))
+
+    async def apply_invalidations(self) -> None:
+        """Invalidate the users written in the committed transaction."""
+        written, self._written = self._written, []
+        for user in written:
+            await self.invalidate_user(user)
+
+    def discard_invalidations(self) -> None:
+        """Forget the users written in a rolled back transaction."""
+        self._written.clear()
+
+
+USER_CACHE: Final[ReadThroughCache[User] | None] = (
+    ReadThroughCache(
+        local=InMemoryCache(max_size=SETTINGS.AUTH.user_cache_max_size),
+        ttl=SETTINGS.AUTH.user_cache_ttl_seconds,
+    )
+    if SETTINGS.AUTH.user_cache_enabled
+    else None
+)
@@ -0,0 +1,75 @@
+from typing import Final
+
+from sqlalchemy import Select, bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.domain.interfaces import IPermissionRepository
+from src.auth.infra.models.association_role_permissions import (
+    association_role_permissions,
+)
+from src.auth.infra.models.auth_permission import AuthPermissionORM
+from src.auth.infra.models.auth_role import AuthRoleORM
+from src.auth.infra.models.user_role_assignment import UserRoleAssignmentORM
+from src.core.database.routing import replica_reads
+from src.core.database.session import release_connection
+from src.core.timing import timed
+
+GET_PERMISSION_CATALOG_STMT: Final[Select[tuple[str, int]]] = select(
+    AuthPermissionORM.name, AuthPermissionORM.id
+).where(AuthPermissionORM.is_active.is_(True))
+
+# assignment -> active role -> role permissions -> active permission
+GET_USER_PERMISSION_IDS_STMT: Final[Select[tuple[int]]] = (
+    select(AuthPermissionORM.id)
+    .distinct()
+    .select_from(UserRoleAssignmentORM)
+    .join(AuthRoleORM, AuthRoleORM.id == UserRoleAssignmentORM.role_id)
+    .join(
+        association_role_permissions,
+        association_role_permissions.c.role_id == AuthRoleORM.id,
+    )
+    .join(
+        AuthPermissionORM,
+        AuthPermissionORM.id == association_role_permissions.c.permission_id,
+    )
+    .where(
+        UserRoleAssignmentORM.user_id == bindparam("user_id"),
+        AuthRoleORM.is_active.is_(True),
+        AuthPermissionORM.is_active.is_(True),
+    )
+)
+
+
+class SQLAPermissionRepository(IPermissionRepository):
+    """Permission repository."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the permission repository."""
+        self.session: AsyncSession = session
+
+    @timed("db.permission.get_catalog")
+    async def get_catalog(self) -> dict[str, int]:
+        """Return the ids of the active permissions keyed by name."""
+        with replica_reads(self.session):
+            catalog = dict(
+                (await self.session.execute(GET_PERMISSION_CATALOG_STMT))
+                .tuples()
+                .all()
+            )
+        await release_connection(self.session)
+        return catalog
+
+    @timed("db.permission.get_user_permission_ids")
+    async def get_user_permission_ids(self, user_id: int) -> list[int]:
+        """Return the ids of the active permissions granted to a user."""
+        with replica_reads(self.session):
+            ids = list(
+                await self.session.scalars(
+                    GET_USER_PERMISSION_IDS_STMT, {"user_id": user_id}
+                )
+            )
+        await release_connection(self.session)
+        return ids
+
+
+__all__ = ["SQLAPermissionRepository"]
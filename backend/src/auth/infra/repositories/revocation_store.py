@@ -0,0 +1,269 @@
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any, Final, cast
+
+from sqlalchemy import (
+    CursorResult,
+    Delete,
+    Select,
+    bindparam,
+    delete,
+    exists,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.domain.interfaces import IRevocationStore
+from src.auth.infra.models.revoked_token import RevokedTokenORM
+from src.core.config import SERVER_SETTINGS as SETTINGS
+from src.core.database.session import release_connection
+
+IS_REVOKED_STMT: Final[Select[tuple[bool]]] = select(
+    exists().where(
+        RevokedTokenORM.token_id == bindparam("token_id"),
+        RevokedTokenORM.is_consumed.is_(False),
+        RevokedTokenORM.expires_at > func.now(),
+    )
+)
+REVOKED_AT_STMT: Final[Select[tuple[datetime]]] = select(
+    RevokedTokenORM.created_at
+).where(
+    RevokedTokenORM.token_id == bindparam("token_id"),
+    RevokedTokenORM.is_consumed.is_(False),
+    RevokedTokenORM.expires_at > func.now(),
+)
+CONSUMED_AT_STMT: Final[Select[tuple[datetime]]] = select(
+    RevokedTokenORM.created_at
+).where(
+    RevokedTokenORM.token_id == bindparam("token_id"),
+    RevokedTokenORM.is_consumed.is_(True),
+    RevokedTokenORM.expires_at > func.now(),
+)
+REVOKED_IDS_STMT: Final[Select[tuple[str, datetime]]] = select(
+    RevokedTokenORM.token_id, RevokedTokenORM.created_at
+).where(
+    RevokedTokenORM.is_consumed.is_(False),
+    RevokedTokenORM.expires_at > func.now(),
+)
+# SKIP LOCKED lets concurrent cleanups work on disjoint batches.
+DELETE_EXPIRED_STMT: Final[Delete] = delete(RevokedTokenORM).where(
+    RevokedTokenORM.id.in_(
+        select(RevokedTokenORM.id)
+        .where(RevokedTokenORM.expires_at <= func.now())
+        .limit(bindparam("batch_size"))
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+)
+
+
+def _to_datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, UTC)
+
+
+class SQLARevocationStore(IRevocationStore):
+    """PostgreSQL revocation store.
+
+    Reads go to the primary: a revocation that has not reached a replica
+    yet must not be missed. Writes are made in the caller's transaction.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the revocation store."""
+        self.session: AsyncSession = session
+
+    async def revoke(
+        self, token_id: str, expires_at: float, revoked_at: float
+    ) -> None:
+        """Revoke an id until ``expires_at``."""
+        stmt = insert(RevokedTokenORM).values(
+            token_id=token_id,
+            created_at=_to_datetime(revoked_at),
+            expires_at=_to_datetime(expires_at),
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[RevokedTokenORM.token_id],
+                set_={
+                    "is_consumed": False,
+                    "created_at": stmt.excluded.created_at,
+                    "expires_at": func.greatest(
+                        RevokedTokenORM.expires_at, stmt.excluded.expires_at
+                    ),
+                },
+            )
+        )
+
+    async def consume(
+        self, token_id: str, expires_at: float, consumed_at: float
+    ) -> bool:
+        """Mark a single-use id as used, atomically."""
+        inserted = await self.session.scalar(
+            insert(RevokedTokenORM)
+            .values(
+                token_id=token_id,
+                is_consumed=True,
+                created_at=_to_datetime(consumed_at),
+                expires_at=_to_datetime(expires_at),
+            )
+            .on_conflict_do_nothing(index_elements=[RevokedTokenORM.token_id])
+            .returning(RevokedTokenORM.id)
+        )
+        return inserted is not None
+
+    async def consumed_at(self, token_id: str) -> float | None:
+        """Return when an unexpired single-use id was used, if it was."""
+        consumed_at = await self.session.scalar(
+            CONSUMED_AT_STMT, {"token_id": token_id}
+        )
+        return None if consumed_at is None else consumed_at.timestamp()
+
+    async def is_revoked(self, token_id: str) -> bool:
+        """Return whether an id is revoked and not yet expired."""
+        revoked = await self.session.scalar(
+            IS_REVOKED_STMT, {"token_id": token_id}
+        )
+        await release_connection(self.session)
+        return bool(revoked)
+
+    async def revoked_at(self, token_id: str) -> float | None:
+        """Return when an unexpired id was last revoked, if it was."""
+        revoked_at = await self.session.scalar(
+            REVOKED_AT_STMT, {"token_id": token_id}
+        )
+        await release_connection(self.session)
+        return None if revoked_at is None else revoked_at.timestamp()
+
+    async def revoked_since(
+        self, since: float | None = None
+    ) -> list[tuple[str, float]]:
+        """Return the unexpired revoked ids with their revocation time."""
+        stmt = REVOKED_IDS_STMT
+        if since is not None:
+            stmt = stmt.where(RevokedTokenORM.created_at > _to_datetime(since))
+        result = await self.session.execute(stmt)
+        rows = [
+            (token_id, created_at.timestamp())
+            for token_id, created_at in result.tuples()
+        ]
+        await release_connection(self.session)
+        return rows
+
+    async def delete_expired(self, batch_size: int = 1000) -> int:
+        """Delete up to ``batch_size`` expired ids, returning the count."""
+        result = cast(
+            "CursorResult[Any]",
+            await self.session.execute(
+                DELETE_EXPIRED_STMT, {"batch_size": batch_size}
+            ),
+        )
+        return result.rowcount
+
+
+class InMemoryRevocationStore(IRevocationStore):
+    """Process-local revocation store.
+
+    Suitable for a single worker and for tests: other processes do not
+    see its revocations. Expired ids are dropped on lookup and by
+    ``delete_expired``.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        """Initialize the store.
+
+        Args:
+            clock: Function returning the current POSIX time.
+        """
+        self._clock = clock
+        # token id -> (expires at, revoked or consumed at, consumed)
+        self._entries: dict[str, tuple[float, float, bool]] = {}
+
+    def _get(self, token_id: str) -> tuple[float, float, bool] | None:
+        entry = self._entries.get(token_id)
+        if entry is not None and entry[0] <= self._clock():
+            del self._entries[token_id]
+            return None
+        return entry
+
+    async def revoke(
+        self, token_id: str, expires_at: float, revoked_at: float
+    ) -> None:
+        """Revoke an id until ``expires_at``."""
+        entry = self._get(token_id)
+        if entry is not None:
+            expires_at = max(expires_at, entry[0])
+        self._entries[token_id] = (expires_at, revoked_at, False)
+
+    async def consume(
+        self, token_id: str, expires_at: float, consumed_at: float
+    ) -> bool:
+        """Mark a single-use id as used."""
+        if self._get(token_id) is not None:
+            return False
+        self._entries[token_id] = (expires_at, consumed_at, True)
+        return True
+
+    async def consumed_at(self, token_id: str) -> float | None:
+        """Return when an unexpired single-use id was used, if it was."""
+        entry = self._get(token_id)
+        return entry[1] if entry is not None and entry[2] else None
+
+    async def is_revoked(self, token_id: str) -> bool:
+        """Return whether an id is revoked and not yet expired."""
+        entry = self._get(token_id)
+        return entry is not None and not entry[2]
+
+    async def revoked_at(self, token_id: str) -> float | None:
+        """Return when an unexpired id was last revoked, if it was."""
+        entry = self._get(token_id)
+        return None if entry is None or entry[2] else entry[1]
+
+    async def revoked_since(
+        self, since: float | None = None
+    ) -> list[tuple[str, float]]:
+        """Return the unexpired revoked ids with their revocation time."""
+        now = self._clock()
+        return [
+            (token_id, revoked_at)
+            for token_id, (expires_at, revoked_at, consumed) in list(
+                self._entries.items()
+            )
+            if not consumed
+            and expires_at > now
+            and (since is None or revoked_at > since)
+        ]
+
+    async def delete_expired(self, batch_size: int = 1000) -> int:
+        """Delete up to ``batch_size`` expired ids, returning the count."""
+        now = self._clock()
+        expired = [
+            token_id
+            for token_id, (expires_at, _, _) in self._entries.items()
+            if expires_at <= now
+        ][:batch_size]
+        for token_id in expired:
+            del self._entries[token_id]
+        return len(expired)
+
+    def __len__(self) -> int:
+        """Return the number of ids, including expired ones."""
+        return len(self._entries)
+
+
+# Shared by all requests of the worker when configured; the database
+# store is created per unit of work instead.
+MEMORY_REVOCATION_STORE: Final[InMemoryRevocationStore | None] = (
+    InMemoryRevocationStore()
+    if SETTINGS.AUTH.token_revocation_store == "memory"
+    else None
+)
+
+
+__all__ = [
+    "MEMORY_REVOCATION_STORE",
+    "InMemoryRevocationStore",
+    "SQLARevocationStore",
+]
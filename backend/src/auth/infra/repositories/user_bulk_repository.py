@@ -0,0 +1,167 @@
+from collections.abc import Sequence
+from typing import Any, Literal
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.domain.entities.user import User
+from src.auth.infra.models.user_orm import UserORM
+from src.auth.infra.models.user_profile_orm import UserProfileORM
+
+type BulkLoadMethod = Literal["copy", "executemany"]
+
+USER_COLUMNS: tuple[str, ...] = (
+    "id",
+    "email",
+    "hashed_password",
+    "is_active",
+    "is_superuser",
+    "is_verified",
+)
+PROFILE_COLUMNS: tuple[str, ...] = (
+    "user_id",
+    "first_name",
+    "patronymic",
+    "last_name",
+    "bio",
+    "avatar_url",
+    "timezone",
+    "locale",
+)
+
+ALLOCATE_USER_IDS_STMT = text(
+    "SELECT nextval(pg_get_serial_sequence(:table_name, 'id')) "
+    "FROM generate_series(1, :count)"
+)
+
+
+class SQLAUserBulkRepository:
+    """Bulk loader for users and their profiles.
+
+    User ids are taken from the ``users`` id sequence up front, so users
+    and profiles can be written in two set-based statements without
+    ``RETURNING``. Rows are loaded with asyncpg ``COPY`` or, for drivers
+    without it, a single executemany ``INSERT`` per table.
+    """
+
+    def __init__(
+        self, session: AsyncSession, method: BulkLoadMethod = "copy"
+    ) -> None:
+        """Initialize the bulk repository.
+
+        Args:
+            session: Async database session.
+            method: ``copy`` or ``executemany``.
+        """
+        self.session = session
+        self.method = method
+
+    async def existing_emails(self, emails: Sequence[str]) -> set[str]:
+        """Return the emails that are already registered.
+
+        Args:
+            emails: Emails to check.
+        """
+        if not emails:
+            return set()
+        result = await self.session.scalars(
+            select(UserORM.email).where(UserORM.email.in_(emails))
+        )
+        return set(result)
+
+    async def _allocate_ids(self, count: int) -> list[int]:
+        result = await self.session.scalars(
+            ALLOCATE_USER_IDS_STMT,
+            {"table_name": UserORM.__tablename__, "count": count},
+        )
+        return list(result)
+
+    async def add_users(self, users: Sequence[User]) -> list[User]:
+        """Insert users with their profiles.
+
+        Args:
+            users: Users with hashed passwords; ids are assigned in place.
+
+        Returns:
+            The inserted users.
+        """
+        if not users:
+            return []
+
+        for user, user_id in zip(
+            users, await self._allocate_ids(len(users)), strict=True
+        ):
+            user.id = user_id
+            if user.profile is not None:
+                user.profile.user_id = user_id
+
+        user_rows = [
+            (
+                user.id,
+                user.email,
+                user.hashed_password,
+                bool(user.is_active),
+                bool(user.is_superuser),
+                bool(user.is_verified),
+            )
+            for user in users
+        ]
+        profile_rows = [
+            (
+                user.id,
+                user.profile.first_name,
+                user.profile.patronymic,
+                user.profile.last_name,
+                user.profile.bio,
+                user.profile.avatar_url,
+                user.profile.timezone,
+                user.profile.locale,
+            )
+            for user in users
+            if user.profile is not None
+        ]
+
+        if self.method == "copy":
+            await self._copy(UserORM.__tablename__, USER_COLUMNS, user_rows)
+            await self._copy(
+                UserProfileORM.__tablename__, PROFILE_COLUMNS, profile_rows
+            )
+        else:
+            await self._insert(UserORM, USER_COLUMNS, user_rows)
+            await self._insert(UserProfileORM, PROFILE_COLUMNS, profile_rows)
+        return list(users)
+
+    async def _copy(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        rows: Sequence[tuple[Any, ...]],
+    ) -> None:
+        """Load rows with ``COPY ... FROM STDIN`` in the session transaction.
+
+        Columns left out, such as timestamps, get their server defaults.
+        """
+        if not rows:
+            return
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+            table_name, records=rows, columns=list(columns)
+        )
+
+    async def _insert(
+        self,
+        model: type[UserORM] | type[UserProfileORM],
+        columns: Sequence[str],
+        rows: Sequence[tuple[Any, ...]],
+    ) -> None:
+        """Load rows with one executemany ``INSERT``."""
+        if not rows:
+            return
+        await self.session.execute(
+            insert(model),
+            [dict(zip(columns, row, strict=True)) for row in rows],
+        )
+
+
+__all__ = ["BulkLoadMethod", "SQLAUserBulkRepository"]
@@ -1,4 +1,7 @@
-from sqlalchemy import select
+from collections.abc import AsyncIterator, Sequence
+from typing import Final
+
+from sqlalchemy import Select, Update, bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -7,7 +10,36 @@ from src.auth.domain.entities.user_profile import UserProfile
 from src.auth.domain.interfaces import IUserRepository
 from src.auth.infra.models.user_orm import UserORM
 from src.auth.infra.models.user_profile_orm import UserProfileORM
+from src.core.database.routing import replica_reads
+from src.core.database.session import release_connection
+from src.core.repository.pagination import Page
 from src.core.repository.sqla import SQLAlchemyRepository
+from src.core.timing import timed
+
+# Hot lookups are built once with bound parameters: SQLAlchemy memoizes the
+# cache key of a statement object, so executions skip both statement
+# construction and cache key generation.
+GET_USER_BY_ID_STMT: Final[Select[tuple[UserORM]]] = (
+    select(UserORM)
+    .options(joinedload(UserORM.profile))
+    .where(UserORM.id == bindparam("user_id"))
+)
+GET_USERS_BY_IDS_STMT: Final[Select[tuple[UserORM]]] = (
+    select(UserORM)
+    .options(joinedload(UserORM.profile))
+    .where(UserORM.id.in_(bindparam("user_ids", expanding=True)))
+)
+GET_USER_BY_EMAIL_STMT: Final[Select[tuple[UserORM]]] = (
+    select(UserORM)
+    .options(joinedload(UserORM.profile))
+    .where(UserORM.email == bindparam("email"))
+)
+
+UPDATE_HASHED_PASSWORD_STMT: Final[Update] = (
+    update(UserORM)
+    .where(UserORM.id == bindparam("user_id"))
+    .values(hashed_password=bindparam("hashed_password"))
+)
 
 
 class SQLAUserRepository(IUserRepository, SQLAlchemyRepository[UserORM]):
@@ -19,6 +51,7 @@ class SQLAUserRepository(IUserRepository, SQLAlchemyRepository[UserORM]):
         """Initialize the user repository."""
         self.session: AsyncSession = session
 
+    @timed("db.user.add")
     async def add_user(self, user: User) -> User:
         """Add user."""
         user_orm: UserORM = self._to_orm(user=user)
@@ -27,37 +60,91 @@ class SQLAUserRepository(IUserRepository, SQLAlchemyRepository[UserORM]):
 
         return self._to_domain(user_orm=user_orm)
 
+    @timed("db.user.get_by_id")
     async def get_by_id(self, id: int) -> User | None:
-        """Get user by email."""
-        stmt = (
-            select(self.model)
-            .options(joinedload(self.model.profile))
-            .where(self.model.id == id)
+        """Get user by id."""
+        with replica_reads(self.session):
+            user_orm: UserORM | None = (
+                await self.session.execute(
+                    GET_USER_BY_ID_STMT, {"user_id": id}
+                )
+            ).scalar_one_or_none()
+        user = None if user_orm is None else self._to_domain(user_orm)
+        await release_connection(self.session)
+        return user
+
+    @timed("db.user.update_hashed_password")
+    async def update_hashed_password(
+        self, user: User, hashed_password: str
+    ) -> None:
+        """Replace the password hash of a user."""
+        await self.session.execute(
+            UPDATE_HASHED_PASSWORD_STMT,
+            {"user_id": user.id, "hashed_password": hashed_password},
         )
 
-        user_orm: UserORM | None = (
-            await self.session.execute(stmt)
-        ).scalar_one_or_none()
-
-        if user_orm is None:
-            return None
-
-        return self._to_domain(user_orm=user_orm)
-
+    @timed("db.user.get_by_ids")
+    async def get_by_ids(self, ids: Sequence[int]) -> dict[int, User]:
+        """Get users by ids in one query.
+
+        Args:
+            ids: User ids.
+
+        Returns:
+            Found users keyed by id; missing ids are omitted.
+        """
+        if not ids:
+            return {}
+        with replica_reads(self.session):
+            user_orms = (
+                await self.session.scalars(
+                    GET_USERS_BY_IDS_STMT, {"user_ids": list(ids)}
+                )
+            ).unique()
+            users = {u.id: self._to_domain(u) for u in user_orms}
+        await release_connection(self.session)
+        return users
+
+    @timed("db.user.get_by_email")
     async def get_by_email(self, email: str) -> User | None:
         """Get user by email."""
-        user_orm: UserORM | None = await self.session.scalar(
-            select(self.model)
-            .where(
-                self.model.email == email,
+        with replica_reads(self.session):
+            user_orm: UserORM | None = await self.session.scalar(
+                GET_USER_BY_EMAIL_STMT, {"email": email}
             )
-            .options(joinedload(self.model.profile))
+        user = None if user_orm is None else self._to_domain(user_orm)
+        await release_connection(self.session)
+        return user
+
+    async def get_page(
+        self, limit: int = 100, cursor: str | None = None
+    ) -> Page[User]:
+        """Get a page of users ordered by id.
+
+        Args:
+            limit: Maximum number of users to return (capped at 1000).
+            cursor: ``next_cursor`` of the previous page.
+        """
+        page = await self._get_page_core(
+            limit=limit,
+            cursor=cursor,
+            options=(joinedload(UserORM.profile),),
         )
-
-        if not user_orm:
-            return None
-
-        return self._to_domain(user_orm=user_orm)
+        users = [self._to_domain(user_orm) for user_orm in page.items]
+        await release_connection(self.session)
+        return Page(items=users, next_cursor=page.next_cursor)
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        """Iterate over all users without loading them all into memory.
+
+        Args:
+            batch_size: Number of users fetched per round trip.
+        """
+        async for user_orm in self._stream_all_core(
+            batch_size=batch_size,
+            options=(joinedload(UserORM.profile),),
+        ):
+            yield self._to_domain(user_orm)
 
     def _to_orm(self, user: User) -> UserORM:
         return UserORM(
@@ -1,9 +1,47 @@
+import asyncio
+import logging
+import statistics
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+from typing import Any, Final, Literal
+
 from passlib.context import CryptContext
+from passlib.hash import argon2
+
+from src.auth.exceptions import PasswordHashingUnavailableError
+from src.auth.metrics import AUTH_METRICS
+from src.core.config import SERVER_SETTINGS as SETTINGS
 
 # from passlib.exc import InvalidHashError
 
+log = logging.getLogger(__name__)
+
+# Only the argon2 costs set explicitly, from calibrate_argon2.py, override
+# the passlib defaults; unset ones keep the defaults existing hashes were
+# made with, so upgrading does not rehash every password.
+_ARGON2_COSTS: Final[dict[str, Any]] = {
+    f"argon2__{name}": value
+    for name, value in (
+        ("time_cost", SETTINGS.AUTH.argon2_time_cost),
+        ("memory_cost", SETTINGS.AUTH.argon2_memory_cost),
+        ("parallelism", SETTINGS.AUTH.argon2_parallelism),
+    )
+    if value is not None
+}
+
+# Hashes made with other argon2 parameters, or with bcrypt, need an update
+# and are rehashed on the next successful login.
 pwd_context = CryptContext(
-    schemes=["argon2", "bcrypt"], default="argon2", deprecated="auto"
+    schemes=["argon2", "bcrypt"],
+    default="argon2",
+    deprecated="auto",
+    **_ARGON2_COSTS,
 )
 
 
@@ -19,6 +57,21 @@ def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def hash_passwords(passwords: Sequence[str]) -> list[str]:
+    """Hash a batch of passwords.
+
+    Submitting a batch per task amortizes the executor round trip when
+    hashing many passwords in a process pool.
+
+    Args:
+        passwords (Sequence[str]): The passwords to hash.
+
+    Returns:
+        list[str]: The hashed passwords, in input order.
+    """
+    return [pwd_context.hash(password) for password in passwords]
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify that a plain-text password matches a hashed password.
 
@@ -35,4 +88,287 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
-__all__ = ["hash_password", "verify_password"]
+def password_needs_update(hashed_password: str) -> bool:
+    """Return whether a hash was made with outdated parameters or scheme.
+
+    Only parses the hash, so it is cheap enough for the event loop.
+
+    Args:
+        hashed_password (str): The hashed password stored in the database.
+
+    Returns:
+        bool: True if the password should be rehashed.
+    """
+    try:
+        return pwd_context.needs_update(hashed_password)
+    except ValueError:
+        return False
+
+
+def is_password_hash(value: str) -> bool:
+    """Return whether a value is a hash of a scheme the context supports.
+
+    Args:
+        value (str): Candidate password hash.
+
+    Returns:
+        bool: True if ``verify_password`` can check passwords against it.
+    """
+    return pwd_context.identify(value, required=False) is not None
+
+
+@dataclass(frozen=True, slots=True)
+class Argon2Parameters:
+    """Argon2 cost parameters; ``memory_cost`` is in KiB."""
+
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+
+
+def measure_argon2(parameters: Argon2Parameters, samples: int = 5) -> float:
+    """Return the median time to verify an argon2 hash, in seconds.
+
+    Args:
+        parameters: Parameters to hash with.
+        samples: Number of timed verifications.
+    """
+    hasher = argon2.using(  # type: ignore[no-untyped-call]
+        time_cost=parameters.time_cost,
+        memory_cost=parameters.memory_cost,
+        parallelism=parameters.parallelism,
+    )
+    hashed_password = hasher.hash("calibration")
+    durations = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.verify("calibration", hashed_password)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def calibrate_argon2(
+    target_seconds: float,
+    memory_budget_kib: int,
+    concurrency: int,
+    parallelism: int = 1,
+    min_memory_cost: int = 19_456,
+    max_time_cost: int = 10,
+    measure: Callable[[Argon2Parameters], float] = measure_argon2,
+) -> Argon2Parameters:
+    """Choose argon2 parameters for this host.
+
+    Memory is preferred over iterations: each of the ``concurrency``
+    concurrent hashes gets an equal share of the memory budget, halved
+    down to ``min_memory_cost`` while a single iteration is slower than
+    the target. Iterations are then added while a verification stays
+    within the target.
+
+    Args:
+        target_seconds: Target verification time.
+        memory_budget_kib: Memory available to concurrent hashes, in KiB.
+        concurrency: Number of hashes running at once, e.g. the hashing
+            pool size.
+        parallelism: Lanes per hash.
+        min_memory_cost: Memory cost not to go below, in KiB.
+        max_time_cost: Maximum number of iterations.
+        measure: Function returning the verification time of parameters.
+
+    Returns:
+        The chosen parameters.
+    """
+    memory_cost = max(
+        8 * parallelism, memory_budget_kib // max(1, concurrency)
+    )
+    while (
+        memory_cost // 2 >= min_memory_cost
+        and measure(Argon2Parameters(1, memory_cost, parallelism))
+        > target_seconds
+    ):
+        memory_cost //= 2
+
+    time_cost = 1
+    while time_cost < max_time_cost and (
+        measure(Argon2Parameters(time_cost + 1, memory_cost, parallelism))
+        <= target_seconds
+    ):
+        time_cost += 1
+    return Argon2Parameters(time_cost, memory_cost, parallelism)
+
+
+def _timed[T](func: Callable[..., T], *args: object) -> tuple[T, float]:
+    """Call ``func`` and return its result with the elapsed time.
+
+    The time is measured inside the pool worker, so it excludes the wait
+    for a free worker and also works for process pools, whose metrics
+    would otherwise be recorded in the child process.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+class PasswordHashingPool:
+    """Bounded executor pool for CPU-bound password hashing.
+
+    Argon2 hashing takes tens of milliseconds of pure CPU time, so it must
+    not run on the event loop. Jobs are submitted to a thread or process
+    pool; once ``max_workers + queue_size`` jobs are in flight, new jobs
+    are rejected with ``PasswordHashingUnavailableError`` (HTTP 503)
+    instead of queueing without bound.
+    """
+
+    def __init__(
+        self,
+        executor_type: Literal["thread", "process"] = "thread",
+        max_workers: int = 4,
+        queue_size: int = 64,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            executor_type: Run jobs in a thread pool or a process pool.
+            max_workers: Number of worker threads/processes.
+            queue_size: Number of jobs allowed to wait for a free worker.
+        """
+        self._executor_type = executor_type
+        self._max_workers = max(1, max_workers)
+        self._capacity = self._max_workers + max(0, queue_size)
+        self._executor: Executor | None = None
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of running and queued jobs."""
+        return self._in_flight
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of running and queued jobs."""
+        return self._capacity
+
+    def _get_executor(self) -> Executor:
+        """Return the executor, creating it on first use.
+
+        The executor is created lazily so that process pools are spawned
+        inside the Gunicorn worker rather than in the master process.
+        """
+        if self._executor is None:
+            if self._executor_type == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="password-hashing",
+                )
+            log.debug(
+                "Password hashing pool started | type=%r, workers=%r",
+                self._executor_type,
+                self._max_workers,
+            )
+        return self._executor
+
+    async def run[T](self, func: Callable[..., T], *args: object) -> T:
+        """Run a hashing function in the pool.
+
+        Args:
+            func: Picklable module-level function to execute.
+            *args: Positional arguments for ``func``.
+
+        Returns:
+            The function result.
+
+        Raises:
+            PasswordHashingUnavailableError: If the pool is saturated.
+        """
+        if self._in_flight >= self._capacity:
+            log.warning(
+                "Password hashing pool saturated | in_flight=%r",
+                self._in_flight,
+            )
+            raise PasswordHashingUnavailableError()
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), func, *args
+            )
+        finally:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        """Shut down the executor and release its workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+HASHING_POOL: Final[PasswordHashingPool] = PasswordHashingPool(
+    executor_type=SETTINGS.AUTH.password_hash_executor,
+    max_workers=SETTINGS.AUTH.password_hash_max_workers,
+    queue_size=SETTINGS.AUTH.password_hash_queue_size,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the hashing pool.
+
+    Args:
+        password (str): The password to hash.
+
+    Returns:
+        str: The hashed password.
+
+    Raises:
+        PasswordHashingUnavailableError: If the hashing pool is saturated.
+    """
+    hashed_password: str
+    elapsed: float
+    hashed_password, elapsed = await HASHING_POOL.run(
+        _timed, hash_password, password
+    )
+    AUTH_METRICS.password_hash_duration.observe(elapsed, ("hash",))
+    return hashed_password
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    """Verify a password in the hashing pool.
+
+    Args:
+        plain_password (str): The plain-text password provided by the user.
+        hashed_password (str): The hashed password stored in the database.
+
+    Returns:
+        bool: True if the passwords match, False otherwise.
+
+    Raises:
+        PasswordHashingUnavailableError: If the hashing pool is saturated.
+    """
+    verified: bool
+    elapsed: float
+    verified, elapsed = await HASHING_POOL.run(
+        _timed, verify_password, plain_password, hashed_password
+    )
+    AUTH_METRICS.password_hash_duration.observe(elapsed, ("verify",))
+    return verified
+
+
+__all__ = [
+    "HASHING_POOL",
+    "Argon2Parameters",
+    "PasswordHashingPool",
+    "calibrate_argon2",
+    "hash_password",
+    "hash_password_async",
+    "hash_passwords",
+    "is_password_hash",
+    "measure_argon2",
+    "password_needs_update",
+    "verify_password",
+    "verify_password_async",
+]
@@ -1,4 +1,21 @@
-from .base import BaseJWTStrategy, TokenPayload
+from .base import (
+    BaseJWTStrategy,
+    PermissionClaims,
+    TokenPayload,
+    UserClaims,
+)
+from .cache import TokenCache
+from .keys import key_id_for, load_private_key, load_public_key
 from .rs256 import RS256JWTStrategy
 
-__all__ = ["BaseJWTStrategy", "RS256JWTStrategy", "TokenPayload"]
+__all__ = [
+    "BaseJWTStrategy",
+    "PermissionClaims",
+    "RS256JWTStrategy",
+    "TokenCache",
+    "TokenPayload",
+    "UserClaims",
+    "key_id_for",
+    "load_private_key",
+    "load_public_key",
+]
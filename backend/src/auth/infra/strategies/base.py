@@ -1,14 +1,63 @@
 from abc import ABC, abstractmethod
+from datetime import timedelta
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.auth.domain.entities.permission_set import PermissionSet
+
+
+class UserClaims(BaseModel):
+    """Minimal user snapshot embedded in access tokens in claims mode."""
+
+    email: str
+    is_active: bool
+    is_superuser: bool
+    is_verified: bool
+    profile_version: int | None = None
+
+
+class PermissionClaims(BaseModel):
+    """Effective permissions embedded in access tokens.
+
+    Serialized compactly as ``{"v": version, "b": bitmap}``, where the
+    bitmap is a ``PermissionSet`` keyed by catalog bit index and the
+    version identifies the permission catalog it was issued against.
+    """
+
+    version: str = Field(alias="v")
+    bitmap: str = Field(alias="b")
+
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+
+    @classmethod
+    def from_permission_set(
+        cls, permissions: PermissionSet, version: str
+    ) -> "PermissionClaims":
+        """Build the claims of a permission set."""
+        return cls(v=version, b=permissions.to_bitmap())
+
+    def to_permission_set(self) -> PermissionSet:
+        """Decode the permission set."""
+        return PermissionSet.from_bitmap(self.bitmap)
 
 
 class TokenPayload(BaseModel):
-    """Token payload model."""
+    """Token payload model.
+
+    Tokens carry a unique ``token_id`` (``jti``); refresh tokens also
+    carry the ``family_id`` (``fam``) shared by all tokens rotated from
+    one login.
+    """
 
     user_id: int
     token_type: str
     scopes: list[str] | None = None
+    user: UserClaims | None = None
+    permissions: PermissionClaims | None = None
+    token_id: str | None = None
+    family_id: str | None = None
+    expires_at: int | None = None
+    issued_at: float | None = None
 
 
 class BaseJWTStrategy(ABC):
@@ -16,14 +65,32 @@ class BaseJWTStrategy(ABC):
 
     @abstractmethod
     def create_access_token(
-        self, user_id: int, scopes: list[str] | None = None
+        self,
+        user_id: int,
+        scopes: list[str] | None = None,
+        user_claims: UserClaims | None = None,
+        permission_claims: PermissionClaims | None = None,
     ) -> str:
         """Create an access token."""
         pass
 
     @abstractmethod
-    def create_refresh_token(self, user_id: int) -> str:
-        """Create a refresh token."""
+    def create_refresh_token(
+        self, user_id: int, family_id: str | None = None
+    ) -> str:
+        """Create a refresh token.
+
+        Args:
+            user_id: Token subject.
+            family_id: Family of the token being rotated; a new family is
+                started when omitted.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def refresh_token_lifetime(self) -> timedelta:
+        """Return the lifetime of refresh tokens."""
         pass
 
     @abstractmethod
@@ -0,0 +1,103 @@
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .base import TokenPayload
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """Cached token payload with its expiration timestamp."""
+
+    payload: TokenPayload
+    expires_at: float
+
+
+class TokenCache:
+    """Bounded LRU cache of verified token payloads.
+
+    Entries are keyed by the SHA-256 digest of the raw token, so the cache
+    never holds usable credentials. An entry is served only while
+    ``now < exp``, which matches PyJWT's own expiration check, so caching
+    never extends the lifetime of a token.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached tokens.
+            clock: Function returning the current UNIX timestamp.
+        """
+        self._max_size = max(1, max_size)
+        self._clock = clock
+        self._entries: OrderedDict[bytes, _CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> TokenPayload | None:
+        """Return the cached payload for a token, or None.
+
+        Args:
+            token: Raw encoded token.
+
+        Returns:
+            Cached payload if present and not expired.
+        """
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.payload
+
+    def set(
+        self, token: str, payload: TokenPayload, expires_at: float
+    ) -> None:
+        """Store a verified payload until its expiration time.
+
+        Args:
+            token: Raw encoded token.
+            payload: Verified token payload.
+            expires_at: Token ``exp`` claim as a UNIX timestamp.
+        """
+        key = self._key(token)
+        self._entries[key] = _CacheEntry(payload, expires_at)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the object."""
+        return (
+            f"<TokenCache size={len(self)}, max_size={self._max_size}, "
+            f"hits={self.hits}, misses={self.misses}>"
+        )
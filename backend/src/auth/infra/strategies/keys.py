@@ -0,0 +1,67 @@
+import base64
+import hashlib
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.rsa import (
+    RSAPrivateKey,
+    RSAPublicKey,
+)
+
+
+def load_private_key(path: str) -> RSAPrivateKey:
+    """Load a PEM encoded RSA private key.
+
+    Args:
+        path: Path to the PEM file.
+
+    Returns:
+        Parsed private key.
+
+    Raises:
+        TypeError: If the file does not contain an RSA private key.
+    """
+    key = serialization.load_pem_private_key(
+        Path(path).read_bytes(), password=None
+    )
+    if not isinstance(key, RSAPrivateKey):
+        raise TypeError(f"Not an RSA private key: {path}")
+    return key
+
+
+def load_public_key(path: str) -> RSAPublicKey:
+    """Load a PEM encoded RSA public key.
+
+    Args:
+        path: Path to the PEM file.
+
+    Returns:
+        Parsed public key.
+
+    Raises:
+        TypeError: If the file does not contain an RSA public key.
+    """
+    key = serialization.load_pem_public_key(Path(path).read_bytes())
+    if not isinstance(key, RSAPublicKey):
+        raise TypeError(f"Not an RSA public key: {path}")
+    return key
+
+
+def key_id_for(public_key: RSAPublicKey) -> str:
+    """Derive a stable key identifier (``kid``) from a public key.
+
+    Args:
+        public_key: RSA public key.
+
+    Returns:
+        URL-safe identifier derived from the SHA-256 of the key's DER form.
+    """
+    der = public_key.public_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    digest = hashlib.sha256(der).digest()[:16]
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+__all__ = ["key_id_for", "load_private_key", "load_public_key"]
@@ -1,82 +1,280 @@
+import time
+import uuid
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from typing import Any
 
 import jwt
+from cryptography.hazmat.primitives.asymmetric.rsa import (
+    RSAPrivateKey,
+    RSAPublicKey,
+)
 
 from src.auth.exceptions import ExpiredTokenError, InvalidTokenError
+from src.auth.metrics import AUTH_METRICS
+from src.core.timing import timed
 
-from .base import BaseJWTStrategy, TokenPayload
+from .base import (
+    BaseJWTStrategy,
+    PermissionClaims,
+    TokenPayload,
+    UserClaims,
+)
+from .cache import TokenCache
+from .keys import key_id_for, load_private_key, load_public_key
 
 
 class RS256JWTStrategy(BaseJWTStrategy):
-    """RS256 JWT strategy."""
+    """RS256 JWT strategy.
+
+    Keys are parsed once into ``cryptography`` key objects, so PyJWT does
+    not re-load the PEM material on every encode/decode call. Tokens are
+    signed with a ``kid`` header; previous public keys can be kept, under
+    the ``kid`` they signed with, for verification while tokens signed
+    with them are still in circulation.
+    """
 
     def __init__(
         self,
-        private_key_path: str,
-        public_key_path: str,
+        private_key_path: str | None = None,
+        public_key_path: str | None = None,
         access_token_expire_minutes: int = 30,
         refresh_token_expire_days: int = 30,
+        decode_cache_size: int = 0,
+        private_key: RSAPrivateKey | None = None,
+        public_key: RSAPublicKey | None = None,
+        key_id: str | None = None,
+        previous_public_keys: Mapping[str, str] | None = None,
     ) -> None:
-        """Initialize the RS256JWTStrategy."""
-        self._private_key = Path(private_key_path).read_text(encoding="utf-8")
-        self._public_key = Path(public_key_path).read_text(encoding="utf-8")
+        """Initialize the RS256JWTStrategy.
+
+        Args:
+            private_key_path: Path to the PEM encoded private key.
+            public_key_path: Path to the PEM encoded public key.
+            access_token_expire_minutes: Access token lifetime.
+            refresh_token_expire_days: Refresh token lifetime.
+            decode_cache_size: Maximum number of verified tokens to cache,
+                0 disables the cache.
+            private_key: Already loaded private key, takes precedence
+                over ``private_key_path``.
+            public_key: Already loaded public key, takes precedence
+                over ``public_key_path``.
+            key_id: ``kid`` of the signing key, derived from the public
+                key when omitted.
+            previous_public_keys: Paths of retired public keys still
+                accepted for verification, by the ``kid`` they signed
+                with. Each key is also accepted under its derived ``kid``.
+
+        Raises:
+            ValueError: If neither a private key nor its path is given.
+        """
+        self._private_key_path = private_key_path
+        self._public_key_path = public_key_path
+        self._previous_public_keys = dict(previous_public_keys or {})
+        self._configured_key_id = key_id
         self._access_expire = access_token_expire_minutes
         self._refresh_expire = refresh_token_expire_days
         self._algorithm = "RS256"
+        self.decode_cache: TokenCache | None = (
+            TokenCache(max_size=decode_cache_size)
+            if decode_cache_size > 0
+            else None
+        )
+        self._set_keys(private_key=private_key, public_key=public_key)
+
+    @property
+    def key_id(self) -> str:
+        """Return the ``kid`` of the current signing key."""
+        return self._key_id
+
+    def _set_keys(
+        self,
+        private_key: RSAPrivateKey | None = None,
+        public_key: RSAPublicKey | None = None,
+    ) -> None:
+        """Load the signing key and the set of verification keys."""
+        if private_key is None:
+            if self._private_key_path is None:
+                raise ValueError("Private key or its path is required")
+            private_key = load_private_key(self._private_key_path)
+        if public_key is None:
+            public_key = (
+                load_public_key(self._public_key_path)
+                if self._public_key_path is not None
+                else private_key.public_key()
+            )
+
+        key_id = self._configured_key_id or key_id_for(public_key)
+        public_keys: dict[str, RSAPublicKey] = {}
+        for previous_id, path in self._previous_public_keys.items():
+            previous_key = load_public_key(path)
+            public_keys[previous_id] = previous_key
+            public_keys.setdefault(key_id_for(previous_key), previous_key)
+        public_keys[key_id] = public_key
+
+        self._private_key = private_key
+        self._public_key = public_key
+        self._public_keys = public_keys
+        self._key_id = key_id
+
+    def reload_keys(
+        self,
+        private_key: RSAPrivateKey | None = None,
+        public_key: RSAPublicKey | None = None,
+    ) -> None:
+        """Reload keys from disk or replace them with the given objects.
+
+        The decode cache is cleared, so tokens signed with a key that is no
+        longer trusted are rejected immediately.
+
+        Args:
+            private_key: New signing key, re-read from disk when omitted.
+            public_key: New public key, re-read from disk when omitted.
+        """
+        self._set_keys(private_key=private_key, public_key=public_key)
+        if self.decode_cache is not None:
+            self.decode_cache.clear()
 
+    @timed("jwt.encode")
     def _encode(self, payload: dict[str, Any]) -> str:
         """Encode a payload."""
-        return jwt.encode(
-            payload, self._private_key, algorithm=self._algorithm
-        )  # type: ignore
+        start = time.perf_counter()
+        # PyJWT < 2 returned bytes, and its stubs still say so.
+        token: str = jwt.encode(  # type: ignore[assignment, unused-ignore]
+            payload,
+            self._private_key,
+            algorithm=self._algorithm,
+            headers={"kid": self._key_id},
+        )
+        AUTH_METRICS.jwt_duration.observe(
+            time.perf_counter() - start, ("encode",)
+        )
+        return token
 
+    @timed("jwt.decode")
     def _decode(self, token: str) -> dict[str, Any]:
-        """Decode a token."""
+        """Decode a token.
+
+        Hits of the decode cache skip this method and are not timed.
+        """
+        start = time.perf_counter()
         try:
-            payload = jwt.decode(
-                token, self._public_key, algorithms=[self._algorithm]
+            key_id = jwt.get_unverified_header(token).get("kid")
+            public_key = (
+                self._public_key
+                if key_id is None
+                else self._public_keys.get(key_id)
+            )
+            if public_key is None:
+                raise InvalidTokenError("Unknown signing key")
+
+            payload: dict[str, Any] = jwt.decode(
+                token, public_key, algorithms=[self._algorithm]
             )
             return payload
         except jwt.ExpiredSignatureError as e:
             raise ExpiredTokenError("Token expired") from e
         except jwt.PyJWTError as e:
             raise InvalidTokenError("Invalid token") from e
+        finally:
+            AUTH_METRICS.jwt_duration.observe(
+                time.perf_counter() - start, ("decode",)
+            )
 
     def create_access_token(
-        self, user_id: int, scopes: list[str] | None = None
+        self,
+        user_id: int,
+        scopes: list[str] | None = None,
+        user_claims: UserClaims | None = None,
+        permission_claims: PermissionClaims | None = None,
     ) -> str:
-        """Create an access token."""
-        expire: datetime = datetime.now(UTC) + timedelta(
-            minutes=self._access_expire
-        )
-        payload: dict[str, str | datetime | list[str]] = {
+        """Create an access token with a ``jti`` for the denylist.
+
+        Args:
+            user_id: Token subject.
+            scopes: Optional token scopes.
+            user_claims: Optional user snapshot, embedded in the ``usr``
+                claim for claims mode.
+            permission_claims: Optional effective permissions, embedded
+                in the ``perm`` claim.
+        """
+        now = datetime.now(UTC)
+        expire: datetime = now + timedelta(minutes=self._access_expire)
+        payload: dict[str, Any] = {
             "sub": str(user_id),
             "exp": expire,
+            "iat": now.timestamp(),
             "token_type": "access",
+            "jti": uuid.uuid4().hex,
         }
         if scopes:
             payload["scopes"] = scopes
+        if user_claims is not None:
+            payload["usr"] = user_claims.model_dump()
+        if permission_claims is not None:
+            payload["perm"] = permission_claims.model_dump(by_alias=True)
         return self._encode(payload)
 
-    def create_refresh_token(self, user_id: int) -> str:
-        """Create a refresh token."""
-        expire: datetime = datetime.now(UTC) + timedelta(
-            days=self._refresh_expire
-        )
-        payload: dict[str, str | datetime | list[str]] = {
+    @property
+    def refresh_token_lifetime(self) -> timedelta:
+        """Return the lifetime of refresh tokens."""
+        return timedelta(days=self._refresh_expire)
+
+    def create_refresh_token(
+        self, user_id: int, family_id: str | None = None
+    ) -> str:
+        """Create a refresh token with a new ``jti``.
+
+        Args:
+            user_id: Token subject.
+            family_id: Family of the token being rotated; a new family is
+                started when omitted.
+        """
+        now = datetime.now(UTC)
+        expire: datetime = now + self.refresh_token_lifetime
+        payload: dict[str, str | float | datetime] = {
             "sub": str(user_id),
             "exp": expire,
+            "iat": now.timestamp(),
             "token_type": "refresh",
+            "jti": uuid.uuid4().hex,
+            "fam": family_id or uuid.uuid4().hex,
         }
         return self._encode(payload)
 
     def decode_token(self, token: str) -> TokenPayload:
-        """Decode a token."""
+        """Decode a token.
+
+        Verified payloads are served from the decode cache until the token
+        expires, skipping the RSA signature verification.
+        """
+        if self.decode_cache is not None:
+            cached_payload = self.decode_cache.get(token)
+            if cached_payload is not None:
+                return cached_payload
+
         payload = self._decode(token)
-        return TokenPayload(
+        token_payload = TokenPayload(
             user_id=int(payload["sub"]),
             token_type=payload["token_type"],
             scopes=payload.get("scopes"),
+            user=(
+                UserClaims.model_validate(payload["usr"])
+                if "usr" in payload
+                else None
+            ),
+            permissions=(
+                PermissionClaims.model_validate(payload["perm"])
+                if "perm" in payload
+                else None
+            ),
+            token_id=payload.get("jti"),
+            family_id=payload.get("fam"),
+            expires_at=payload["exp"],
+            issued_at=payload.get("iat"),
         )
+        if self.decode_cache is not None:
+            self.decode_cache.set(
+                token, token_payload, expires_at=float(payload["exp"])
+            )
+        return token_payload
@@ -1,8 +1,33 @@
+from types import TracebackType
+from typing import TYPE_CHECKING
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.infra.repositories.cached_user_repository import (
+    USER_CACHE,
+    CachedUserRepository,
+)
+from src.auth.infra.repositories.permission_repository import (
+    SQLAPermissionRepository,
+)
+from src.auth.infra.repositories.revocation_store import (
+    MEMORY_REVOCATION_STORE,
+    SQLARevocationStore,
+)
+from src.auth.infra.repositories.user_bulk_repository import (
+    BulkLoadMethod,
+    SQLAUserBulkRepository,
+)
 from src.auth.infra.repositories.user_repository import SQLAUserRepository
+from src.core.batch_loader import BatchLoader
 from src.core.database.unitofwork import SQLAUnitOfWork
 
+if TYPE_CHECKING:
+    from src.auth.domain.interfaces import (
+        IRevocationStore,
+        IUserRepository,
+    )
+
 
 class AuthUnitOfWork(SQLAUnitOfWork):
     """Auth unit of work."""
@@ -10,8 +35,62 @@ class AuthUnitOfWork(SQLAUnitOfWork):
     def __init__(self, session: AsyncSession) -> None:
         """Initialize the auth unit of work."""
         super().__init__(session)
-        self.user_repo = SQLAUserRepository(session)
+        sqla_user_repo = SQLAUserRepository(session)
+        self.user_repo: IUserRepository = sqla_user_repo
+        self._cached_user_repo: CachedUserRepository | None = None
+        if USER_CACHE is not None:
+            # Coalesces the id lookups of one request that miss the cache
+            # into IN (...) queries.
+            self._cached_user_repo = CachedUserRepository(
+                sqla_user_repo,
+                USER_CACHE,
+                loader=BatchLoader(sqla_user_repo.get_by_ids),
+            )
+            self.user_repo = self._cached_user_repo
         self.profile_repo = SQLAUserRepository(session)
+        self.permission_repo = SQLAPermissionRepository(session)
+        self.revocation_store: IRevocationStore = (
+            MEMORY_REVOCATION_STORE or SQLARevocationStore(session)
+        )
+
+    async def commit(self) -> None:
+        """Commit, then drop the written users from the user cache."""
+        await super().commit()
+        if self._cached_user_repo is not None:
+            await self._cached_user_repo.apply_invalidations()
+
+    async def rollback(self) -> None:
+        """Roll back and forget the users written in the transaction."""
+        await super().rollback()
+        if self._cached_user_repo is not None:
+            self._cached_user_repo.discard_invalidations()
+
+
+class UserImportUnitOfWork(SQLAUnitOfWork):
+    """Unit of work for one bulk import chunk.
+
+    The unit of work owns its session and closes it on exit, so each chunk
+    commits or rolls back on its own connection checkout.
+    """
+
+    def __init__(
+        self, session: AsyncSession, method: BulkLoadMethod = "copy"
+    ) -> None:
+        """Initialize the import unit of work."""
+        super().__init__(session)
+        self.user_bulk_repo = SQLAUserBulkRepository(session, method=method)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Commit or roll back, then close the session."""
+        try:
+            await super().__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            await self._session.close()
 
 
-_all__ = ["AuthUnitOfWork"]
+_all__ = ["AuthUnitOfWork", "UserImportUnitOfWork"]
@@ -0,0 +1,95 @@
+import contextlib
+import time
+from collections.abc import Iterator
+from typing import Final
+
+from src.auth.exceptions import AuthBaseError
+from src.core.metrics import METRICS_REGISTRY, MetricsRegistry
+
+PASSWORD_HASH_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+JWT_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+)
+
+
+class AuthMetrics:
+    """Outcomes and latencies of the authentication flows."""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        """Register the auth metrics.
+
+        Args:
+            registry: Registry the metrics are exported from.
+        """
+        self.operations = registry.counter(
+            "auth_operations",
+            "Authentication operations by operation and outcome.",
+            labelnames=("operation", "outcome"),
+        )
+        self.operation_duration = registry.histogram(
+            "auth_operation_duration_seconds",
+            "Duration of authentication operations.",
+            labelnames=("operation",),
+        )
+        self.password_hash_duration = registry.histogram(
+            "auth_password_hash_duration_seconds",
+            "CPU time of password hashing and verification.",
+            labelnames=("operation",),
+            buckets=PASSWORD_HASH_BUCKETS,
+        )
+        self.jwt_duration = registry.histogram(
+            "auth_jwt_duration_seconds",
+            "Duration of JWT signing and verification.",
+            labelnames=("operation",),
+            buckets=JWT_BUCKETS,
+        )
+
+    @contextlib.contextmanager
+    def track(self, operation: str) -> Iterator[None]:
+        """Count and time an operation.
+
+        The outcome is ``success``, the class name of the ``AuthBaseError``
+        raised, or ``error`` for any other exception.
+
+        Args:
+            operation: Operation name, e.g. ``login``.
+        """
+        outcome = "success"
+        start = time.perf_counter()
+        try:
+            yield
+        except AuthBaseError as e:
+            outcome = type(e).__name__
+            raise
+        except BaseException:
+            outcome = "error"
+            raise
+        finally:
+            self.operation_duration.observe(
+                time.perf_counter() - start, (operation,)
+            )
+            self.operations.inc(labels=(operation, outcome))
+
+
+AUTH_METRICS: Final[AuthMetrics] = AuthMetrics(METRICS_REGISTRY)
+
+
+__all__ = ["AUTH_METRICS", "AuthMetrics"]
@@ -0,0 +1,138 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+
+
+class BatchLoader[K: Hashable, V]:
+    """Coalesces individual lookups into batched calls.
+
+    Keys requested with ``load`` during the same event loop iteration are
+    collected and resolved by a single call to ``batch_fn`` on the next
+    iteration. Keys are deduplicated, and with ``cache`` enabled every key
+    is loaded at most once for the lifetime of the loader, so a loader is
+    meant to live for one request (or unit of work).
+
+    Batches are executed one at a time, which keeps a loader bound to an
+    ``AsyncSession`` safe: the session never sees concurrent statements
+    from the same loader.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        max_batch_size: int = 1000,
+        cache: bool = True,
+    ) -> None:
+        """Initialize the loader.
+
+        Args:
+            batch_fn: Loads a list of unique keys, returning the values
+                found; missing keys resolve to None.
+            max_batch_size: Maximum number of keys per ``batch_fn`` call.
+            cache: Keep loaded values and serve repeated keys from memory.
+        """
+        self._batch_fn = batch_fn
+        self._max_batch_size = max(1, max_batch_size)
+        self._cache = cache
+        self._futures: dict[K, asyncio.Future[V | None]] = {}
+        self._queue: list[K] = []
+        self._scheduled = False
+        self._lock = asyncio.Lock()
+        self.batches = 0
+
+    async def load(self, key: K) -> V | None:
+        """Load a value, batched with the other keys of this iteration.
+
+        Args:
+            key: Key to load.
+
+        Returns:
+            The value, or None if not found.
+        """
+        future = self._futures.get(key)
+        if future is None or future.cancelled():
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            self._queue.append(key)
+            if not self._scheduled:
+                self._scheduled = True
+                loop.call_soon(self._dispatch)
+        # Shielded, so a cancelled caller does not cancel the shared
+        # future other callers of the same key are waiting on.
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        """Load several values in one batch.
+
+        Args:
+            keys: Keys to load, may contain duplicates.
+
+        Returns:
+            Values in the order of ``keys``.
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Store an already known value, e.g. after a write."""
+        if not self._cache:
+            return
+        future = self._futures.get(key)
+        if future is None or future.done():
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def clear(self, *keys: K) -> None:
+        """Forget cached values, so the next load hits ``batch_fn``."""
+        for key in keys:
+            future = self._futures.get(key)
+            if future is not None and future.done():
+                del self._futures[key]
+
+    def clear_all(self) -> None:
+        """Forget all cached values."""
+        for key in [k for k, f in self._futures.items() if f.done()]:
+            del self._futures[key]
+
+    def _dispatch(self) -> None:
+        """Start loading the keys queued during this loop iteration."""
+        self._scheduled = False
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self._max_batch_size):
+            batch = queue[start : start + self._max_batch_size]
+            task = asyncio.ensure_future(self._run_batch(batch))
+            task.add_done_callback(_consume_exception)
+
+    async def _run_batch(self, keys: list[K]) -> None:
+        """Call ``batch_fn`` and resolve the futures of ``keys``."""
+        futures = [self._futures[key] for key in keys]
+        try:
+            async with self._lock:
+                self.batches += 1
+                values = await self._batch_fn(keys)
+        except Exception as e:
+            # Failed keys are not cached, the next load retries them.
+            for key, future in zip(keys, futures, strict=True):
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+        for key, future in zip(keys, futures, strict=True):
+            if not self._cache and self._futures.get(key) is future:
+                del self._futures[key]
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+def _consume_exception(task: asyncio.Task[None]) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+__all__ = ["BatchLoader"]
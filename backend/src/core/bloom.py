@@ -0,0 +1,84 @@
+import hashlib
+import math
+from collections.abc import Iterable
+
+
+class BloomFilter:
+    """Probabilistic set of strings without false negatives.
+
+    ``item in bloom`` is False for every item that was never added, except
+    for a false positive rate of about ``error_rate`` while no more than
+    ``capacity`` items are added. Items cannot be removed; rebuild the
+    filter to forget them.
+
+    Bit positions are derived from one 128-bit BLAKE2b digest with double
+    hashing, so a lookup costs one hash and ``hash_count`` bit tests.
+    """
+
+    __slots__ = ("_bits", "_count", "capacity", "hash_count", "size")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """Size the filter for a capacity and a false positive rate.
+
+        Args:
+            capacity: Expected number of items.
+            error_rate: False positive rate at ``capacity`` items.
+
+        Raises:
+            ValueError: If ``error_rate`` is not between 0 and 1.
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = max(1, capacity)
+        self.size = max(
+            8,
+            math.ceil(
+                -self.capacity * math.log(error_rate) / math.log(2) ** 2
+            ),
+        )
+        self.hash_count = max(
+            1, round(self.size / self.capacity * math.log(2))
+        )
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        """Add an item."""
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        """Add several items."""
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: object) -> bool:
+        """Return whether the item may have been added."""
+        if not isinstance(item, str):
+            return False
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of ``add`` calls, duplicates included."""
+        return self._count
+
+    @property
+    def saturated(self) -> bool:
+        """Return whether more items than ``capacity`` were added."""
+        return self._count > self.capacity
+
+
+__all__ = ["BloomFilter"]
@@ -0,0 +1,5 @@
+__all__ = ["CacheBackend", "InMemoryCache", "ReadThroughCache"]
+
+from .base import CacheBackend
+from .memory import InMemoryCache
+from .read_through import ReadThroughCache
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class CacheBackend[V](ABC):
+    """Key-value cache backend with per-entry TTL."""
+
+    @abstractmethod
+    async def get(self, key: str) -> V | None:
+        """Return the cached value, or None if missing or expired."""
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: V, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds."""
+        ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Remove the given keys."""
+        ...
@@ -0,0 +1,62 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from .base import CacheBackend
+
+
+class InMemoryCache[V](CacheBackend[V]):
+    """In-process LRU cache with per-entry TTL.
+
+    Used as the local tier of ``ReadThroughCache`` and as an in-memory fake
+    of a shared backend in tests.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries.
+            clock: Function returning the current time in seconds.
+        """
+        self._max_size = max(1, max_size)
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[V, float]] = OrderedDict()
+
+    async def get(self, key: str) -> V | None:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: V, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds."""
+        self._entries[key] = (value, self._clock() + ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        """Remove the given keys."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of entries, including expired ones."""
+        return len(self._entries)
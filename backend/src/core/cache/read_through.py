@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from .base import CacheBackend
+from .memory import InMemoryCache
+
+log = logging.getLogger(__name__)
+
+
+class ReadThroughCache[V]:
+    """Two-tier read-through cache with stampede protection.
+
+    Lookups check the in-process tier first, then the optional shared tier
+    (e.g. Redis), then call the loader. Concurrent lookups of the same cold
+    key share a single loader call. Values loaded while an invalidation
+    was in progress are returned but not stored, so an invalidation is
+    never overwritten by stale data.
+    """
+
+    def __init__(
+        self,
+        local: InMemoryCache[V],
+        shared: CacheBackend[V] | None = None,
+        ttl: float = 30.0,
+        shared_ttl: float | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            local: In-process cache tier.
+            shared: Optional cache tier shared between workers.
+            ttl: Local tier TTL in seconds.
+            shared_ttl: Shared tier TTL in seconds, defaults to ``ttl``.
+        """
+        self._local = local
+        self._shared = shared
+        self._ttl = ttl
+        self._shared_ttl = ttl if shared_ttl is None else shared_ttl
+        self._pending: dict[str, asyncio.Future[V | None]] = {}
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> V | None:
+        """Return a cached value from either tier without loading it."""
+        value = await self._local.get(key)
+        if value is not None:
+            return value
+
+        if self._shared is not None:
+            value = await self._shared.get(key)
+            if value is not None:
+                await self._local.set(key, value, self._ttl)
+        return value
+
+    async def set(self, *keys: str, value: V) -> None:
+        """Store a value under one or more keys in both tiers."""
+        for key in keys:
+            await self._local.set(key, value, self._ttl)
+            if self._shared is not None:
+                await self._shared.set(key, value, self._shared_ttl)
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[V | None]],
+        aliases: Callable[[V], tuple[str, ...]] | None = None,
+    ) -> V | None:
+        """Return a cached value or load it exactly once.
+
+        Args:
+            key: Cache key.
+            loader: Coroutine factory loading the value from the source.
+            aliases: Optional function returning additional keys the
+                loaded value is stored under.
+
+        Returns:
+            The value, or None if the loader found nothing. Missing values
+            are not cached.
+        """
+        value = await self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future: asyncio.Future[V | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending[key] = future
+        epoch = self._epoch
+        try:
+            value = await loader()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark the exception as retrieved when nobody is waiting.
+                future.exception()
+            raise
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+        if value is not None and epoch == self._epoch:
+            keys = (key, *aliases(value)) if aliases is not None else (key,)
+            await self.set(*keys, value=value)
+        future.set_result(value)
+        return value
+
+    async def invalidate(self, *keys: str) -> None:
+        """Remove keys from both tiers and discard in-flight loads."""
+        self._epoch += 1
+        for key in keys:
+            self._pending.pop(key, None)
+        await self._local.delete(*keys)
+        if self._shared is not None:
+            await self._shared.delete(*keys)
+        log.debug("Cache keys invalidated | keys=%r", keys)
@@ -5,8 +5,10 @@ __all__ = [
     "DatabaseSettings",
     "GunicornSettings",
     "LggingSettings",
+    "MetricsSettings",
     "ProjectSettings",
     "setup_logging",
+    "shutdown_logging",
 ]
 
 from .classes import (
@@ -15,7 +17,8 @@ from .classes import (
     DatabaseSettings,
     GunicornSettings,
     LggingSettings,
+    MetricsSettings,
     ProjectSettings,
 )
 from .constants import SERVER_SETTINGS
-from .logging import setup_logging
+from .logging import setup_logging, shutdown_logging
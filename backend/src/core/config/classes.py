@@ -35,6 +35,13 @@ class LggingSettings(BaseModel):
     log_level: LogLevel = "DEBUG"
     log_format: str = "%(asctime)s %(levelname)6s %(name)s: %(message)s"
     log_date_format: str = "%Y-%m-%d %H:%M:%S"
+    log_json: bool = False
+    log_queue_enabled: bool = True
+    log_queue_size: int = 10_000
+    debug_log_header: str = "X-Debug-Log"
+    debug_log_token: SecretStr | None = None
+    debug_log_sample_rate: float = 0.0
+    debug_log_user_ids: list[int] = []
     sentry_dsn: HttpUrl | None = None
     sentry_traces_sample_rate: float = 1.0
     sentry_log_level: LogLevel = "ERROR"
@@ -85,6 +92,13 @@ class DatabaseSettings(BaseModel):
     autoflush: bool = False
     autocommit: bool = False
     expire_on_commit: bool = False
+    prepared_statement_cache_size: int = 100
+    early_release: bool = True
+    read_replica_hosts: list[str] = []
+    read_replica_routing: Literal["round_robin", "least_loaded"] = (
+        "round_robin"
+    )
+    read_your_writes_seconds: float = 5.0
 
     naming_convention: dict[str, str] = {
         "ix": "ix_%(column_0_label)s",
@@ -107,6 +121,28 @@ class DatabaseSettings(BaseModel):
             path=self.db_name,
         )
 
+    @property
+    def read_replica_uris(self) -> list[PostgresDsn]:
+        """Get PostgreSQL DSNs of the read replicas.
+
+        Replica hosts are given as ``host`` or ``host:port`` and share the
+        credentials and database name of the primary.
+        """
+        uris: list[PostgresDsn] = []
+        for replica in self.read_replica_hosts:
+            host, _, port = replica.partition(":")
+            uris.append(
+                PostgresDsn.build(
+                    scheme="postgresql+asyncpg",
+                    username=self.user,
+                    password=self.user_password,
+                    host=host,
+                    port=int(port) if port else self.port,
+                    path=self.db_name,
+                )
+            )
+        return uris
+
 
 class GunicornSettings(BaseModel):
     """Gunicorn settings configuration."""
@@ -136,6 +172,53 @@ class AuthSettings(BaseModel):
     jwt_refresh_token_expire_days: int = 30
     jwt_private_key_path: str
     jwt_public_key_path: str
+    jwt_key_id: str | None = None
+    jwt_previous_public_keys: dict[str, str] = {}
+    jwt_decode_cache_size: int = 10_000
+    jwt_claims_mode: bool = False
+    jwt_embed_permissions: bool = True
+    refresh_token_rotation: bool = True
+    refresh_token_reuse_grace_seconds: float = 10.0
+    access_token_denylist: bool = True
+    token_revocation_store: Literal["database", "memory"] = "database"
+    revocation_filter_capacity: int = 100_000
+    revocation_filter_error_rate: float = 0.001
+    revocation_sync_interval_seconds: float = 5.0
+    revocation_rebuild_interval_seconds: float = 3600.0
+    login_rate_limit_enabled: bool = True
+    login_rate_limit_per_email: int = 10
+    login_rate_limit_per_ip: int = 100
+    login_rate_limit_window_seconds: float = 300.0
+    login_rate_limit_max_keys: int = 100_000
+    unknown_user_strategy: Literal["dummy_hash", "delay", "none"] = (
+        "dummy_hash"
+    )
+    unknown_user_verify_limit: int = 1
+    unknown_user_window_seconds: float = 300.0
+    unknown_user_max_keys: int = 100_000
+    # Unset costs keep the passlib defaults existing hashes were made with.
+    argon2_time_cost: int | None = None
+    argon2_memory_cost: int | None = None
+    argon2_parallelism: int | None = None
+    password_hash_executor: Literal["thread", "process"] = "thread"
+    password_hash_max_workers: int = 4
+    password_hash_queue_size: int = 64
+    user_cache_enabled: bool = True
+    user_cache_ttl_seconds: float = 30.0
+    user_cache_max_size: int = 10_000
+    permission_cache_ttl_seconds: float = 60.0
+    permission_cache_max_size: int = 10_000
+
+
+class MetricsSettings(BaseModel):
+    """Metrics settings configuration."""
+
+    enabled: bool = True
+    path: str = "/metrics"
+    multiprocess_dir: str | None = None
+    multiprocess_flush_interval: float = 5.0
+    server_timing: bool = False
+    phase_sentry_spans: bool = False
 
 
 class AdminSettings(BaseSettings):
@@ -163,3 +246,4 @@ class ServerSettings(BaseConfiguration):
     ADMIN_USER: AdminSettings
     API_PREFIX: ApiPrefix = ApiPrefix()
     LOGGING: LggingSettings = LggingSettings()
+    METRICS: MetricsSettings = MetricsSettings()
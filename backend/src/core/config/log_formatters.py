@@ -0,0 +1,183 @@
+import json
+import logging
+import time
+from collections.abc import Callable
+from json.encoder import encode_basestring
+from typing import Any, Final, cast
+
+from src.core.request_context import get_request_id, get_user_id
+
+# orjson is optional; the ignores cover environments with and without it.
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+# Attributes every LogRecord has; anything else was passed with ``extra``.
+RESERVED_ATTRS: Final[frozenset[str]] = frozenset((
+    *logging.makeLogRecord({}).__dict__,
+    "message",
+    "asctime",
+    "request_id",
+    "user_id",
+))
+
+_json_encoder = json.JSONEncoder(
+    ensure_ascii=False,
+    check_circular=False,
+    separators=(",", ":"),
+    default=str,
+)
+
+
+def encode_value(value: Any) -> str:  # noqa: ANN401
+    """Encode a log field value as JSON, falling back to ``str``."""
+    if type(value) is str:
+        return encode_basestring(value)
+    if type(value) is int:
+        return str(value)
+    if orjson is not None:
+        return cast("str", orjson.dumps(value, default=str).decode())
+    return _json_encoder.encode(value)
+
+
+class LazyValue:
+    """Log field computed only when the record is formatted.
+
+    Pass expensive values with ``extra={"name": lazy(func, *args)}``: the
+    function runs on the logging thread and only for records that pass
+    the level checks.
+    """
+
+    __slots__ = ("_args", "_func")
+
+    def __init__(self, func: Callable[..., Any], *args: Any) -> None:  # noqa: ANN401
+        """Initialize the value.
+
+        Args:
+            func: Function computing the value.
+            args: Positional arguments of ``func``.
+        """
+        self._func = func
+        self._args = args
+
+    def resolve(self) -> Any:  # noqa: ANN401
+        """Compute the value."""
+        return self._func(*self._args)
+
+    def __str__(self) -> str:
+        """Return the computed value as a string."""
+        return str(self.resolve())
+
+    def __repr__(self) -> str:
+        """Return the representation of the computed value."""
+        return repr(self.resolve())
+
+
+def lazy(func: Callable[..., Any], *args: Any) -> LazyValue:  # noqa: ANN401
+    """Defer computing a log field until the record is formatted."""
+    return LazyValue(func, *args)
+
+
+def install_context_record_factory() -> None:
+    """Stamp the request and user ids on every log record.
+
+    Records are stamped when they are created, on the logging thread,
+    because they may be formatted later on another thread where the
+    request context is not visible.
+    """
+    factory = logging.getLogRecordFactory()
+    if getattr(factory, "stamps_request_context", False):
+        return
+
+    def record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:  # noqa: ANN401
+        record = factory(*args, **kwargs)
+        record.request_id = get_request_id()
+        record.user_id = get_user_id()
+        return record
+
+    record_factory.stamps_request_context = True  # type: ignore[attr-defined]
+    logging.setLogRecordFactory(record_factory)
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line.
+
+    Records carry ``time`` (UTC), ``level``, ``logger``, ``message`` and
+    the source location, the request and user ids when set, every
+    ``extra`` field (resolving ``LazyValue`` fields) and the formatted
+    exception. The fixed fields are assembled directly with the C string
+    escaper of the json module; other values are encoded with orjson when
+    it is installed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the formatter."""
+        super().__init__()
+        self._second: tuple[int, str] = (-1, "")
+
+    def _format_time(self, created: float) -> str:
+        """Format a timestamp, rendering the date part once per second."""
+        second = int(created)
+        cached_second, prefix = self._second
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1000):03d}Z"
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as JSON."""
+        parts = [
+            f'{{"time":"{self._format_time(record.created)}"'
+            f',"level":{encode_basestring(record.levelname)}'
+            f',"logger":{encode_basestring(record.name)}'
+            f',"message":{encode_basestring(record.getMessage())}'
+            f',"func":{encode_basestring(record.funcName or "")}'
+            f',"line":{record.lineno}'
+        ]
+        request_id = getattr(record, "request_id", None)
+        if request_id is not None:
+            parts.append(f',"request_id":{encode_value(request_id)}')
+        user_id = getattr(record, "user_id", None)
+        if user_id is not None:
+            parts.append(f',"user_id":{encode_value(user_id)}')
+
+        for key in record.__dict__.keys() - RESERVED_ATTRS:
+            value = record.__dict__[key]
+            if isinstance(value, LazyValue):
+                value = value.resolve()
+            parts.append(f",{encode_basestring(key)}:{encode_value(value)}")
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            parts.append(f',"exc_info":{encode_basestring(record.exc_text)}')
+        if record.stack_info:
+            stack = self.formatStack(record.stack_info)
+            parts.append(f',"stack_info":{encode_basestring(stack)}')
+        parts.append("}")
+        return "".join(parts)
+
+
+def make_formatter(
+    json_format: bool, fmt: str, datefmt: str
+) -> logging.Formatter:
+    """Create the log formatter selected in the settings.
+
+    Args:
+        json_format: Format records as JSON.
+        fmt: Text format string.
+        datefmt: Text date format.
+    """
+    if json_format:
+        return JsonFormatter()
+    return logging.Formatter(fmt=fmt, datefmt=datefmt)
+
+
+__all__ = [
+    "JsonFormatter",
+    "LazyValue",
+    "install_context_record_factory",
+    "lazy",
+    "make_formatter",
+]
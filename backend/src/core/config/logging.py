@@ -1,14 +1,225 @@
+import atexit
 import logging
+import os
+import queue
+from collections.abc import Sequence
+from logging.handlers import QueueHandler, QueueListener
+from typing import Final
 
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
 from sentry_sdk.integrations.logging import LoggingIntegration
 
+from src.core.metrics import METRICS_REGISTRY
+from src.core.request_context import (
+    DebugLogPolicy,
+    configure_debug_logging,
+    debug_logging_enabled,
+)
+
 from .constants import SERVER_SETTINGS as SETTINGS
+from .log_formatters import install_context_record_factory, make_formatter
+
+# Loggers run at DEBUG while a debug log policy is active. Third-party
+# loggers (e.g. ``sqlalchemy.engine``, which would render statements and
+# rows for every query) keep ``log_level``.
+DEBUG_LOGGERS: Final[tuple[str, ...]] = ("src",)
+
+LOG_RECORDS_DROPPED = METRICS_REGISTRY.counter(
+    "log_records_dropped",
+    "Log records dropped because the logging queue was full.",
+)
+
+
+class RequestLevelFilter(logging.Filter):
+    """Drops records below a level unless the request is logged at DEBUG.
+
+    Installed on the root handler while the ``DEBUG_LOGGERS`` run at
+    DEBUG, so their level is enforced here and requests selected by the
+    ``DebugLogPolicy`` bypass it. Runs on the thread emitting the record,
+    where the request context is visible.
+    """
+
+    def __init__(self, level: int) -> None:
+        """Initialize the filter.
+
+        Args:
+            level: Level of records logged for every request.
+        """
+        super().__init__()
+        self.level = level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return whether the record is logged."""
+        return record.levelno >= self.level or debug_logging_enabled()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that never blocks the logging thread.
+
+    Only the message is rendered on the calling thread, so later changes
+    to the arguments do not leak into the record; formatting, exception
+    rendering and I/O happen on the listener thread. When the queue is
+    full the record is dropped and counted instead of waiting.
+    """
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord]) -> None:
+        """Initialize the handler.
+
+        Args:
+            log_queue: Bounded queue drained by a ``LogQueueListener``.
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Freeze the message of a record before it is queued."""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record, dropping it when the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.inc()
+
+
+class LogQueueListener(QueueListener):
+    """Queue listener writing records on a background thread.
+
+    Records dropped by the queue handler are reported with a warning
+    before the next record the listener writes.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue[logging.LogRecord],
+        queue_handler: DroppingQueueHandler,
+        *handlers: logging.Handler,
+    ) -> None:
+        """Initialize the listener.
+
+        Args:
+            log_queue: Queue to drain.
+            queue_handler: Handler feeding the queue.
+            handlers: Handlers writing the records.
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self._queue_handler = queue_handler
+        self._reported_drops = 0
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Write a record, reporting drops since the last record first."""
+        dropped = self._queue_handler.dropped
+        if dropped > self._reported_drops:
+            super().handle(
+                logging.makeLogRecord({
+                    "name": __name__,
+                    "levelno": logging.WARNING,
+                    "levelname": logging.getLevelName(logging.WARNING),
+                    "msg": "Logging queue full, %d records dropped",
+                    "args": (dropped - self._reported_drops,),
+                })
+            )
+            self._reported_drops = dropped
+        super().handle(record)
+
+    def enqueue_sentinel(self) -> None:
+        """Queue the stop sentinel, waiting for space if needed."""
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+
+_listener: LogQueueListener | None = None
+_handlers: list[logging.Handler] = []
+_root_filters: list[logging.Filter] = []
+
+
+def _configure_root(handler: logging.Handler) -> None:
+    """Make ``handler`` the only root handler."""
+    for root_filter in _root_filters:
+        handler.addFilter(root_filter)
+    logging.basicConfig(
+        level=SETTINGS.LOGGING.log_level, handlers=[handler], force=True
+    )
+
+
+def configure_debug_loggers(active: bool) -> None:
+    """Raise the application loggers to DEBUG for a debug log policy.
+
+    Args:
+        active: Whether a debug log policy is active; when it is not, the
+            loggers inherit the root level again.
+    """
+    level = logging.DEBUG if active else logging.NOTSET
+    for name in DEBUG_LOGGERS:
+        logging.getLogger(name).setLevel(level)
+    if active:
+        _root_filters[:] = [
+            RequestLevelFilter(
+                logging.getLevelName(SETTINGS.LOGGING.log_level)
+            )
+        ]
+    else:
+        _root_filters.clear()
+
+
+def _start_queue(handlers: Sequence[logging.Handler]) -> None:
+    """Route root logging through a queue drained by a listener thread."""
+    global _listener  # noqa: PLW0603
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(
+        maxsize=SETTINGS.LOGGING.log_queue_size
+    )
+    queue_handler = DroppingQueueHandler(log_queue)
+    _listener = LogQueueListener(log_queue, queue_handler, *handlers)
+    _configure_root(queue_handler)
+    _listener.start()
+
+
+def _restart_after_fork() -> None:
+    """Start a new listener in a forked child.
+
+    The listener thread does not survive ``fork`` (e.g. Gunicorn workers
+    of a preloaded app), and the old queue may be locked by it.
+    """
+    global _listener  # noqa: PLW0603
+
+    if _listener is not None:
+        _listener = None
+        _start_queue(_handlers)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and write further records synchronously.
+
+    Called on application shutdown; safe to call more than once.
+    """
+    global _listener
+
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    _configure_root(_handlers[0])
 
 
 def setup_logging() -> None:
-    """Apply logging configuration from settings."""
+    """Apply logging configuration from settings.
+
+    Records carry the request and user ids of the request they were
+    emitted in and are written as text or, with ``log_json``, as JSON.
+    With ``log_queue_enabled`` the root logger only puts records on a
+    bounded queue, and a background thread formats and writes them, so
+    logging calls on the event loop never wait for stderr.
+
+    When a debug log policy is configured (header token, sample rate or
+    user ids), the application loggers run at DEBUG and a
+    ``RequestLevelFilter`` on the root handler applies ``log_level`` to
+    all other requests. Third-party loggers always run at ``log_level``.
+    """
     if SETTINGS.LOGGING.sentry_dsn and SETTINGS.ENVIRONMENT != "local":
         sentry_sdk.init(
             dsn=str(SETTINGS.LOGGING.sentry_dsn),
@@ -26,9 +237,37 @@ def setup_logging() -> None:
             ],
         )
 
-    logging.basicConfig(
-        level=SETTINGS.LOGGING.log_level,
-        format=SETTINGS.LOGGING.log_format,
-        datefmt=SETTINGS.LOGGING.log_date_format,
-        force=True,
+    shutdown_logging()
+
+    policy = DebugLogPolicy(
+        header=SETTINGS.LOGGING.debug_log_header,
+        token=(
+            SETTINGS.LOGGING.debug_log_token.get_secret_value()
+            if SETTINGS.LOGGING.debug_log_token is not None
+            else None
+        ),
+        sample_rate=SETTINGS.LOGGING.debug_log_sample_rate,
+        user_ids=frozenset(SETTINGS.LOGGING.debug_log_user_ids),
     )
+    configure_debug_logging(policy)
+    configure_debug_loggers(policy.active)
+
+    install_context_record_factory()
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        make_formatter(
+            json_format=SETTINGS.LOGGING.log_json,
+            fmt=SETTINGS.LOGGING.log_format,
+            datefmt=SETTINGS.LOGGING.log_date_format,
+        )
+    )
+    _handlers[:] = [handler]
+
+    if SETTINGS.LOGGING.log_queue_enabled:
+        _start_queue(_handlers)
+    else:
+        _configure_root(handler)
+
+
+os.register_at_fork(after_in_child=_restart_after_fork)
+atexit.register(shutdown_logging)
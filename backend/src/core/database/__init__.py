@@ -5,11 +5,26 @@ __all__ = [
     "DBSessionDep",
     "DatabaseManager",
     "IntIdMixin",
+    "ReadYourWritesMiddleware",
+    "ReplicaRouter",
+    "RoutingSession",
     "SQLAUnitOfWork",
     "TimestampMixin",
+    "in_unit_of_work",
+    "read_your_writes",
+    "release_connection",
+    "replica_reads",
 ]
 
 from .base import Base
 from .db_manager import DB_MANAGER, DatabaseManager, DBSessionDep
 from .mixins import IntIdMixin, TimestampMixin
+from .routing import (
+    ReadYourWritesMiddleware,
+    ReplicaRouter,
+    RoutingSession,
+    read_your_writes,
+    replica_reads,
+)
+from .session import in_unit_of_work, release_connection
 from .unitofwork import BaseUnitOfWork, SQLAUnitOfWork
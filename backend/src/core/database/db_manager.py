@@ -1,56 +1,149 @@
 from collections.abc import AsyncGenerator
-from typing import TYPE_CHECKING, Annotated, Final
+from typing import Annotated, Final
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import Pool
 
 from ..config import SERVER_SETTINGS as SETTINGS
 from ..config import DatabaseSettings
+from ..metrics import METRICS_REGISTRY, MetricsRegistry
+from .metrics import DatabaseMetrics, InstrumentedQueuePool, PoolSnapshot
+from .routing import ROUTER_KEY, ReplicaRouter, RoutingSession
+from .session import EARLY_RELEASE_KEY
 
-if TYPE_CHECKING:
-    from sqlalchemy.ext.asyncio.engine import AsyncEngine
+
+def _replica_name(index: int) -> str:
+    """Return the ``engine`` metrics label of a read replica."""
+    return f"replica{index}"
 
 
 class DatabaseManager:
     """Database manager class."""
 
-    def __init__(self, db_settings: DatabaseSettings) -> None:
-        """Initialize the database."""
-        self.async_engine: AsyncEngine = create_async_engine(
+    def __init__(
+        self,
+        db_settings: DatabaseSettings,
+        metrics_registry: MetricsRegistry | None = None,
+    ) -> None:
+        """Initialize the database.
+
+        Args:
+            db_settings: Database settings.
+            metrics_registry: Registry for pool and statement metrics,
+                instrumentation is disabled when omitted.
+        """
+        poolclass = (
+            InstrumentedQueuePool if metrics_registry is not None else None
+        )
+        self.async_engine: AsyncEngine = self._create_engine(
             url=str(db_settings.database_uri),
-            echo=db_settings.echo,
-            echo_pool=db_settings.echo_pool,
-            pool_size=db_settings.pool_size,
-            max_overflow=db_settings.max_overflow,
-            pool_pre_ping=db_settings.pool_pre_ping,
-            pool_recycle=db_settings.pool_recycle,
+            db_settings=db_settings,
+            poolclass=poolclass,
         )
+        self.replica_engines: list[AsyncEngine] = [
+            self._create_engine(
+                url=str(uri), db_settings=db_settings, poolclass=poolclass
+            )
+            for uri in db_settings.read_replica_uris
+        ]
+
+        session_info: dict[str, object] = {
+            EARLY_RELEASE_KEY: db_settings.early_release
+        }
+        self.router: ReplicaRouter | None = None
+        if self.replica_engines:
+            self.router = ReplicaRouter(
+                primary=self.async_engine.sync_engine,
+                replicas=[e.sync_engine for e in self.replica_engines],
+                strategy=db_settings.read_replica_routing,
+                read_your_writes_seconds=db_settings.read_your_writes_seconds,
+            )
+            session_info[ROUTER_KEY] = self.router
 
         self.async_session_maker: async_sessionmaker[AsyncSession] = (
             async_sessionmaker(
                 bind=self.async_engine,
+                sync_session_class=RoutingSession,
                 autoflush=db_settings.autoflush,
                 autocommit=db_settings.autocommit,
                 expire_on_commit=db_settings.expire_on_commit,
+                info=session_info,
             )
         )
 
+        self.metrics: DatabaseMetrics | None = None
+        if metrics_registry is not None:
+            self.metrics = DatabaseMetrics(metrics_registry)
+            self.metrics.instrument(self.async_engine.sync_engine)
+            for index, engine in enumerate(self.replica_engines):
+                self.metrics.instrument(
+                    engine.sync_engine, name=_replica_name(index)
+                )
+
+    @staticmethod
+    def _create_engine(
+        url: str,
+        db_settings: DatabaseSettings,
+        poolclass: type[Pool] | None = None,
+    ) -> AsyncEngine:
+        """Create an engine with the pool settings shared by all databases."""
+        return create_async_engine(
+            url=url,
+            echo=db_settings.echo,
+            echo_pool=db_settings.echo_pool,
+            pool_size=db_settings.pool_size,
+            max_overflow=db_settings.max_overflow,
+            pool_pre_ping=db_settings.pool_pre_ping,
+            pool_recycle=db_settings.pool_recycle,
+            poolclass=poolclass,
+            connect_args={
+                "prepared_statement_cache_size": (
+                    db_settings.prepared_statement_cache_size
+                ),
+            },
+        )
+
+    def pool_snapshot(self, replica: int | None = None) -> PoolSnapshot | None:
+        """Return the current pool state, or None if not instrumented.
+
+        Args:
+            replica: Index of the read replica to report on, the primary
+                when omitted.
+        """
+        if self.metrics is None:
+            return None
+        if replica is None:
+            return self.metrics.snapshot(self.async_engine.sync_engine)
+        return self.metrics.snapshot(
+            self.replica_engines[replica].sync_engine,
+            name=_replica_name(replica),
+        )
+
     async def dispose_engine(self) -> None:
-        """Dispose the engine."""
+        """Dispose the primary and replica engines."""
         await self.async_engine.dispose()
+        for engine in self.replica_engines:
+            await engine.dispose()
 
     async def get_session(self) -> AsyncGenerator[AsyncSession]:
-        """Returns a database session."""
+        """Returns a database session.
+
+        No connection is checked out until the first statement is executed,
+        so requests that never reach the database do not touch the pool.
+        """
         async with self.async_session_maker() as session:
             yield session
 
 
 DB_MANAGER: Final[DatabaseManager] = DatabaseManager(
-    db_settings=SETTINGS.DATABASE
+    db_settings=SETTINGS.DATABASE,
+    metrics_registry=METRICS_REGISTRY if SETTINGS.METRICS.enabled else None,
 )
 
 DBSessionDep = Annotated[AsyncSession, Depends(DB_MANAGER.get_session)]
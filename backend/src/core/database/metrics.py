@@ -0,0 +1,305 @@
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, cast
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+from sqlalchemy.engine.interfaces import DBAPIConnection, ExecutionContext
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    PoolProxiedConnection,
+    QueuePool,
+)
+
+from src.core.metrics import MetricsRegistry
+from src.core.metrics.registry import LabelValues
+
+CONNECTION_AGE_BUCKETS: tuple[float, ...] = (
+    1.0,
+    10.0,
+    60.0,
+    300.0,
+    900.0,
+    1800.0,
+    3600.0,
+    7200.0,
+)
+
+_CREATED_AT_KEY = "metrics_created_at"
+_STATEMENT_START_KEY = "metrics_statement_start"
+
+
+@dataclass(frozen=True, slots=True)
+class PoolSnapshot:
+    """Point-in-time view of the connection pool."""
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    checkout_wait_seconds: float
+    checkout_timeouts: int
+
+
+class DatabaseMetrics:
+    """Connection pool and statement metrics of engines.
+
+    Every metric has an ``engine`` label naming the instrumented engine,
+    so the primary and each read replica are reported separately.
+    """
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        """Register the database metrics.
+
+        Args:
+            registry: Registry the metrics are exported from.
+        """
+        self.pool_size = registry.gauge(
+            "db_pool_size",
+            "Configured number of pooled connections.",
+            labelnames=("engine",),
+        )
+        self.checked_in = registry.gauge(
+            "db_pool_checked_in",
+            "Idle connections in the pool.",
+            labelnames=("engine",),
+        )
+        self.checked_out = registry.gauge(
+            "db_pool_checked_out",
+            "Connections currently checked out.",
+            labelnames=("engine",),
+        )
+        self.overflow = registry.gauge(
+            "db_pool_overflow",
+            "Connections opened beyond pool_size (negative when the pool "
+            "is not full yet).",
+            labelnames=("engine",),
+        )
+        self.checkout_wait = registry.histogram(
+            "db_pool_checkout_wait_seconds",
+            "Time spent waiting for a pooled connection.",
+            labelnames=("engine",),
+        )
+        self.checkout_timeouts = registry.counter(
+            "db_pool_checkout_timeouts",
+            "Checkouts that failed because the pool was exhausted.",
+            labelnames=("engine",),
+        )
+        self.connection_age = registry.histogram(
+            "db_pool_connection_age_seconds",
+            "Age of connections at checkout.",
+            labelnames=("engine",),
+            buckets=CONNECTION_AGE_BUCKETS,
+        )
+        self.connections_created = registry.counter(
+            "db_pool_connections_created",
+            "New database connections.",
+            labelnames=("engine",),
+        )
+        self.connections_invalidated = registry.counter(
+            "db_pool_connections_invalidated",
+            "Connections invalidated after an error or recycle.",
+            labelnames=("engine",),
+        )
+        self.statement_duration = registry.histogram(
+            "db_statement_duration_seconds",
+            "Statement execution time by operation.",
+            labelnames=("engine", "operation"),
+        )
+        self.statement_errors = registry.counter(
+            "db_statement_errors",
+            "Statements that raised a database error.",
+            labelnames=("engine", "operation"),
+        )
+
+    def instrument(self, engine: Engine, name: str = "primary") -> None:
+        """Attach the metrics to an engine and its pool.
+
+        Args:
+            engine: Synchronous engine, ``AsyncEngine.sync_engine`` for
+                async engines.
+            name: Value of the ``engine`` label, unique per engine.
+        """
+        labels = (name,)
+        pool = engine.pool
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.metrics = self
+            pool.metrics_labels = labels
+
+        # The engine replaces its pool on dispose, so always read the
+        # current one.
+        self.pool_size.set_function(lambda: _queue_pool(engine).size(), labels)
+        self.checked_in.set_function(
+            lambda: _queue_pool(engine).checkedin(), labels
+        )
+        self.checked_out.set_function(
+            lambda: _queue_pool(engine).checkedout(), labels
+        )
+        self.overflow.set_function(
+            lambda: _queue_pool(engine).overflow(), labels
+        )
+
+        event.listen(pool, "connect", self._on_connect(name))
+        event.listen(pool, "checkout", self._on_checkout(name))
+        event.listen(pool, "invalidate", self._on_invalidate(name))
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute(name))
+        event.listen(engine, "handle_error", self._on_error(name))
+
+    def _on_connect(
+        self, name: str
+    ) -> Callable[[DBAPIConnection, ConnectionPoolEntry], None]:
+        def on_connect(
+            dbapi_connection: DBAPIConnection,  # noqa: ARG001
+            connection_record: ConnectionPoolEntry,
+        ) -> None:
+            connection_record.info[_CREATED_AT_KEY] = time.monotonic()
+            self.connections_created.inc(labels=(name,))
+
+        return on_connect
+
+    def _on_checkout(
+        self, name: str
+    ) -> Callable[
+        [DBAPIConnection, ConnectionPoolEntry, PoolProxiedConnection], None
+    ]:
+        def on_checkout(
+            dbapi_connection: DBAPIConnection,  # noqa: ARG001
+            connection_record: ConnectionPoolEntry,
+            connection_proxy: PoolProxiedConnection,  # noqa: ARG001
+        ) -> None:
+            created_at = connection_record.info.get(_CREATED_AT_KEY)
+            if created_at is not None:
+                self.connection_age.observe(
+                    time.monotonic() - created_at, (name,)
+                )
+
+        return on_checkout
+
+    def _on_invalidate(
+        self, name: str
+    ) -> Callable[
+        [DBAPIConnection, ConnectionPoolEntry, BaseException | None], None
+    ]:
+        def on_invalidate(
+            dbapi_connection: DBAPIConnection,  # noqa: ARG001
+            connection_record: ConnectionPoolEntry,  # noqa: ARG001
+            exception: BaseException | None,  # noqa: ARG001
+        ) -> None:
+            self.connections_invalidated.inc(labels=(name,))
+
+        return on_invalidate
+
+    def _before_execute(
+        self,
+        conn: Connection,
+        cursor: Any,  # noqa: ARG002, ANN401
+        statement: str,  # noqa: ARG002
+        parameters: Any,  # noqa: ARG002, ANN401
+        context: ExecutionContext | None,  # noqa: ARG002
+        executemany: bool,  # noqa: ARG002
+    ) -> None:
+        conn.info.setdefault(_STATEMENT_START_KEY, []).append(
+            time.perf_counter()
+        )
+
+    def _after_execute(self, name: str) -> Callable[..., None]:
+        def after_execute(
+            conn: Connection,
+            cursor: Any,  # noqa: ARG001, ANN401
+            statement: str,
+            parameters: Any,  # noqa: ARG001, ANN401
+            context: ExecutionContext | None,  # noqa: ARG001
+            executemany: bool,  # noqa: ARG001
+        ) -> None:
+            starts = conn.info.get(_STATEMENT_START_KEY)
+            if starts:
+                self.statement_duration.observe(
+                    time.perf_counter() - starts.pop(),
+                    (name, _operation(statement)),
+                )
+
+        return after_execute
+
+    def _on_error(self, name: str) -> Callable[[ExceptionContext], None]:
+        def on_error(context: ExceptionContext) -> None:
+            statement = context.statement or ""
+            self.statement_errors.inc(labels=(name, _operation(statement)))
+            if context.connection is not None:
+                starts = context.connection.info.get(_STATEMENT_START_KEY)
+                if starts:
+                    starts.pop()
+
+        return on_error
+
+    def snapshot(self, engine: Engine, name: str = "primary") -> PoolSnapshot:
+        """Return the current pool state and checkout totals.
+
+        Args:
+            engine: Instrumented synchronous engine.
+            name: Label the engine was instrumented with.
+        """
+        labels = (name,)
+        pool = _queue_pool(engine)
+        return PoolSnapshot(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            checkouts=self.checkout_wait.count(labels),
+            checkout_wait_seconds=self.checkout_wait.sum(labels),
+            checkout_timeouts=int(self.checkout_timeouts.value(labels)),
+        )
+
+
+def _queue_pool(engine: Engine) -> QueuePool:
+    return cast("QueuePool", engine.pool)
+
+
+def _operation(statement: str) -> str:
+    """Return the SQL verb of a statement, used as a low-cardinality label."""
+    words = statement.split(None, 1)
+    return words[0].upper() if words else "UNKNOWN"
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that measures how long checkouts take.
+
+    The pool events fire only after a connection has been obtained, so
+    the wait for a free connection (including pre-ping and opening new
+    connections) is timed around ``connect`` itself.
+    """
+
+    metrics: DatabaseMetrics | None = None
+    metrics_labels: LabelValues = ()
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, recording the wait time."""
+        if self.metrics is None:
+            return super().connect()
+
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.checkout_timeouts.inc(labels=self.metrics_labels)
+            raise
+        self.metrics.checkout_wait.observe(
+            time.perf_counter() - start, self.metrics_labels
+        )
+        return connection
+
+    def recreate(self) -> QueuePool:
+        """Recreate the pool, keeping the metrics attached."""
+        pool = super().recreate()
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.metrics = self.metrics
+            pool.metrics_labels = self.metrics_labels
+        return pool
+
+
+__all__ = ["DatabaseMetrics", "InstrumentedQueuePool", "PoolSnapshot"]
@@ -0,0 +1,274 @@
+import contextlib
+import itertools
+import math
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextvars import ContextVar
+from http.cookies import SimpleCookie
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+from sqlalchemy import Delete, Insert, Update, event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .session import WROTE_KEY, in_unit_of_work
+
+if TYPE_CHECKING:
+    from sqlalchemy.pool import QueuePool
+
+type RoutingStrategy = Literal["round_robin", "least_loaded"]
+
+ROUTER_KEY = "replica_router"
+READ_ONLY_KEY = "replica_read_only"
+READ_YOUR_WRITES_COOKIE = "primary_reads_until"
+
+
+class ReadYourWritesPin:
+    """Time until which the reads of one client go to the primary."""
+
+    __slots__ = ("until",)
+
+    def __init__(self, until: float = 0.0) -> None:
+        """Initialize the pin."""
+        self.until = until
+
+
+read_your_writes_var: ContextVar[ReadYourWritesPin | None] = ContextVar(
+    "read_your_writes", default=None
+)
+
+
+class ReplicaRouter:
+    """Chooses the engine for read-only work.
+
+    After a commit that wrote to the primary, reads stay on the primary for
+    ``read_your_writes_seconds`` so a client does not miss its own write
+    because of replication lag. The window belongs to the writer: it is
+    kept in the ``ReadYourWritesPin`` of the current context (see
+    ``read_your_writes`` and ``ReadYourWritesMiddleware``), and code
+    running without one is never pinned.
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: Sequence[Engine],
+        strategy: RoutingStrategy = "round_robin",
+        read_your_writes_seconds: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            primary: Engine of the primary database.
+            replicas: Engines of the read replicas.
+            strategy: ``round_robin`` or ``least_loaded`` (fewest checked
+                out connections).
+            read_your_writes_seconds: How long reads go to the primary
+                after a write was committed.
+            clock: Function returning the current time in seconds. It
+                must agree with the clock of ``ReadYourWritesMiddleware``.
+        """
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self._strategy = strategy
+        self._window = read_your_writes_seconds
+        self._clock = clock
+        self._cycle = itertools.cycle(self.replicas)
+
+    def mark_written(self) -> None:
+        """Start the read-your-writes window of the current context."""
+        pin = read_your_writes_var.get()
+        if pin is not None:
+            pin.until = max(pin.until, self._clock() + self._window)
+
+    def reader(self) -> Engine:
+        """Return the engine to use for a read-only statement."""
+        pin = read_your_writes_var.get()
+        if not self.replicas or (
+            pin is not None and self._clock() < pin.until
+        ):
+            return self.primary
+        if self._strategy == "least_loaded":
+            return min(
+                self.replicas,
+                key=lambda engine: cast("QueuePool", engine.pool).checkedout(),
+            )
+        return next(self._cycle)
+
+
+class RoutingSession(Session):
+    """Session that sends marked read-only statements to a replica.
+
+    Writes, flushes and everything inside a unit of work go to the primary.
+    Writes are recorded under ``WROTE_KEY`` until the transaction ends, so
+    ``release_connection`` does not discard them. Apart from that, without
+    a router in ``Session.info`` the session behaves like a plain
+    ``Session``.
+    """
+
+    def get_bind(
+        self,
+        mapper: Any = None,  # noqa: ANN401
+        clause: Any = None,  # noqa: ANN401
+        **kw: Any,  # noqa: ANN401
+    ) -> Engine | Connection:
+        """Return the engine for a statement."""
+        wrote = self._flushing or isinstance(clause, Insert | Update | Delete)
+        if wrote:
+            self.info[WROTE_KEY] = True
+        router: ReplicaRouter | None = self.info.get(ROUTER_KEY)
+        if router is None:
+            return super().get_bind(mapper, clause=clause, **kw)
+
+        if wrote:
+            return router.primary
+        if self.info.get(READ_ONLY_KEY) and not in_unit_of_work(self):
+            return router.reader()
+        return router.primary
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _start_read_your_writes_window(session: Session) -> None:
+    router: ReplicaRouter | None = session.info.get(ROUTER_KEY)
+    if router is not None and session.info.get(WROTE_KEY):
+        router.mark_written()
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _reset_written_flag(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    if transaction.parent is None:
+        session.info.pop(WROTE_KEY, None)
+
+
+@contextlib.contextmanager
+def read_your_writes(until: float = 0.0) -> Iterator[ReadYourWritesPin]:
+    """Scope the read-your-writes window to the block.
+
+    Commits with writes inside the block pin the replica reads of the
+    block to the primary; other contexts are not affected.
+
+    Args:
+        until: Time until which reads already go to the primary.
+    """
+    pin = ReadYourWritesPin(until)
+    token = read_your_writes_var.set(pin)
+    try:
+        yield pin
+    finally:
+        read_your_writes_var.reset(token)
+
+
+class ReadYourWritesMiddleware:
+    """Keeps the read-your-writes window of a client in a cookie.
+
+    Each HTTP request runs in ``read_your_writes``, starting from the
+    time stored in the cookie, so a client that wrote on one worker reads
+    from the primary on every worker. When a request extends the window,
+    the response sets the cookie to the new end. Commits made after the
+    response started still pin the rest of the request, but not the
+    client's next requests.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        read_your_writes_seconds: float,
+        cookie_name: str = READ_YOUR_WRITES_COOKIE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: ASGI application.
+            read_your_writes_seconds: Window of the router; a cookie never
+                pins reads for longer.
+            cookie_name: Name of the cookie.
+            clock: Function returning the current time in seconds.
+        """
+        self.app = app
+        self._window = read_your_writes_seconds
+        self._cookie_name = cookie_name
+        self._clock = clock
+
+    def _until_from(self, scope: Scope) -> float:
+        for name, value in scope["headers"]:
+            if name != b"cookie":
+                continue
+            cookie = SimpleCookie()
+            cookie.load(value.decode("latin-1"))
+            morsel = cookie.get(self._cookie_name)
+            if morsel is None:
+                continue
+            try:
+                until = float(morsel.value)
+            except ValueError:
+                return 0.0
+            if not math.isfinite(until):
+                return 0.0
+            return min(until, self._clock() + self._window)
+        return 0.0
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = self._until_from(scope)
+
+        with read_your_writes(start) as pin:
+
+            async def send_with_cookie(message: Message) -> None:
+                if (
+                    message["type"] == "http.response.start"
+                    and pin.until > start
+                ):
+                    max_age = math.ceil(pin.until - self._clock())
+                    MutableHeaders(scope=message).append(
+                        "set-cookie",
+                        f"{self._cookie_name}={pin.until:.3f}; "
+                        f"Max-Age={max(max_age, 0)}; Path=/; HttpOnly; "
+                        "SameSite=Lax",
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_with_cookie)
+
+
+@contextlib.contextmanager
+def replica_reads(session: AsyncSession) -> Iterator[None]:
+    """Allow the statements executed in the block to use a read replica.
+
+    Only statements outside a unit of work are routed; the block is a
+    no-op for sessions without a router.
+
+    Args:
+        session: Async database session.
+    """
+    info = session.info
+    previous = info.get(READ_ONLY_KEY, False)
+    info[READ_ONLY_KEY] = True
+    try:
+        yield
+    finally:
+        info[READ_ONLY_KEY] = previous
+
+
+__all__ = [
+    "READ_YOUR_WRITES_COOKIE",
+    "ReadYourWritesMiddleware",
+    "ReadYourWritesPin",
+    "ReplicaRouter",
+    "RoutingSession",
+    "RoutingStrategy",
+    "read_your_writes",
+    "replica_reads",
+]
@@ -0,0 +1,61 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+EARLY_RELEASE_KEY = "early_release"
+UOW_DEPTH_KEY = "uow_depth"
+# Set by ``RoutingSession`` when the transaction flushed or ran DML.
+WROTE_KEY = "wrote"
+
+
+def in_unit_of_work(session: AsyncSession | Session) -> bool:
+    """Return True if a unit of work is active on the session.
+
+    Args:
+        session: Database session.
+    """
+    return bool(session.info.get(UOW_DEPTH_KEY, 0) > 0)
+
+
+async def release_connection(session: AsyncSession) -> bool:
+    """Return the session's connection to the pool after a read.
+
+    ``AsyncSession`` checks out a connection only on first use, but then
+    keeps it until the session is closed at the end of the request. Read
+    paths call this once their rows are converted to domain objects, so
+    the connection is not held across password hashing, token signing or
+    response serialization. The session stays usable: the next statement
+    checks out a connection again.
+
+    The connection is kept if early release is disabled for the session,
+    a unit of work is active, or the session has pending changes or wrote
+    in its transaction: closing would roll back flushed changes and DML
+    run outside a unit of work.
+
+    Args:
+        session: Async database session.
+
+    Returns:
+        True if the connection was released.
+    """
+    if (
+        not session.info.get(EARLY_RELEASE_KEY, False)
+        or not session.in_transaction()
+        or in_unit_of_work(session)
+        or session.info.get(WROTE_KEY, False)
+        or session.new
+        or session.dirty
+        or session.deleted
+    ):
+        return False
+
+    await session.close()
+    return True
+
+
+__all__ = [
+    "EARLY_RELEASE_KEY",
+    "UOW_DEPTH_KEY",
+    "WROTE_KEY",
+    "in_unit_of_work",
+    "release_connection",
+]
@@ -4,6 +4,8 @@ from typing import Self
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .session import UOW_DEPTH_KEY
+
 
 class BaseUnitOfWork(ABC):
     """Abstract base class for Unit of Work pattern.
@@ -23,9 +25,14 @@ class BaseUnitOfWork(ABC):
     async def __aenter__(self) -> Self:
         """Enter async context manager.
 
+        Marks the session as being inside a unit of work, so reads made by
+        repositories keep the connection until the transaction ends.
+
         Returns:
             Self instance for use in async with statement.
         """
+        info = self._session.info
+        info[UOW_DEPTH_KEY] = info.get(UOW_DEPTH_KEY, 0) + 1
         return self
 
     async def __aexit__(
@@ -44,6 +51,8 @@ class BaseUnitOfWork(ABC):
             exc_val: Exception instance or None.
             exc_tb: Traceback or None.
         """
+        info = self._session.info
+        info[UOW_DEPTH_KEY] = info.get(UOW_DEPTH_KEY, 1) - 1
         if exc_type is not None:
             await self.rollback()
         else:
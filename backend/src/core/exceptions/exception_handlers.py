@@ -21,6 +21,7 @@ def register_exception_handlers(app: FastAPI) -> None:
         return JSONResponse(
             status_code=exc.status_code,
             content={"detail": exc.message},
+            headers=exc.headers,
         )
 
     @app.exception_handler(Exception)
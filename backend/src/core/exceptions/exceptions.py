@@ -4,10 +4,16 @@ from fastapi import status
 class ServerError(Exception):
     """Base class for server errors."""
 
-    def __init__(self, message: str, status_code: int = 400) -> None:
+    def __init__(
+        self,
+        message: str,
+        status_code: int = 400,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         """Initialize the AuthBaseError."""
         self.message = message
         self.status_code = status_code
+        self.headers = headers
 
 
 class EntityNotFoundError(ServerError):
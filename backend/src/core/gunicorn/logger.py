@@ -1,13 +1,16 @@
-from logging import Formatter
-
 from gunicorn.config import Config
 from gunicorn.glogging import Logger
 
 from ..config import SERVER_SETTINGS as SETTINGS
+from ..config.log_formatters import make_formatter
 
 
 class GunicornLogger(Logger):  # type: ignore[misc]
-    """Custom Gunicorn logger."""
+    """Custom Gunicorn logger.
+
+    Access and error logs use the same text or JSON formatter as the
+    application logs.
+    """
 
     def setup(self, cfg: Config) -> None:
         """Setup Gunicorn logger."""
@@ -16,7 +19,8 @@ class GunicornLogger(Logger):  # type: ignore[misc]
         self._set_handler(  # type: ignore[unused-ignore]
             log=self.access_log,
             output=cfg.accesslog,
-            fmt=Formatter(
+            fmt=make_formatter(
+                json_format=SETTINGS.LOGGING.log_json,
                 fmt=SETTINGS.LOGGING.log_format,
                 datefmt=SETTINGS.LOGGING.log_date_format,
             ),
@@ -25,7 +29,8 @@ class GunicornLogger(Logger):  # type: ignore[misc]
         self._set_handler(  # type: ignore[unused-ignore]
             log=self.error_log,
             output=cfg.errorlog,
-            fmt=Formatter(
+            fmt=make_formatter(
+                json_format=SETTINGS.LOGGING.log_json,
                 fmt=SETTINGS.LOGGING.log_format,
                 datefmt=SETTINGS.LOGGING.log_date_format,
             ),
@@ -0,0 +1,14 @@
+__all__ = [
+    "METRICS_REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "Sample",
+]
+
+from typing import Final
+
+from .registry import Counter, Gauge, Histogram, MetricsRegistry, Sample
+
+METRICS_REGISTRY: Final[MetricsRegistry] = MetricsRegistry()
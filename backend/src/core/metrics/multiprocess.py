@@ -0,0 +1,190 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, Final
+
+from src.core.config.constants import SERVER_SETTINGS as SETTINGS
+
+from . import METRICS_REGISTRY
+from .registry import MetricFamily, MetricsRegistry, Sample, render_text
+
+log = logging.getLogger(__name__)
+
+FILE_PREFIX = "metrics-"
+FILE_SUFFIX = ".json"
+
+type _SampleKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def _pid_alive(pid: int) -> bool:
+    """Return whether a process with the given pid is running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _family_to_json(family: MetricFamily) -> dict[str, Any]:
+    return {
+        "name": family.name,
+        "documentation": family.documentation,
+        "type": family.type,
+        "samples": [[s.name, s.labels, s.value] for s in family.samples],
+    }
+
+
+class MultiProcessCollector:
+    """Aggregates the metrics of all worker processes of a server.
+
+    Every Gunicorn worker has its own registry, so a scrape only reaches
+    the worker that happens to accept it. Each worker therefore writes a
+    snapshot of its registry to ``<directory>/metrics-<pid>.json`` every
+    ``flush_interval`` seconds (and right before answering a scrape), and
+    collection merges the snapshots of all workers:
+
+    * counters and histograms are summed, including the final snapshots
+      of workers that have exited, so totals never go backwards when a
+      worker is recycled;
+    * gauges are summed over running workers only.
+
+    The directory must be emptied with ``clear`` before the workers
+    start, see ``run_main``.
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        directory: str | Path,
+        flush_interval: float = 5.0,
+        pid_alive: Callable[[int], bool] = _pid_alive,
+    ) -> None:
+        """Initialize the collector.
+
+        Args:
+            registry: Registry of the current process.
+            directory: Directory shared by all workers.
+            flush_interval: Seconds between snapshots of the registry.
+            pid_alive: Tells whether a worker is still running.
+        """
+        self._registry = registry
+        self._directory = Path(directory)
+        self._flush_interval = flush_interval
+        self._pid_alive = pid_alive
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def clear(self) -> None:
+        """Remove the snapshots of a previous server run."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        for path in self._directory.glob(f"{FILE_PREFIX}*{FILE_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+    def write(self) -> None:
+        """Write the snapshot of the current process atomically."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(
+            [_family_to_json(f) for f in self._registry.collect()],
+            separators=(",", ":"),
+        )
+        path = self._directory / f"{FILE_PREFIX}{os.getpid()}{FILE_SUFFIX}"
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(data)
+            Path(tmp_path).replace(path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _read(self) -> Iterator[tuple[int, list[dict[str, Any]]]]:
+        for path in self._directory.glob(f"{FILE_PREFIX}*{FILE_SUFFIX}"):
+            try:
+                pid = int(path.name[len(FILE_PREFIX) : -len(FILE_SUFFIX)])
+                families = json.loads(path.read_text())
+            except (OSError, ValueError):
+                # Removed by ``clear`` or not a snapshot of ours.
+                continue
+            yield pid, families
+
+    def collect(self) -> Iterator[MetricFamily]:
+        """Collect the merged metrics of all workers."""
+        self.write()
+        families: dict[str, MetricFamily] = {}
+        values: dict[str, dict[_SampleKey, float]] = {}
+        for pid, snapshot in self._read():
+            alive: bool | None = None
+            for data in snapshot:
+                if data["type"] == "gauge":
+                    if alive is None:
+                        alive = self._pid_alive(pid)
+                    if not alive:
+                        continue
+                name = data["name"]
+                if name not in families:
+                    families[name] = MetricFamily(
+                        name=name,
+                        documentation=data["documentation"],
+                        type=data["type"],
+                    )
+                    values[name] = {}
+                merged = values[name]
+                for sample_name, labels, value in data["samples"]:
+                    key = (sample_name, tuple(labels.items()))
+                    merged[key] = merged.get(key, 0) + value
+
+        for name, family in families.items():
+            family.samples = [
+                Sample(sample_name, dict(labels), value)
+                for (sample_name, labels), value in values[name].items()
+            ]
+            yield family
+
+    def render(self) -> str:
+        """Render the merged metrics in the Prometheus text format."""
+        return render_text(self.collect())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            try:
+                self.write()
+            except OSError:
+                log.exception("Failed to write the metrics snapshot")
+
+    def start(self) -> None:
+        """Start writing snapshots in a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-snapshot", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and write a final snapshot."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.write()
+
+
+MULTIPROCESS_COLLECTOR: Final[MultiProcessCollector | None] = (
+    MultiProcessCollector(
+        METRICS_REGISTRY,
+        SETTINGS.METRICS.multiprocess_dir,
+        flush_interval=SETTINGS.METRICS.multiprocess_flush_interval,
+    )
+    if SETTINGS.METRICS.multiprocess_dir
+    else None
+)
+
+
+__all__ = ["MULTIPROCESS_COLLECTOR", "MultiProcessCollector"]
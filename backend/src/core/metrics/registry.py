@@ -0,0 +1,429 @@
+import math
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import ClassVar, Literal
+
+type MetricType = Literal["counter", "gauge", "histogram"]
+type LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Sample:
+    """Single exported value of a metric."""
+
+    name: str
+    labels: dict[str, str]
+    value: float
+
+
+@dataclass(slots=True)
+class _HistogramValue:
+    """Observed values of one histogram label set."""
+
+    buckets: list[int]
+    sum: float = 0.0
+    count: int = 0
+
+
+@dataclass(slots=True)
+class MetricFamily:
+    """All samples of a metric, as collected for export."""
+
+    name: str
+    documentation: str
+    type: MetricType
+    samples: list[Sample] = field(default_factory=list)
+
+
+class Metric(ABC):
+    """Base class for metrics.
+
+    Values are kept per label set. Label values are passed positionally, in
+    the order of ``labelnames``; a metric without labels is updated
+    directly.
+    """
+
+    type: ClassVar[MetricType]
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        """Initialize the metric.
+
+        Args:
+            name: Metric name.
+            documentation: Help text.
+            labelnames: Names of the metric labels.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: LabelValues = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _check_labels(self, values: LabelValues) -> None:
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name!r} expects labels {self.labelnames!r}"
+            )
+
+    def _labels_dict(self, values: LabelValues) -> dict[str, str]:
+        return dict(zip(self.labelnames, values, strict=True))
+
+    @abstractmethod
+    def collect(self) -> MetricFamily:
+        """Collect the current samples of the metric."""
+        ...
+
+
+class Counter(Metric):
+    """Monotonically increasing counter."""
+
+    type = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        """Initialize the counter."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, labels: LabelValues = ()) -> None:
+        """Increment the counter.
+
+        Args:
+            amount: Non-negative increment.
+            labels: Label values.
+
+        Raises:
+            ValueError: If ``amount`` is negative.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only be incremented")
+        self._check_labels(labels)
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: LabelValues = ()) -> float:
+        """Return the counter value for a label set."""
+        return self._values.get(labels, 0.0)
+
+    def collect(self) -> MetricFamily:
+        """Collect the current samples of the counter."""
+        with self._lock:
+            values = list(self._values.items())
+        return MetricFamily(
+            name=self.name,
+            documentation=self.documentation,
+            type=self.type,
+            samples=[
+                Sample(f"{self.name}_total", self._labels_dict(k), v)
+                for k, v in values
+            ],
+        )
+
+
+class Gauge(Metric):
+    """Value that can go up and down.
+
+    A gauge may instead be bound to a callback with ``set_function``; the
+    callback is then evaluated at collection time, which suits values such
+    as pool occupancy that are cheaper to read than to track.
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        """Initialize the gauge."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+        self._functions: dict[LabelValues, Callable[[], float]] = {}
+
+    def set(self, value: float, labels: LabelValues = ()) -> None:
+        """Set the gauge value."""
+        self._check_labels(labels)
+        with self._lock:
+            self._values[labels] = value
+
+    def inc(self, amount: float = 1.0, labels: LabelValues = ()) -> None:
+        """Increment the gauge value."""
+        self._check_labels(labels)
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, labels: LabelValues = ()) -> None:
+        """Decrement the gauge value."""
+        self.inc(-amount, labels)
+
+    def set_function(
+        self, function: Callable[[], float], labels: LabelValues = ()
+    ) -> None:
+        """Read the gauge value from a callback at collection time."""
+        self._check_labels(labels)
+        with self._lock:
+            self._functions[labels] = function
+
+    def value(self, labels: LabelValues = ()) -> float:
+        """Return the gauge value for a label set."""
+        function = self._functions.get(labels)
+        if function is not None:
+            return float(function())
+        return self._values.get(labels, 0.0)
+
+    def collect(self) -> MetricFamily:
+        """Collect the current samples of the gauge."""
+        with self._lock:
+            values = dict(self._values)
+            functions = list(self._functions.items())
+        for labels, function in functions:
+            values[labels] = float(function())
+        return MetricFamily(
+            name=self.name,
+            documentation=self.documentation,
+            type=self.type,
+            samples=[
+                Sample(self.name, self._labels_dict(k), v)
+                for k, v in values.items()
+            ],
+        )
+
+
+class Histogram(Metric):
+    """Histogram with fixed bucket upper bounds."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name.
+            documentation: Help text.
+            labelnames: Names of the metric labels.
+            buckets: Sorted bucket upper bounds, ``+Inf`` is implied.
+
+        Raises:
+            ValueError: If ``buckets`` is empty or not sorted.
+        """
+        super().__init__(name, documentation, labelnames)
+        bounds = tuple(float(b) for b in buckets if not math.isinf(b))
+        if not bounds or list(bounds) != sorted(bounds):
+            raise ValueError("Histogram buckets must be sorted")
+        self.buckets: tuple[float, ...] = bounds
+        self._values: dict[LabelValues, _HistogramValue] = {}
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        """Record an observation.
+
+        Args:
+            value: Observed value.
+            labels: Label values.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                self._check_labels(labels)
+                entry = _HistogramValue(buckets=[0] * (len(self.buckets) + 1))
+                self._values[labels] = entry
+            entry.buckets[index] += 1
+            entry.sum += value
+            entry.count += 1
+
+    def count(self, labels: LabelValues = ()) -> int:
+        """Return the number of observations for a label set."""
+        entry = self._values.get(labels)
+        return 0 if entry is None else entry.count
+
+    def sum(self, labels: LabelValues = ()) -> float:
+        """Return the sum of observations for a label set."""
+        entry = self._values.get(labels)
+        return 0.0 if entry is None else entry.sum
+
+    def collect(self) -> MetricFamily:
+        """Collect the current samples of the histogram."""
+        with self._lock:
+            values = [
+                (k, list(v.buckets), v.sum, v.count)
+                for k, v in self._values.items()
+            ]
+
+        family = MetricFamily(
+            name=self.name, documentation=self.documentation, type=self.type
+        )
+        bounds = [*(_format_value(b) for b in self.buckets), "+Inf"]
+        for labels, buckets, total, count in values:
+            label_dict = self._labels_dict(labels)
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, buckets, strict=True):
+                cumulative += bucket_count
+                family.samples.append(
+                    Sample(
+                        f"{self.name}_bucket",
+                        {**label_dict, "le": bound},
+                        cumulative,
+                    )
+                )
+            family.samples.append(
+                Sample(f"{self.name}_sum", label_dict, total)
+            )
+            family.samples.append(
+                Sample(f"{self.name}_count", label_dict, count)
+            )
+        return family
+
+
+class MetricsRegistry:
+    """Registry of the metrics exported by the process."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register[M: Metric](self, metric_class: type[M], metric: M) -> M:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+        if not isinstance(existing, metric_class) or (
+            existing.labelnames != metric.labelnames
+        ):
+            raise ValueError(
+                f"Metric {metric.name!r} is already registered differently"
+            )
+        return existing
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Return the counter with the given name, creating it if needed."""
+        return self._register(
+            Counter, Counter(name, documentation, labelnames)
+        )
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """Return the gauge with the given name, creating it if needed."""
+        return self._register(Gauge, Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram with the given name, creating it if needed."""
+        return self._register(
+            Histogram, Histogram(name, documentation, labelnames, buckets)
+        )
+
+    def unregister(self, name: str) -> None:
+        """Remove a metric from the registry."""
+        with self._lock:
+            self._metrics.pop(name, None)
+
+    def collect(self) -> Iterator[MetricFamily]:
+        """Collect all registered metrics."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            yield metric.collect()
+
+    def snapshot(self) -> dict[str, list[Sample]]:
+        """Return the current samples of every metric, keyed by name."""
+        return {family.name: family.samples for family in self.collect()}
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        return render_text(self.collect())
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return f"{value:.1f}"
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_text(families: Iterator[MetricFamily]) -> str:
+    """Render metric families in the Prometheus text exposition format.
+
+    Args:
+        families: Metric families to render.
+
+    Returns:
+        Exposition text, terminated by a newline.
+    """
+    lines: list[str] = []
+    for family in families:
+        documentation = family.documentation.replace("\\", "\\\\")
+        lines.append(f"# HELP {family.name} {documentation}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        for sample in family.samples:
+            if sample.labels:
+                labels = ",".join(
+                    f'{k}="{_escape_label(v)}"'
+                    for k, v in sample.labels.items()
+                )
+                name = f"{sample.name}{{{labels}}}"
+            else:
+                name = sample.name
+            lines.append(f"{name} {_format_value(sample.value)}")
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Metric",
+    "MetricFamily",
+    "MetricsRegistry",
+    "Sample",
+    "render_text",
+]
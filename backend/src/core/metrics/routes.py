@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Response
+
+from src.core.config import SERVER_SETTINGS as SETTINGS
+
+from . import METRICS_REGISTRY
+from .multiprocess import MULTIPROCESS_COLLECTOR
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter()
+
+
+@router.get(SETTINGS.METRICS.path, include_in_schema=False)
+def metrics() -> Response:
+    """Export metrics in the Prometheus text format.
+
+    A plain function, so FastAPI runs it in the threadpool: merging the
+    files of a multiprocess collector does blocking file I/O.
+    """
+    return Response(
+        content=(
+            METRICS_REGISTRY.render()
+            if MULTIPROCESS_COLLECTOR is None
+            else MULTIPROCESS_COLLECTOR.render()
+        ),
+        media_type=CONTENT_TYPE_LATEST,
+    )
@@ -0,0 +1,5 @@
+__all__ = ["GCRARateLimiter", "InMemoryRateLimiter", "RateLimiter"]
+
+from .base import RateLimiter
+from .gcra import GCRARateLimiter
+from .memory import InMemoryRateLimiter
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+
+
+class RateLimiter(ABC):
+    """Allows at most ``limit`` events per key within ``window`` seconds."""
+
+    def __init__(self, limit: int, window: float) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limit: Maximum number of events per key within the window.
+            window: Window length in seconds.
+
+        Raises:
+            ValueError: If ``limit`` or ``window`` is not positive.
+        """
+        if limit < 1 or window <= 0:
+            raise ValueError("limit and window must be positive")
+        self.limit = limit
+        self.window = window
+
+    @abstractmethod
+    async def acquire(self, key: str) -> float:
+        """Record an event for a key unless the key is over its limit.
+
+        Rejected events are not recorded.
+
+        Returns:
+            0.0 if the event is allowed, otherwise the number of seconds
+            until it would be.
+        """
+        ...
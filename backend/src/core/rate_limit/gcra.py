@@ -0,0 +1,53 @@
+import time
+from collections.abc import Callable
+
+from src.core.cache import CacheBackend
+
+from .base import RateLimiter
+
+
+class GCRARateLimiter(RateLimiter):
+    """Generic cell rate algorithm limiter on a cache backend.
+
+    Keeps a single float per key, the theoretical arrival time of the
+    next event, so a shared backend (e.g. Redis) can enforce the limit
+    across workers. Bursts of ``limit`` events are allowed, then one event
+    every ``window / limit`` seconds.
+
+    The read and the write are separate calls: concurrent workers may
+    admit a few events over the limit. Backends with an atomic update
+    should override ``acquire``.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend[float],
+        limit: int,
+        window: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            backend: Cache storing the arrival time of each key.
+            limit: Maximum number of events per key within the window.
+            window: Window length in seconds.
+            clock: Function returning the current time in seconds; must
+                agree between the processes sharing the backend.
+        """
+        super().__init__(limit, window)
+        self._backend = backend
+        self._clock = clock
+        self._interval = window / limit
+
+    async def acquire(self, key: str) -> float:
+        """Record an event for a key unless the key is over its limit."""
+        now = self._clock()
+        arrival = await self._backend.get(key)
+        arrival = now if arrival is None else max(arrival, now)
+        arrival += self._interval
+        allowed_at = arrival - self.window
+        if allowed_at > now:
+            return allowed_at - now
+        await self._backend.set(key, arrival, ttl=arrival - now)
+        return 0.0
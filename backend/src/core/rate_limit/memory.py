@@ -0,0 +1,76 @@
+import math
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable
+
+from .base import RateLimiter
+
+
+class _Window:
+    """Ring buffer of the times of the last ``limit`` events of a key."""
+
+    __slots__ = ("index", "times")
+
+    def __init__(self, limit: int) -> None:
+        self.times = array("d", [-math.inf]) * limit
+        self.index = 0
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """In-process sliding window limiter.
+
+    Each key keeps the times of its last ``limit`` events in a fixed-size
+    ring buffer of doubles; an event is allowed when the oldest of them
+    has left the window, so the limit holds for every window, not only
+    aligned ones. A check is one dictionary lookup and one comparison.
+
+    At most ``max_keys`` keys are tracked, the least recently used are
+    evicted first. Limits apply per process.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window: float,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limit: Maximum number of events per key within the window.
+            window: Window length in seconds.
+            max_keys: Maximum number of tracked keys.
+            clock: Function returning the current time in seconds.
+        """
+        super().__init__(limit, window)
+        self._max_keys = max(1, max_keys)
+        self._clock = clock
+        self._windows: OrderedDict[str, _Window] = OrderedDict()
+
+    async def acquire(self, key: str) -> float:
+        """Record an event for a key unless the key is over its limit."""
+        now = self._clock()
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = _Window(self.limit)
+            if len(self._windows) > self._max_keys:
+                self._windows.popitem(last=False)
+        else:
+            self._windows.move_to_end(key)
+
+        retry_after = window.times[window.index] + self.window - now
+        if retry_after > 0:
+            return retry_after
+        window.times[window.index] = now
+        window.index = (window.index + 1) % self.limit
+        return 0.0
+
+    def clear(self) -> None:
+        """Forget all keys."""
+        self._windows.clear()
+
+    def __len__(self) -> int:
+        """Return the number of tracked keys."""
+        return len(self._windows)
@@ -1,5 +1,13 @@
-__all__ = ["BaseRepository", "SQLAlchemyRepository"]
+__all__ = [
+    "BaseRepository",
+    "Cursor",
+    "Page",
+    "SQLAlchemyRepository",
+    "decode_cursor",
+    "encode_cursor",
+]
 
 
 from .base import BaseRepository
+from .pagination import Cursor, Page, decode_cursor, encode_cursor
 from .sqla import SQLAlchemyRepository
@@ -0,0 +1,85 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from src.core.exceptions.exceptions import InvalidRequestError
+
+
+@dataclass(frozen=True, slots=True)
+class Page[T]:
+    """Page of a keyset paginated query."""
+
+    items: list[T]
+    next_cursor: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    """Position after the last row of a page.
+
+    Attributes:
+        order_by: Column the query is ordered by.
+        descending: Whether the order is descending.
+        value: Value of ``order_by`` in the last row.
+        id: Primary key of the last row, breaks ties in ``order_by``.
+    """
+
+    order_by: str
+    descending: bool
+    value: Any
+    id: int
+
+
+def _encode_value(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, dict) and "$dt" in value:
+        return datetime.fromisoformat(value["$dt"])
+    return value
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Encode a cursor as an opaque URL-safe string."""
+    payload = json.dumps(
+        [
+            cursor.order_by,
+            int(cursor.descending),
+            _encode_value(cursor.value),
+            cursor.id,
+        ],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        InvalidRequestError: If the cursor is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        order_by, descending, value, id = json.loads(
+            base64.urlsafe_b64decode(padded)
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidRequestError("Invalid cursor") from None
+    if not isinstance(order_by, str) or not isinstance(id, int):
+        raise InvalidRequestError("Invalid cursor")
+    return Cursor(
+        order_by=order_by,
+        descending=bool(descending),
+        value=_decode_value(value),
+        id=id,
+    )
+
+
+__all__ = ["Cursor", "Page", "decode_cursor", "encode_cursor"]
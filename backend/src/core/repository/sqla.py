@@ -1,10 +1,22 @@
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import delete, insert, inspect, literal, select, tuple_, update
+from sqlalchemy.orm.interfaces import ORMOption
 
+from src.core.database.session import release_connection
+from src.core.exceptions.exceptions import InvalidRequestError
 from src.core.repository.base import BaseRepository
+from src.core.repository.pagination import (
+    Cursor,
+    Page,
+    decode_cursor,
+    encode_cursor,
+)
 from src.core.repository.types import TModel
 
+MAX_PAGE_SIZE = 1000
+
 
 class SQLAlchemyRepository(BaseRepository[TModel]):
     """Generic SQLAlchemy repository implementation.
@@ -39,8 +51,16 @@ class SQLAlchemyRepository(BaseRepository[TModel]):
         Returns:
             List of created ORM model instances.
         """
-        stmt = insert(self.model).values(data).returning(self.model)
-        created_entities = (await self.session.execute(stmt)).scalars().all()
+        if not data:
+            return []
+        # Executed with a list of parameters, the statement runs as an
+        # executemany batched by the dialect, instead of one huge
+        # multi-VALUES statement whose size grows with the input. Rows are
+        # returned in the order of ``data``.
+        stmt = insert(self.model).returning(
+            self.model, sort_by_parameter_order=True
+        )
+        created_entities = (await self.session.scalars(stmt, data)).all()
         return list(created_entities)
 
     async def _get_by_id_core(self, id: int) -> TModel | None:
@@ -76,6 +96,9 @@ class SQLAlchemyRepository(BaseRepository[TModel]):
     ) -> list[TModel]:
         """Retrieve paginated records.
 
+        ``OFFSET`` gets slower the deeper the page; prefer
+        ``_get_page_core`` for iterating over large tables.
+
         Args:
             offset: Number of records to skip.
             limit: Maximum number of records to return (capped at 1000).
@@ -83,11 +106,124 @@ class SQLAlchemyRepository(BaseRepository[TModel]):
         Returns:
             List of ORM model instances.
         """
-        safe_limit = max(1, min(limit, 1000))
+        safe_limit = max(1, min(limit, MAX_PAGE_SIZE))
         stmt = select(self.model).offset(offset).limit(safe_limit)
         entities = (await self.session.execute(stmt)).scalars().all()
         return list(entities)
 
+    async def _get_page_core(
+        self,
+        limit: int = 100,
+        cursor: str | None = None,
+        order_by: str = "id",
+        descending: bool = False,
+        options: Sequence[ORMOption] = (),
+    ) -> Page[TModel]:
+        """Retrieve a page of records using keyset (seek) pagination.
+
+        Pages are read with ``WHERE (order_by, id) > (last values)`` instead
+        of ``OFFSET``, so every page costs the same index seek and rows
+        inserted concurrently are neither skipped nor repeated. ``id``
+        breaks ties when ``order_by`` is not unique; an index on
+        ``(order_by, id)`` keeps the seek cheap. ``order_by`` must name a
+        non-nullable column: NULLs never compare greater or less, so their
+        rows would be skipped.
+
+        Args:
+            limit: Maximum number of records to return (capped at 1000).
+            cursor: ``next_cursor`` of the previous page, None for the first
+                page.
+            order_by: Name of the column to order by.
+            descending: Order from the highest value down.
+            options: Loader options, e.g. eager loads of relationships.
+
+        Returns:
+            Page of ORM model instances with the cursor of the next page.
+
+        Raises:
+            InvalidRequestError: If ``order_by`` is not a non-nullable
+                column, or the cursor is malformed or was created for a
+                different ordering.
+        """
+        order_column = inspect(self.model).columns.get(order_by)
+        if order_column is None or order_column.nullable:
+            raise InvalidRequestError(f"Cannot order by {order_by!r}")
+        column = getattr(self.model, order_by)
+        id_column = self.model.id
+        safe_limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+        stmt = select(self.model).options(*options).limit(safe_limit + 1)
+        if descending:
+            stmt = stmt.order_by(column.desc(), id_column.desc())
+        else:
+            stmt = stmt.order_by(column.asc(), id_column.asc())
+
+        if cursor is not None:
+            position = decode_cursor(cursor)
+            if (position.order_by, position.descending) != (
+                order_by,
+                descending,
+            ):
+                raise InvalidRequestError("Cursor does not match the order")
+            if order_by == "id":
+                stmt = stmt.where(
+                    id_column < position.id
+                    if descending
+                    else id_column > position.id
+                )
+            else:
+                key = tuple_(column, id_column)
+                last = tuple_(literal(position.value), literal(position.id))
+                stmt = stmt.where(key < last if descending else key > last)
+
+        entities = list((await self.session.scalars(stmt)).all())
+        next_cursor: str | None = None
+        if len(entities) > safe_limit:
+            entities = entities[:safe_limit]
+            last_entity = entities[-1]
+            next_cursor = encode_cursor(
+                Cursor(
+                    order_by=order_by,
+                    descending=descending,
+                    value=getattr(last_entity, order_by),
+                    id=last_entity.id,
+                )
+            )
+        return Page(items=entities, next_cursor=next_cursor)
+
+    async def _stream_all_core(
+        self,
+        batch_size: int = 1000,
+        options: Sequence[ORMOption] = (),
+    ) -> AsyncIterator[TModel]:
+        """Iterate over all records without loading them all into memory.
+
+        Rows are fetched through a server-side cursor ``batch_size`` at a
+        time, and the ORM identity map is not kept for yielded rows. The
+        connection is held until the iteration finishes.
+
+        Args:
+            batch_size: Number of rows fetched per round trip.
+            options: Loader options, e.g. eager loads of relationships.
+
+        Yields:
+            ORM model instances ordered by id.
+        """
+        stmt = (
+            select(self.model)
+            .options(*options)
+            .order_by(self.model.id)
+            .execution_options(yield_per=max(1, batch_size))
+        )
+        result = await self.session.stream_scalars(stmt)
+        try:
+            async for partition in result.partitions():
+                for entity in partition:
+                    yield entity
+        finally:
+            await result.close()
+            await release_connection(self.session)
+
     async def _update_core(
         self, id: int, data: dict[str, Any]
     ) -> TModel | None:
@@ -0,0 +1,160 @@
+import hmac
+import random
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Final
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER: Final = "X-Request-ID"
+MAX_REQUEST_ID_LENGTH: Final = 128
+
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+user_id_var: ContextVar[int | None] = ContextVar("user_id", default=None)
+debug_logging_var: ContextVar[bool] = ContextVar(
+    "debug_logging", default=False
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DebugLogPolicy:
+    """Selects the requests whose DEBUG records are logged.
+
+    Attributes:
+        header: Request header enabling DEBUG logging.
+        token: Value the header must carry; the header is ignored
+            without a token.
+        sample_rate: Fraction of requests logged at DEBUG.
+        user_ids: Users whose requests are logged at DEBUG.
+    """
+
+    header: str = "X-Debug-Log"
+    token: str | None = None
+    sample_rate: float = 0.0
+    user_ids: frozenset[int] = frozenset()
+
+    @property
+    def active(self) -> bool:
+        """Return whether any request can be selected."""
+        return bool(self.token or self.sample_rate > 0 or self.user_ids)
+
+
+_debug_policy = DebugLogPolicy()
+
+
+def configure_debug_logging(policy: DebugLogPolicy) -> None:
+    """Set the policy selecting requests logged at DEBUG."""
+    global _debug_policy  # noqa: PLW0603
+    _debug_policy = policy
+
+
+def debug_logging_enabled() -> bool:
+    """Return whether the current request is logged at DEBUG."""
+    return debug_logging_var.get()
+
+
+def enable_debug_logging() -> None:
+    """Log the rest of the current request at DEBUG."""
+    debug_logging_var.set(True)
+
+
+def get_request_id() -> str | None:
+    """Return the id of the request being handled."""
+    return request_id_var.get()
+
+
+def get_user_id() -> int | None:
+    """Return the id of the user the current request is made by."""
+    return user_id_var.get()
+
+
+def set_user_id(user_id: int | None) -> None:
+    """Attach the authenticated user to the current request context.
+
+    Requests of users selected by the debug log policy are logged at
+    DEBUG from this point on.
+    """
+    user_id_var.set(user_id)
+    if user_id is not None and user_id in _debug_policy.user_ids:
+        debug_logging_var.set(True)
+
+
+def _valid_request_id(value: str) -> bool:
+    return 0 < len(value) <= MAX_REQUEST_ID_LENGTH and value.isprintable()
+
+
+def _select_for_debug(policy: DebugLogPolicy, header: bytes | None) -> bool:
+    if (
+        policy.token is not None
+        and header is not None
+        and hmac.compare_digest(header, policy.token.encode())
+    ):
+        return True
+    return policy.sample_rate > 0 and random.random() < policy.sample_rate
+
+
+class RequestContextMiddleware:
+    """Binds a request id and the user id to each HTTP request.
+
+    The request id is taken from the ``X-Request-ID`` header when it is
+    valid, generated otherwise, and echoed in the response. Both values
+    are kept in context variables, so every log record emitted while the
+    request is handled can carry them. The request is also selected for
+    DEBUG logging according to the ``DebugLogPolicy``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware."""
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        policy = _debug_policy
+        request_id: str | None = None
+        debug_header: bytes | None = None
+        request_id_name = REQUEST_ID_HEADER.lower().encode()
+        debug_name = policy.header.lower().encode()
+        for name, value in scope["headers"]:
+            if name == request_id_name:
+                request_id = value.decode("latin-1")
+            elif name == debug_name:
+                debug_header = value
+        if request_id is None or not _valid_request_id(request_id):
+            request_id = uuid.uuid4().hex
+        debug = policy.active and _select_for_debug(policy, debug_header)
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        request_token = request_id_var.set(request_id)
+        user_token = user_id_var.set(None)
+        debug_token = debug_logging_var.set(debug)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            debug_logging_var.reset(debug_token)
+            user_id_var.reset(user_token)
+            request_id_var.reset(request_token)
+
+
+__all__ = [
+    "REQUEST_ID_HEADER",
+    "DebugLogPolicy",
+    "RequestContextMiddleware",
+    "configure_debug_logging",
+    "debug_logging_enabled",
+    "enable_debug_logging",
+    "get_request_id",
+    "get_user_id",
+    "set_user_id",
+]
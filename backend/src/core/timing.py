@@ -0,0 +1,167 @@
+import contextlib
+import functools
+import inspect
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from contextvars import ContextVar
+from types import TracebackType
+from typing import Any, Final, cast
+
+import sentry_sdk
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+SERVER_TIMING_HEADER: Final = "Server-Timing"
+
+phase_timings_var: ContextVar[dict[str, float] | None] = ContextVar(
+    "phase_timings", default=None
+)
+
+_sentry_spans = False
+_NULL_PHASE: Final[AbstractContextManager[None]] = contextlib.nullcontext()
+
+
+def configure_phase_spans(enabled: bool) -> None:
+    """Report phases as Sentry spans of the current transaction."""
+    global _sentry_spans  # noqa: PLW0603
+    _sentry_spans = enabled
+
+
+class _Phase:
+    """Times one phase of the current request."""
+
+    __slots__ = ("_span", "_start", "_timings", "name")
+
+    def __init__(self, name: str, timings: dict[str, float] | None) -> None:
+        self.name = name
+        self._timings = timings
+        self._span: Any = None
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        if _sentry_spans:
+            self._span = sentry_sdk.start_span(
+                op=self.name.partition(".")[0], name=self.name
+            )
+            self._span.__enter__()
+        self._start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        elapsed = time.perf_counter() - self._start
+        if self._timings is not None:
+            self._timings[self.name] = (
+                self._timings.get(self.name, 0.0) + elapsed
+            )
+        if self._span is not None:
+            self._span.__exit__(exc_type, exc_value, traceback)
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    """Time a phase of the current request.
+
+    Durations of phases with the same name are added up. When neither the
+    ``Server-Timing`` header nor Sentry spans are enabled, a shared no-op
+    context manager is returned, so instrumented hot paths only pay for a
+    global and a context variable lookup.
+
+    Args:
+        name: Phase name, a token such as ``db.user.get_by_email``; the
+            part before the first dot is the Sentry span operation.
+    """
+    timings = phase_timings_var.get()
+    if timings is None and not _sentry_spans:
+        return _NULL_PHASE
+    return _Phase(name, timings)
+
+
+def timed[F: Callable[..., Any]](name: str) -> Callable[[F], F]:
+    """Time every call of a function or coroutine function as a phase.
+
+    Args:
+        name: Phase name, see ``phase``.
+    """
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                with phase(name):
+                    return await func(*args, **kwargs)
+
+            return cast("F", async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            with phase(name):
+                return func(*args, **kwargs)
+
+        return cast("F", wrapper)
+
+    return decorator
+
+
+def format_server_timing(timings: dict[str, float]) -> str:
+    """Format phase durations as a ``Server-Timing`` header value.
+
+    Args:
+        timings: Durations in seconds, keyed by phase name.
+    """
+    return ", ".join(
+        f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items()
+    )
+
+
+class ServerTimingMiddleware:
+    """Reports the phases of each HTTP request in a ``Server-Timing`` header.
+
+    The header lists the phases that finished before the response started,
+    followed by ``app``, the time until then. Phase durations reveal, for
+    instance, whether a password was verified, so the middleware is meant
+    for trusted environments only.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware."""
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: dict[str, float] = {}
+        start = time.perf_counter()
+
+        async def send_with_timings(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                timings["app"] = time.perf_counter() - start
+                MutableHeaders(scope=message).append(
+                    SERVER_TIMING_HEADER, format_server_timing(timings)
+                )
+            await send(message)
+
+        token = phase_timings_var.set(timings)
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            phase_timings_var.reset(token)
+
+
+__all__ = [
+    "SERVER_TIMING_HEADER",
+    "ServerTimingMiddleware",
+    "configure_phase_spans",
+    "format_server_timing",
+    "phase",
+    "timed",
+]
@@ -4,15 +4,22 @@ from collections.abc import AsyncIterator
 
 from fastapi import FastAPI
 
+from src.auth.application.instance import password_verifier
 from src.auth.exceptions import register_auth_exception_handlers
-from src.core.config.logging import setup_logging
-from src.core.database import DB_MANAGER
+from src.auth.infra.security import HASHING_POOL
+from src.core.config.logging import setup_logging, shutdown_logging
+from src.core.database import DB_MANAGER, ReadYourWritesMiddleware
 from src.core.exceptions import register_exception_handlers
+from src.core.metrics.multiprocess import MULTIPROCESS_COLLECTOR
+from src.core.metrics.routes import router as metrics_router
+from src.core.request_context import RequestContextMiddleware
+from src.core.timing import ServerTimingMiddleware, configure_phase_spans
 
 from .api import api_router
 from .core.config import SERVER_SETTINGS as SETTINGS
 
 setup_logging()
+configure_phase_spans(SETTINGS.METRICS.phase_sentry_spans)
 
 log = logging.getLogger(__name__)
 
@@ -20,8 +27,15 @@ log = logging.getLogger(__name__)
 @contextlib.asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: ARG001
     """FastAPI lifespan context manager."""
+    if MULTIPROCESS_COLLECTOR is not None:
+        MULTIPROCESS_COLLECTOR.start()
+    await password_verifier.prepare()
     yield
+    if MULTIPROCESS_COLLECTOR is not None:
+        MULTIPROCESS_COLLECTOR.stop()
     await DB_MANAGER.dispose_engine()
+    HASHING_POOL.shutdown()
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -33,8 +47,19 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+if DB_MANAGER.router is not None:
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        read_your_writes_seconds=SETTINGS.DATABASE.read_your_writes_seconds,
+    )
+if SETTINGS.METRICS.server_timing:
+    app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(RequestContextMiddleware)
+
 # Register API router
 app.include_router(api_router)
+if SETTINGS.METRICS.enabled:
+    app.include_router(metrics_router)
 
 # Register exception handlers
 register_auth_exception_handlers(app=app)
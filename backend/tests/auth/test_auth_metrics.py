@@ -0,0 +1,22 @@
+import pytest
+
+from src.auth.exceptions import InvalidTokenError
+from src.auth.metrics import AuthMetrics
+from src.core.metrics import MetricsRegistry
+
+
+def test_track_records_outcome_and_duration() -> None:
+    """Operations are counted by outcome and timed whatever the outcome."""
+    metrics = AuthMetrics(MetricsRegistry())
+
+    with metrics.track("login"):
+        pass
+    with pytest.raises(InvalidTokenError), metrics.track("login"):
+        raise InvalidTokenError("Invalid token")
+    with pytest.raises(RuntimeError), metrics.track("login"):
+        raise RuntimeError
+
+    assert metrics.operations.value(("login", "success")) == 1
+    assert metrics.operations.value(("login", "InvalidTokenError")) == 1
+    assert metrics.operations.value(("login", "error")) == 1
+    assert metrics.operation_duration.count(("login",)) == 3
@@ -0,0 +1,55 @@
+import asyncio
+from collections.abc import Sequence
+
+from src.auth.domain.entities.user import User
+from src.auth.infra.repositories.cached_user_repository import (
+    CachedUserRepository,
+)
+from src.core.batch_loader import BatchLoader
+from src.core.cache import InMemoryCache, ReadThroughCache
+
+
+class FakeUserRepository:
+    """User source recording the batches of ids it loads."""
+
+    def __init__(self) -> None:
+        """Store users 1 and 2."""
+        self.users = {
+            id: User(id=id, email=f"{id}@example.com") for id in (1, 2)
+        }
+        self.batches: list[list[int]] = []
+
+    async def get_by_ids(self, ids: Sequence[int]) -> dict[int, User]:
+        """Return the stored users among ``ids``."""
+        self.batches.append(list(ids))
+        return {id: self.users[id] for id in ids if id in self.users}
+
+
+def test_cache_misses_by_id_are_batched() -> None:
+    """Concurrent id misses share one query; hits skip the loader."""
+    source = FakeUserRepository()
+    cache: ReadThroughCache[User] = ReadThroughCache(local=InMemoryCache())
+
+    def make_repository() -> CachedUserRepository:
+        return CachedUserRepository(
+            source,  # type: ignore[arg-type]
+            cache,
+            loader=BatchLoader(source.get_by_ids),
+        )
+
+    async def scenario() -> None:
+        repository = make_repository()
+        users = await asyncio.gather(
+            repository.get_by_id(1),
+            repository.get_by_id(2),
+            repository.get_by_id(3),
+        )
+        assert [user and user.id for user in users] == [1, 2, None]
+        assert source.batches == [[1, 2, 3]]
+
+        user = await make_repository().get_by_id(2)
+        assert user is not None
+        assert user.email == "2@example.com"
+        assert source.batches == [[1, 2, 3]]
+
+    asyncio.run(scenario())
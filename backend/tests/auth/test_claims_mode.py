@@ -0,0 +1,38 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+from src.auth.application import AuthenticationBackend, AuthManager
+from src.auth.application.instance import (
+    access_token_transport,
+    get_jwt_strategy,
+    refresh_token_transport,
+)
+from src.auth.domain.entities.user import User
+
+
+def test_current_principal_from_token_claims(admin_user_mock: User) -> None:
+    """Test claims mode resolves the user without touching the database."""
+    backend = AuthenticationBackend(
+        name="jwt",
+        jwt_strategy=get_jwt_strategy(),
+        bearer_transport=access_token_transport,
+        cookie_transport=refresh_token_transport,
+        embed_user_claims=True,
+    )
+    user_service = AsyncMock()
+    auth_manager = AuthManager(
+        authentication_backend=backend, user_service=user_service
+    )
+
+    async def scenario() -> User:
+        response = await backend.make_authentication_response(admin_user_mock)
+        access_token = json.loads(bytes(response.body))["access_token"]
+        return await auth_manager.current_principal(access_token)
+
+    principal = asyncio.run(scenario())
+
+    assert principal.id == admin_user_mock.id
+    assert principal.email == admin_user_mock.email
+    assert principal.is_superuser
+    user_service.get_active_user_by_id.assert_not_called()
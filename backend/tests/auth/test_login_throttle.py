@@ -0,0 +1,40 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.auth.application import AuthManager, LoginThrottle
+from src.auth.exceptions import TooManyLoginAttemptsError
+from src.core.rate_limit import InMemoryRateLimiter
+
+
+def test_throttled_login_skips_password_verification() -> None:
+    """Attempts over a limit are rejected before the user is loaded."""
+    user_service = AsyncMock()
+    user_service.authenticate.side_effect = RuntimeError("wrong password")
+    manager = AuthManager(
+        authentication_backend=AsyncMock(),
+        user_service=user_service,
+        login_throttle=LoginThrottle(
+            by_email=InMemoryRateLimiter(limit=2, window=60),
+            by_ip=InMemoryRateLimiter(limit=3, window=60),
+        ),
+    )
+
+    async def scenario() -> None:
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await manager.login("User@Example.com", "pw", "10.0.0.1")
+        with pytest.raises(TooManyLoginAttemptsError) as exc_info:
+            await manager.login("user@example.com", "pw", "10.0.0.2")
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers == {"Retry-After": "60"}
+
+        # The third attempt from the first address hits its IP limit.
+        with pytest.raises(RuntimeError):
+            await manager.login("other@example.com", "pw", "10.0.0.1")
+        with pytest.raises(TooManyLoginAttemptsError):
+            await manager.login("third@example.com", "pw", "10.0.0.1")
+
+    asyncio.run(scenario())
+    assert user_service.authenticate.await_count == 3
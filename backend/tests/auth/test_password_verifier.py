@@ -0,0 +1,57 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from src.auth.application import PasswordVerifier
+from src.core.rate_limit import InMemoryRateLimiter
+
+
+def test_repeated_unknown_email_waits_instead_of_hashing() -> None:
+    """Only the first attempt on an unknown email verifies a dummy hash."""
+    verifier = PasswordVerifier(
+        unknown_emails=InMemoryRateLimiter(limit=1, window=60)
+    )
+    sleep = AsyncMock()
+
+    async def scenario() -> None:
+        await verifier.verify_unknown("ghost@example.com", "pw")
+        assert verifier.latency is not None
+
+        verifier.verify = AsyncMock(wraps=verifier.verify)  # type: ignore[method-assign]
+        with patch("asyncio.sleep", sleep):
+            await verifier.verify_unknown("Ghost@example.com", "pw")
+            sleep.assert_awaited_once_with(verifier.latency)
+            verifier.verify.assert_not_awaited()
+
+            await verifier.verify_unknown("other@example.com", "pw")
+            verifier.verify.assert_awaited_once()
+
+    asyncio.run(scenario())
+
+
+def test_latency_is_a_moving_average() -> None:
+    """Verification durations are smoothed; "none" skips unknown users."""
+    verifier = PasswordVerifier(strategy="none", smoothing=0.5)
+    verifier.observe(0.1)
+    verifier.observe(0.3)
+    assert verifier.latency == 0.2
+
+    verifier.verify = AsyncMock()  # type: ignore[method-assign]
+    asyncio.run(verifier.verify_unknown("ghost@example.com", "pw"))
+    verifier.verify.assert_not_awaited()
+
+
+def test_prepare_hashes_the_dummy_password_up_front() -> None:
+    """After ``prepare`` an unknown email only verifies, never hashes."""
+    verifier = PasswordVerifier()
+
+    async def scenario() -> None:
+        await verifier.prepare()
+        assert verifier.latency is not None
+
+        with patch(
+            "src.auth.application.password_verifier.hash_password_async"
+        ) as hash_password:
+            await verifier.verify_unknown("ghost@example.com", "pw")
+            hash_password.assert_not_called()
+
+    asyncio.run(scenario())
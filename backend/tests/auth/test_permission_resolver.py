@@ -0,0 +1,168 @@
+import asyncio
+
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import Session
+
+from src.auth.application.instance import get_jwt_strategy
+from src.auth.application.permission_resolver import (
+    RBAC_TABLES,
+    PermissionResolver,
+)
+from src.auth.domain.entities.permission_set import (
+    PermissionCatalog,
+    PermissionSet,
+)
+from src.auth.domain.interfaces import IPermissionRepository
+from src.auth.infra.models import AuthRoleORM, UserORM, UserRoleAssignmentORM
+from src.auth.infra.strategies.base import PermissionClaims
+from src.core.cache import InMemoryCache, ReadThroughCache
+
+
+class FakePermissionRepository(IPermissionRepository):
+    """In-memory permission repository counting queries."""
+
+    def __init__(self) -> None:
+        """Grant ``users:read`` to user 1."""
+        self.catalog = {"users:read": 1, "users:write": 2}
+        self.granted: dict[int, list[int]] = {1: [1]}
+        self.queries = 0
+
+    async def get_catalog(self) -> dict[str, int]:
+        """Return the catalog."""
+        return dict(self.catalog)
+
+    async def get_user_permission_ids(self, user_id: int) -> list[int]:
+        """Return the granted permission ids."""
+        self.queries += 1
+        return self.granted.get(user_id, [])
+
+
+class RBACSession(Session):
+    """Session class the test resolver listens on."""
+
+
+def make_resolver() -> PermissionResolver:
+    """Create a resolver with an empty cache."""
+    return PermissionResolver(ReadThroughCache(local=InMemoryCache()))
+
+
+def test_permission_set_bit_operations() -> None:
+    """Permission bits are bits of one integer."""
+    permissions = PermissionSet.from_bits([1, 3])
+
+    assert 3 in permissions
+    assert 2 not in permissions
+    assert permissions.has_all(0b1010)
+    assert not permissions.has_all(0b0110)
+
+
+def test_catalog_assigns_dense_bits() -> None:
+    """Bits follow the order of the ids, not their values."""
+    catalog = PermissionCatalog.create({"users:read": 7, "users:write": 900})
+
+    assert catalog.mask(["users:write"]) == 0b10
+    assert catalog.permission_set([900, 7, 8]) == PermissionSet(0b11)
+    assert catalog.permission_set([900]).to_bitmap() == "Ag"
+
+
+def test_permission_claims_roundtrip_through_token() -> None:
+    """Token permissions decode to the issued set and catalog version."""
+    strategy = get_jwt_strategy()
+    permissions = PermissionSet.from_bits([1, 70])
+
+    for issued in (permissions, PermissionSet.all()):
+        token = strategy.create_access_token(
+            user_id=1,
+            permission_claims=PermissionClaims.from_permission_set(
+                issued, version="v1"
+            ),
+        )
+        claims = strategy.decode_token(token).permissions
+
+        assert claims is not None
+        assert claims.version == "v1"
+        assert claims.to_permission_set() == issued
+
+
+def test_catalog_versions_are_served_from_memory() -> None:
+    """Known catalog versions are resolved without the repository."""
+    resolver = make_resolver()
+    repository = FakePermissionRepository()
+    current = asyncio.run(resolver.get_catalog(repository))
+
+    assert current == PermissionCatalog.create(dict(repository.catalog))
+
+    repository.catalog["users:delete"] = 3
+    resolver.invalidate_all()
+
+    assert asyncio.run(resolver.get_catalog(repository, current.version)) == (
+        current
+    )
+    assert asyncio.run(resolver.get_catalog(repository)) != current
+
+
+def test_permissions_are_cached_until_invalidated() -> None:
+    """Checks hit the repository once per user until invalidation."""
+    resolver = make_resolver()
+    repository = FakePermissionRepository()
+
+    async def check(*names: str) -> bool:
+        return await resolver.has_permissions(1, names, repository)
+
+    assert asyncio.run(check("users:read"))
+    assert not asyncio.run(check("users:read", "users:write"))
+    assert not asyncio.run(check("unknown"))
+    assert repository.queries == 1
+
+    repository.granted[1] = [1, 2]
+    resolver.invalidate_user(1)
+    assert asyncio.run(check("users:read", "users:write"))
+    assert repository.queries == 2
+
+
+def test_committed_rbac_changes_invalidate_cache() -> None:
+    """Committed assignment changes invalidate the cached permissions."""
+    resolver = make_resolver()
+    resolver.listen(RBACSession)
+    repository = FakePermissionRepository()
+    engine = create_engine("sqlite://")
+    metadata = UserORM.metadata
+    metadata.create_all(
+        engine,
+        tables=[
+            metadata.tables[name]
+            for name in (UserORM.__tablename__, *RBAC_TABLES)
+        ],
+    )
+
+    async def load() -> None:
+        catalog = await resolver.get_catalog(repository)
+        await resolver.get_permissions(1, catalog, repository)
+
+    def cached_queries() -> int:
+        asyncio.run(load())
+        return repository.queries
+
+    assert cached_queries() == 1
+    with RBACSession(engine) as session:
+        session.add(UserORM(id=1, email="a@example.com", hashed_password="x"))
+        session.add(AuthRoleORM(id=1, name="admin", title="Admin"))
+        session.flush()
+        session.rollback()
+    assert cached_queries() == 1
+
+    with RBACSession(engine) as session:
+        session.add(UserORM(id=1, email="a@example.com", hashed_password="x"))
+        session.add(AuthRoleORM(id=1, name="admin", title="Admin"))
+        session.commit()
+    assert cached_queries() == 2
+
+    with RBACSession(engine) as session:
+        session.add(UserRoleAssignmentORM(user_id=1, role_id=1))
+        session.commit()
+    assert cached_queries() == 3
+
+    with RBACSession(engine) as session:
+        session.execute(delete(UserRoleAssignmentORM))
+        session.commit()
+    assert cached_queries() == 4
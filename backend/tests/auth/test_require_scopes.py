@@ -0,0 +1,80 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.auth.application import PermissionResolver
+from src.auth.application.instance import get_jwt_strategy
+from src.auth.dependencies import require_scopes
+from src.auth.domain.entities.permission_set import (
+    PermissionCatalog,
+    PermissionSet,
+)
+from src.auth.exceptions import PermissionDeniedError
+from src.auth.infra.strategies.base import PermissionClaims, TokenPayload
+from src.core.cache import InMemoryCache, ReadThroughCache
+
+CATALOG = {"users:read": 1, "users:write": 2}
+
+
+def make_token(permissions: PermissionSet | None) -> str:
+    """Create an access token, embedding permissions if given."""
+    catalog = PermissionCatalog.create(CATALOG)
+    return get_jwt_strategy().create_access_token(
+        user_id=1,
+        permission_claims=(
+            None
+            if permissions is None
+            else PermissionClaims.from_permission_set(
+                permissions, version=catalog.version
+            )
+        ),
+    )
+
+
+def check(token: str, *permissions: str) -> TokenPayload:
+    """Run the ``require_scopes`` dependency against a fresh catalog."""
+    uow = AsyncMock()
+    uow.permission_repo.get_catalog.return_value = CATALOG
+    resolver = PermissionResolver(
+        cache=ReadThroughCache(local=InMemoryCache())
+    )
+    dependency = require_scopes(*permissions)
+
+    async def run() -> TokenPayload:
+        return await dependency(token=token, uow=uow, token_revocation=None)
+
+    with patch("src.auth.dependencies.permission_resolver", resolver):
+        return asyncio.run(run())
+
+
+def test_granted_scopes_are_allowed() -> None:
+    """A token holding every required permission passes."""
+    catalog = PermissionCatalog.create(CATALOG)
+    mask = catalog.mask(["users:read"])
+    assert mask is not None
+    token = make_token(PermissionSet(mask))
+
+    assert check(token, "users:read").user_id == 1
+    with pytest.raises(PermissionDeniedError):
+        check(token, "users:read", "users:write")
+
+
+def test_unknown_permission_is_denied() -> None:
+    """A permission missing from the catalog is denied, even to '*'."""
+    with pytest.raises(PermissionDeniedError):
+        check(make_token(PermissionSet()), "users:delete")
+    with pytest.raises(PermissionDeniedError):
+        check(make_token(PermissionSet.all()), "users:delete")
+
+
+def test_superuser_holds_every_permission() -> None:
+    """The '*' bitmap grants every permission of the catalog."""
+    token = make_token(PermissionSet.all())
+    assert check(token, "users:read", "users:write").user_id == 1
+
+
+def test_token_without_permissions_is_denied() -> None:
+    """Tokens issued without a ``perm`` claim are never authorized."""
+    with pytest.raises(PermissionDeniedError):
+        check(make_token(None), "users:read")
@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from src.auth.exceptions import InvalidTokenError
+from src.auth.infra.strategies import RS256JWTStrategy, key_id_for
+
+
+def make_key() -> rsa.RSAPrivateKeyWithSerialization:
+    """Generate an RSA key for tests."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def write_keys(
+    directory: Path, key: rsa.RSAPrivateKeyWithSerialization
+) -> tuple[str, str]:
+    """Write a key pair as PEM files and return their paths."""
+    private_path = directory / "private.pem"
+    public_path = directory / "public.pem"
+    private_path.write_bytes(
+        key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    public_path.write_bytes(
+        key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+    return str(private_path), str(public_path)
+
+
+def test_tokens_carry_the_configured_or_derived_kid() -> None:
+    """Test the ``kid`` header and its selection on decode."""
+    key = make_key()
+    derived = RS256JWTStrategy(private_key=key)
+    custom = RS256JWTStrategy(private_key=key, key_id="2025-01")
+
+    token = custom.create_access_token(user_id=1)
+
+    assert derived.key_id == key_id_for(key.public_key())
+    assert jwt.get_unverified_header(token)["kid"] == "2025-01"
+    assert custom.decode_token(token).user_id == 1
+    with pytest.raises(InvalidTokenError):
+        derived.decode_token(token)
+
+
+def test_rotation_keeps_previous_key_under_its_kid(tmp_path: Path) -> None:
+    """Test tokens signed before a rotation still verify afterwards."""
+    old_key = make_key()
+    _, old_public_path = write_keys(tmp_path, old_key)
+    old = RS256JWTStrategy(private_key=old_key, key_id="2024-01")
+    old_token = old.create_access_token(user_id=1)
+
+    rotated = RS256JWTStrategy(
+        private_key=make_key(),
+        key_id="2025-01",
+        previous_public_keys={"2024-01": old_public_path},
+    )
+
+    assert rotated.decode_token(old_token).user_id == 1
+    assert rotated.decode_token(rotated.create_access_token(2)).user_id == 2
+
+
+def test_unknown_kid_is_rejected() -> None:
+    """Test a token whose ``kid`` names no trusted key is rejected."""
+    key = make_key()
+    strategy = RS256JWTStrategy(private_key=key)
+    token = RS256JWTStrategy(
+        private_key=key, key_id="unknown"
+    ).create_access_token(user_id=1)
+
+    with pytest.raises(InvalidTokenError):
+        strategy.decode_token(token)
+
+
+def test_reload_keys_rereads_disk_and_clears_cache(tmp_path: Path) -> None:
+    """Test reloading picks up new key files and drops cached tokens."""
+    private_path, public_path = write_keys(tmp_path, make_key())
+    strategy = RS256JWTStrategy(
+        private_key_path=private_path,
+        public_key_path=public_path,
+        decode_cache_size=10,
+    )
+    token = strategy.create_access_token(user_id=1)
+    strategy.decode_token(token)
+    old_key_id = strategy.key_id
+
+    write_keys(tmp_path, make_key())
+    strategy.reload_keys()
+
+    assert strategy.key_id != old_key_id
+    with pytest.raises(InvalidTokenError):
+        strategy.decode_token(token)
+    assert strategy.decode_token(strategy.create_access_token(2)).user_id == 2
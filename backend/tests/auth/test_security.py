@@ -0,0 +1,105 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+from passlib.hash import argon2
+
+from src.auth.application import UserService
+from src.auth.domain.entities.user import User
+from src.auth.exceptions import PasswordHashingUnavailableError
+from src.auth.infra.security import (
+    Argon2Parameters,
+    PasswordHashingPool,
+    calibrate_argon2,
+    hash_password_async,
+    password_needs_update,
+    verify_password_async,
+)
+
+
+def test_hash_and_verify_password_async() -> None:
+    """Test hashing and verification run through the hashing pool."""
+
+    async def scenario() -> None:
+        hashed_password = await hash_password_async("password123")
+        assert await verify_password_async("password123", hashed_password)
+        assert not await verify_password_async("wrong", hashed_password)
+
+    asyncio.run(scenario())
+
+
+def test_hashing_pool_rejects_when_saturated() -> None:
+    """Test the pool rejects jobs beyond workers plus queue depth."""
+    pool = PasswordHashingPool(max_workers=1, queue_size=0)
+    release = threading.Event()
+
+    async def scenario() -> None:
+        blocked = asyncio.create_task(pool.run(release.wait, 5))
+        await asyncio.sleep(0)
+        assert pool.in_flight == 1
+
+        with pytest.raises(PasswordHashingUnavailableError):
+            await pool.run(release.wait, 5)
+
+        release.set()
+        assert await blocked
+        assert pool.in_flight == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+
+
+def test_calibration_prefers_memory_within_target() -> None:
+    """Memory is halved until one pass fits, then passes are added."""
+
+    def measure(parameters: Argon2Parameters) -> float:
+        # 10 ms per pass over 16 MiB.
+        return parameters.time_cost * parameters.memory_cost / 16_384 * 0.01
+
+    def calibrate(memory_budget_kib: int) -> Argon2Parameters:
+        return calibrate_argon2(
+            target_seconds=0.05,
+            memory_budget_kib=memory_budget_kib,
+            concurrency=4,
+            parallelism=2,
+            measure=measure,
+        )
+
+    assert calibrate(4 * 131_072) == Argon2Parameters(1, 65_536, 2)
+    assert calibrate(4 * 32_768) == Argon2Parameters(2, 32_768, 2)
+
+
+def test_outdated_hash_is_rehashed_on_login() -> None:
+    """A successful login replaces a hash made with old parameters."""
+    hasher = argon2.using(  # type: ignore[no-untyped-call]
+        time_cost=1, memory_cost=8, parallelism=1
+    )
+    outdated = hasher.hash("password123")
+    user = User(
+        id=7,
+        email="user@example.com",
+        hashed_password=outdated,
+        is_active=True,
+    )
+    uow = AsyncMock()
+    uow.user_repo.get_by_email.return_value = user
+
+    authenticated = asyncio.run(
+        UserService(uow=uow).authenticate(user.email, "password123")
+    )
+
+    assert authenticated is user
+    uow.user_repo.update_hashed_password.assert_awaited_once()
+    _, new_hash = uow.user_repo.update_hashed_password.await_args.args
+    assert password_needs_update(outdated)
+    assert not password_needs_update(new_hash)
+    assert asyncio.run(verify_password_async("password123", new_hash))
+
+
+def test_default_costs_keep_passlib_hashes_current() -> None:
+    """Without configured costs, hashes made by passlib are not rehashed."""
+    default_hash = argon2.hash("password123")  # type: ignore[no-untyped-call]
+    assert not password_needs_update(default_hash)
@@ -0,0 +1,55 @@
+from src.auth.infra.strategies import TokenCache, TokenPayload
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1_000.0) -> None:
+        """Initialize the clock."""
+        self.now = now
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def make_payload(user_id: int) -> TokenPayload:
+    """Create an access token payload."""
+    return TokenPayload(user_id=user_id, token_type="access")
+
+
+def test_token_cache_hit_and_miss() -> None:
+    """Test cached payloads are returned and counted."""
+    cache = TokenCache(max_size=10, clock=FakeClock())
+    payload = make_payload(1)
+
+    assert cache.get("token") is None
+    cache.set("token", payload, expires_at=2_000.0)
+
+    assert cache.get("token") is payload
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_token_cache_evicts_at_expiry() -> None:
+    """Test an entry is never served at or after its expiration time."""
+    clock = FakeClock()
+    cache = TokenCache(max_size=10, clock=clock)
+    cache.set("token", make_payload(1), expires_at=1_010.0)
+
+    clock.now = 1_010.0
+
+    assert cache.get("token") is None
+    assert len(cache) == 0
+
+
+def test_token_cache_evicts_least_recently_used() -> None:
+    """Test the cache stays within its maximum size."""
+    cache = TokenCache(max_size=2, clock=FakeClock())
+    cache.set("first", make_payload(1), expires_at=2_000.0)
+    cache.set("second", make_payload(2), expires_at=2_000.0)
+    cache.get("first")
+    cache.set("third", make_payload(3), expires_at=2_000.0)
+
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third") is not None
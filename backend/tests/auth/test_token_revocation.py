@@ -0,0 +1,132 @@
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.auth.application.token_revocation import (
+    RevocationFilter,
+    TokenRevocationService,
+)
+from src.auth.exceptions import InvalidTokenError
+from src.auth.infra.repositories.revocation_store import (
+    InMemoryRevocationStore,
+)
+from src.auth.infra.strategies.base import TokenPayload
+
+
+def make_service(
+    store: InMemoryRevocationStore,
+    revocation_filter: RevocationFilter,
+    clock: Callable[[], float] = time.time,
+) -> TokenRevocationService:
+    """Build a service on an in-memory store."""
+    uow = AsyncMock()
+    uow.revocation_store = store
+    return TokenRevocationService(
+        uow=uow,
+        revocation_filter=revocation_filter,
+        refresh_token_lifetime=timedelta(days=30),
+        clock=clock,
+    )
+
+
+def refresh_payload(token_id: str, family_id: str = "family") -> TokenPayload:
+    """Build a decoded refresh token."""
+    return TokenPayload(
+        user_id=1,
+        token_type="refresh",
+        token_id=token_id,
+        family_id=family_id,
+        expires_at=4_000_000_000,
+    )
+
+
+def test_reused_refresh_token_revokes_family() -> None:
+    """A token is exchanged once; reusing it revokes its whole family."""
+    now = [1_000.0]
+    store = InMemoryRevocationStore(clock=lambda: now[0])
+    service = make_service(store, RevocationFilter(), clock=lambda: now[0])
+
+    async def scenario() -> None:
+        await service.rotate(refresh_payload("first"))
+        await service.rotate(refresh_payload("second"))
+        now[0] += 11
+
+        with pytest.raises(InvalidTokenError, match="reuse"):
+            await service.rotate(refresh_payload("first"))
+        with pytest.raises(InvalidTokenError, match="revoked"):
+            await service.rotate(refresh_payload("third"))
+        await service.rotate(refresh_payload("other", family_id="other"))
+
+    asyncio.run(scenario())
+    assert asyncio.run(store.is_revoked("family"))
+
+
+def test_concurrent_refreshes_share_the_grace_window() -> None:
+    """Concurrent exchanges of one token succeed and revoke nothing."""
+    store = InMemoryRevocationStore()
+    service = make_service(store, RevocationFilter())
+
+    async def scenario() -> None:
+        await asyncio.gather(
+            service.rotate(refresh_payload("first")),
+            service.rotate(refresh_payload("first")),
+        )
+        await service.rotate(refresh_payload("second"))
+
+    asyncio.run(scenario())
+    assert not asyncio.run(store.is_revoked("family"))
+
+
+def test_filter_skips_store_and_syncs_other_workers() -> None:
+    """Unrevoked ids are answered by the bloom filter alone."""
+    now = [0.0]
+    store = InMemoryRevocationStore()
+    revocation_filter = RevocationFilter(sync_interval=5, clock=lambda: now[0])
+    is_revoked = AsyncMock(wraps=store.is_revoked)
+    store.is_revoked = is_revoked  # type: ignore[method-assign]
+
+    async def scenario() -> None:
+        assert not await revocation_filter.is_revoked("family", store)
+        assert is_revoked.await_count == 0
+
+        # Revoked through another worker: seen after the next sync.
+        await store.revoke("family", expires_at=4_000_000_000, revoked_at=0.0)
+        assert not await revocation_filter.is_revoked("family", store)
+        now[0] = 5.0
+        assert await revocation_filter.is_revoked("family", store)
+        assert is_revoked.await_count == 1
+
+    asyncio.run(scenario())
+
+
+def test_access_token_denylist() -> None:
+    """Logged out tokens and tokens issued before a user revocation fail."""
+    clock = [1_000.0]
+    store = InMemoryRevocationStore(clock=lambda: clock[0])
+    service = make_service(store, RevocationFilter(), clock=lambda: clock[0])
+
+    def access_payload(token_id: str, issued_at: float) -> TokenPayload:
+        return TokenPayload(
+            user_id=1,
+            token_type="access",
+            token_id=token_id,
+            issued_at=issued_at,
+            expires_at=4_000_000_000,
+        )
+
+    async def scenario() -> None:
+        await service.check_token(access_payload("kept", 900.0))
+        await service.revoke_token(access_payload("logged-out", 900.0))
+        with pytest.raises(InvalidTokenError, match="revoked"):
+            await service.check_token(access_payload("logged-out", 900.0))
+
+        await service.revoke_user_tokens(1)
+        with pytest.raises(InvalidTokenError, match="revoked"):
+            await service.check_token(access_payload("kept", 900.0))
+        await service.check_token(access_payload("new", 1_001.0))
+
+    asyncio.run(scenario())
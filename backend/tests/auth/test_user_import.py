@@ -0,0 +1,152 @@
+import asyncio
+import json
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+import pytest
+from passlib.hash import argon2
+from pydantic import ValidationError
+
+from src.auth.application.user_import import (
+    ImportCheckpoint,
+    UserImportRecord,
+    UserImportService,
+)
+from src.auth.domain.entities.user import User
+from src.auth.infra.security import verify_password
+
+HASHED = argon2.using(  # type: ignore[no-untyped-call]
+    time_cost=1, memory_cost=8, parallelism=1
+).hash("secret-h")
+
+
+class FakeBulkRepository:
+    """Bulk repository storing users in memory."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        """Fail any chunk containing the ``fail_on`` email."""
+        self.users: dict[str, User] = {"taken@example.com": User("x")}
+        self.fail_on = fail_on
+
+    async def existing_emails(self, emails: Sequence[str]) -> set[str]:
+        """Return the already stored emails."""
+        return {email for email in emails if email in self.users}
+
+    async def add_users(self, users: Sequence[User]) -> list[User]:
+        """Store users, failing the whole chunk on the marked email."""
+        if any(user.email == self.fail_on for user in users):
+            raise RuntimeError("constraint violation")
+        self.users.update((user.email, user) for user in users)
+        return list(users)
+
+
+class FakeUnitOfWork:
+    """Unit of work exposing the fake bulk repository."""
+
+    def __init__(self, repository: FakeBulkRepository) -> None:
+        """Initialize the unit of work."""
+        self.user_bulk_repo = repository
+
+    async def __aenter__(self) -> Self:
+        """Enter the unit of work."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the unit of work."""
+
+
+def write_jsonl(path: Path, records: list[dict[str, object] | str]) -> None:
+    """Write records (or raw lines) as JSON Lines."""
+    lines = [r if isinstance(r, str) else json.dumps(r) for r in records]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_import_isolates_failures_and_resumes(tmp_path: Path) -> None:
+    """Bad rows and failing chunks are reported, the rest is imported."""
+    source = tmp_path / "users.jsonl"
+    write_jsonl(
+        source,
+        [
+            {"email": "a@example.com", "password": "secret-a"},
+            {"email": "taken@example.com", "hashed_password": HASHED},
+            {"email": "a@example.com", "hashed_password": HASHED},
+            "{not json",
+            {"email": "no-password@example.com"},
+            {"email": "bad@example.com", "hashed_password": HASHED},
+            {"email": "c@example.com", "hashed_password": HASHED},
+        ],
+    )
+    repository = FakeBulkRepository(fail_on="bad@example.com")
+    checkpoint = ImportCheckpoint(tmp_path / "users.checkpoint", source)
+    service = UserImportService(
+        uow_factory=lambda: FakeUnitOfWork(repository),  # type: ignore[arg-type, return-value]
+        chunk_size=2,
+        executor=ThreadPoolExecutor(max_workers=2),
+        on_progress=lambda report: None,  # noqa: ARG005
+    )
+
+    report = asyncio.run(service.import_file(source, checkpoint=checkpoint))
+
+    assert report.read == 7
+    assert report.imported == 1
+    assert report.existing == 1
+    assert report.duplicates == 1
+    assert [r.line for r in report.rejected] == [4, 5]
+    assert [(f.first_line, f.last_line) for f in report.failed_chunks] == [
+        (6, 7)
+    ]
+    hashed_password = repository.users["a@example.com"].hashed_password
+    assert hashed_password is not None
+    assert verify_password("secret-a", hashed_password)
+    assert checkpoint.load() == 2
+
+    repository.fail_on = None
+    report = asyncio.run(service.import_file(source, checkpoint=checkpoint))
+
+    assert report.existing == 1
+    assert report.imported == 2
+    assert "c@example.com" in repository.users
+    assert checkpoint.load() == 7
+
+
+def test_import_reads_csv(tmp_path: Path) -> None:
+    """CSV rows are imported with empty cells treated as missing."""
+    source = tmp_path / "users.csv"
+    source.write_text(
+        "email,hashed_password,first_name,is_verified\n"
+        f'd@example.com,"{HASHED}",Dana,true\n'
+        f'e@example.com,"{HASHED}",,\n',
+        encoding="utf-8",
+    )
+    repository = FakeBulkRepository()
+    service = UserImportService(
+        uow_factory=lambda: FakeUnitOfWork(repository),  # type: ignore[arg-type, return-value]
+        executor=ThreadPoolExecutor(max_workers=1),
+        on_progress=lambda report: None,  # noqa: ARG005
+    )
+
+    report = asyncio.run(service.import_file(source))
+
+    assert report.imported == 2
+    user = repository.users["d@example.com"]
+    assert user.is_verified
+    assert user.profile is not None
+    assert user.profile.first_name == "Dana"
+    assert repository.users["e@example.com"].profile.first_name is None  # type: ignore[union-attr]
+
+
+def test_import_rejects_unsupported_hashes() -> None:
+    """Imported hashes must be verifiable by the password context."""
+    record = UserImportRecord(email="a@example.com", hashed_password=HASHED)
+
+    assert record.hashed_password == HASHED
+    with pytest.raises(ValidationError, match="unsupported scheme"):
+        UserImportRecord(email="a@example.com", hashed_password="md5:abc")
@@ -84,6 +84,18 @@ def auth_uow(admin_user_mock: User) -> Generator[AsyncMock]:
     user_repo_mock.get_by_id.side_effect = mock_get_by_id
     uow_mock.user_repo = user_repo_mock
 
+    permission_repo_mock = AsyncMock()
+    permission_repo_mock.get_catalog.return_value = {"users:read": 1}
+    permission_repo_mock.get_user_permission_ids.return_value = []
+    uow_mock.permission_repo = permission_repo_mock
+
+    revocation_store_mock = AsyncMock()
+    revocation_store_mock.consume.return_value = True
+    revocation_store_mock.is_revoked.return_value = False
+    revocation_store_mock.revoked_at.return_value = None
+    revocation_store_mock.revoked_since.return_value = []
+    uow_mock.revocation_store = revocation_store_mock
+
     fastapi_app.dependency_overrides[get_auth_uow] = lambda: uow_mock
 
     yield uow_mock
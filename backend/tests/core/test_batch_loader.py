@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from src.core.batch_loader import BatchLoader
+
+
+class FakeSource:
+    """Batch function recording the requested keys."""
+
+    def __init__(self, fail: bool = False) -> None:
+        """Initialize the source."""
+        self.calls: list[list[int]] = []
+        self.fail = fail
+
+    async def load(self, keys: list[int]) -> dict[int, str]:
+        """Return a value for every even key."""
+        self.calls.append(keys)
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        return {key: f"user-{key}" for key in keys if key % 2 == 0}
+
+
+def test_concurrent_loads_are_coalesced() -> None:
+    """Loads of one iteration become one deduplicated batch."""
+    source = FakeSource()
+    loader = BatchLoader(source.load)
+
+    async def scenario() -> list[str | None]:
+        return list(
+            await asyncio.gather(
+                loader.load(4), loader.load(1), loader.load(4), loader.load(2)
+            )
+        )
+
+    assert asyncio.run(scenario()) == ["user-4", None, "user-4", "user-2"]
+    assert source.calls == [[4, 1, 2]]
+
+
+def test_cached_keys_are_not_loaded_again() -> None:
+    """Later loads of a known key are served from the loader."""
+    source = FakeSource()
+    loader = BatchLoader(source.load, max_batch_size=2)
+
+    async def scenario() -> None:
+        await loader.load_many([2, 4, 6])
+        await loader.load_many([2, 8])
+
+    asyncio.run(scenario())
+
+    assert source.calls == [[2, 4], [6], [8]]
+
+
+def test_batch_errors_reach_every_caller() -> None:
+    """A failing batch fails its callers and is retried on the next load."""
+    source = FakeSource(fail=True)
+    loader = BatchLoader(source.load)
+
+    async def scenario() -> str | None:
+        with pytest.raises(RuntimeError):
+            await loader.load_many([1, 2])
+        source.fail = False
+        return await loader.load(2)
+
+    assert asyncio.run(scenario()) == "user-2"
+    assert source.calls == [[1, 2], [2]]
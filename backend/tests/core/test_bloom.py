@@ -0,0 +1,15 @@
+from src.core.bloom import BloomFilter
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    """Added items are always found; others rarely are."""
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    bloom.update(f"added-{i}" for i in range(10_000))
+
+    assert all(f"added-{i}" in bloom for i in range(10_000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10_000))
+    assert false_positives < 200
+    assert not bloom.saturated
+
+    bloom.add("one-more")
+    assert bloom.saturated
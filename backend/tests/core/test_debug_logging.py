@@ -0,0 +1,88 @@
+import contextvars
+import logging
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.config.logging import (
+    RequestLevelFilter,
+    configure_debug_loggers,
+)
+from src.core.request_context import (
+    DebugLogPolicy,
+    RequestContextMiddleware,
+    configure_debug_logging,
+    debug_logging_enabled,
+    set_user_id,
+)
+
+
+@pytest.fixture
+def debug_app() -> Iterator[FastAPI]:
+    """App reporting whether its requests are logged at DEBUG."""
+    configure_debug_logging(
+        DebugLogPolicy(token="secret", user_ids=frozenset({7}))
+    )
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/")
+    async def index(user_id: int | None = None) -> bool:
+        set_user_id(user_id)
+        return debug_logging_enabled()
+
+    yield app
+    configure_debug_logging(DebugLogPolicy())
+
+
+def test_requests_are_selected_by_token_and_user(debug_app: FastAPI) -> None:
+    """The debug header needs the token; listed users are selected."""
+    with TestClient(debug_app) as client:
+        assert client.get("/").json() is False
+        assert (
+            client.get("/", headers={"X-Debug-Log": "guess"}).json() is False
+        )
+        assert client.get("/", headers={"X-Debug-Log": "secret"}).json()
+        assert client.get("/", params={"user_id": 7}).json()
+        assert client.get("/", params={"user_id": 8}).json() is False
+
+    assert not debug_logging_enabled()
+
+
+def test_request_level_filter() -> None:
+    """DEBUG records pass only for requests selected for DEBUG logging."""
+    level_filter = RequestLevelFilter(logging.INFO)
+    debug_record = logging.makeLogRecord({"levelno": logging.DEBUG})
+    info_record = logging.makeLogRecord({"levelno": logging.INFO})
+
+    assert level_filter.filter(info_record)
+    assert not level_filter.filter(debug_record)
+
+    def selected_user_request() -> bool:
+        set_user_id(1)
+        return level_filter.filter(debug_record)
+
+    configure_debug_logging(DebugLogPolicy(user_ids=frozenset({1})))
+    try:
+        assert contextvars.copy_context().run(selected_user_request)
+    finally:
+        configure_debug_logging(DebugLogPolicy())
+    assert not level_filter.filter(debug_record)
+
+
+def test_debug_policy_only_raises_application_loggers() -> None:
+    """Third-party loggers keep the root level under a debug policy."""
+    root_level = logging.getLogger().getEffectiveLevel()
+    configure_debug_loggers(active=True)
+    try:
+        assert logging.getLogger("src.auth").getEffectiveLevel() == (
+            logging.DEBUG
+        )
+        assert logging.getLogger("vendor.engine").getEffectiveLevel() == (
+            root_level
+        )
+    finally:
+        configure_debug_loggers(active=False)
+    assert logging.getLogger("src").level == logging.NOTSET
@@ -0,0 +1,82 @@
+import json
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.config.log_formatters import (
+    JsonFormatter,
+    install_context_record_factory,
+    lazy,
+)
+from src.core.request_context import (
+    REQUEST_ID_HEADER,
+    RequestContextMiddleware,
+    get_request_id,
+    set_user_id,
+)
+
+
+def test_json_formatter_fields() -> None:
+    """Records render as JSON with context, extras and lazy fields."""
+    calls: list[int] = []
+
+    def expensive() -> dict[str, int]:
+        calls.append(1)
+        return {"roles": 3}
+
+    record = logging.makeLogRecord({
+        "name": "auth",
+        "levelno": logging.INFO,
+        "levelname": "INFO",
+        "msg": "Login | email=%r",
+        "args": ('a"b@example.com',),
+        "request_id": "req-1",
+        "user_id": 7,
+        "stats": lazy(expensive),
+    })
+    assert calls == []
+
+    data = json.loads(JsonFormatter().format(record))
+
+    assert data["message"] == "Login | email='a\"b@example.com'"
+    assert data["level"] == "INFO"
+    assert data["logger"] == "auth"
+    assert data["request_id"] == "req-1"
+    assert data["user_id"] == 7
+    assert data["stats"] == {"roles": 3}
+    assert data["time"].endswith("Z")
+    assert calls == [1]
+
+
+def test_request_context_is_stamped_on_records() -> None:
+    """Records emitted in a request carry its request and user ids."""
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+    records: list[logging.LogRecord] = []
+
+    @app.get("/")
+    async def index() -> dict[str, str | None]:
+        set_user_id(42)
+        records.append(
+            logging.getLogger("test").makeRecord(
+                "test", logging.INFO, __file__, 1, "handled", (), None
+            )
+        )
+        return {"request_id": get_request_id()}
+
+    factory = logging.getLogRecordFactory()
+    install_context_record_factory()
+    try:
+        with TestClient(app) as client:
+            response = client.get("/", headers={REQUEST_ID_HEADER: "abc-123"})
+            generated = client.get("/")
+    finally:
+        logging.setLogRecordFactory(factory)
+
+    assert response.json() == {"request_id": "abc-123"}
+    assert response.headers[REQUEST_ID_HEADER] == "abc-123"
+    assert len(generated.headers[REQUEST_ID_HEADER]) == 32
+    assert getattr(records[0], "request_id", None) == "abc-123"
+    assert getattr(records[0], "user_id", None) == 42
+    assert get_request_id() is None
@@ -0,0 +1,91 @@
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.auth.infra.models.user_orm import UserORM
+from src.auth.infra.models.user_profile_orm import UserProfileORM
+from src.core.exceptions import InvalidRequestError
+from src.core.repository import (
+    Cursor,
+    SQLAlchemyRepository,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class UserRepository(SQLAlchemyRepository[UserORM]):
+    """Repository under test."""
+
+    model = UserORM
+
+
+class ProfileRepository(SQLAlchemyRepository[UserProfileORM]):
+    """Repository of a model with nullable columns."""
+
+    model = UserProfileORM
+
+
+def make_repository(rows: list[UserORM]) -> tuple[UserRepository, list[Any]]:
+    """Create a repository whose session returns ``rows``."""
+    statements: list[Any] = []
+
+    async def scalars(stmt: Any) -> MagicMock:  # noqa: ANN401, RUF029
+        statements.append(stmt)
+        result = MagicMock()
+        result.all.return_value = rows[: stmt._limit_clause.value]
+        return result
+
+    session = MagicMock()
+    session.scalars = AsyncMock(side_effect=scalars)
+    return UserRepository(session), statements
+
+
+def test_cursor_round_trip() -> None:
+    """Cursors survive encoding, including datetime values."""
+    cursor = Cursor("created_at", True, datetime.now(UTC), 42)
+
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+
+def test_malformed_cursor_is_rejected() -> None:
+    """A tampered cursor raises a client error."""
+    with pytest.raises(InvalidRequestError):
+        decode_cursor("not-a-cursor")
+
+
+def test_get_page_seeks_after_cursor() -> None:
+    """The next page is read with a row-value comparison, not OFFSET."""
+    rows = [UserORM(id=i, email=f"{i}@example.com") for i in (1, 2, 3)]
+    repository, statements = make_repository(rows)
+
+    page = asyncio.run(repository._get_page_core(limit=2, order_by="email"))
+
+    assert [u.id for u in page.items] == [1, 2]
+    assert page.next_cursor is not None
+
+    asyncio.run(
+        repository._get_page_core(
+            limit=2, cursor=page.next_cursor, order_by="email"
+        )
+    )
+    dialect = postgresql.dialect()  # type: ignore[no-untyped-call]
+    sql = str(statements[-1].compile(dialect=dialect))
+
+    assert "(users.email, users.id) > (" in sql
+    assert "OFFSET" not in sql
+
+    with pytest.raises(InvalidRequestError):
+        asyncio.run(repository._get_page_core(cursor=page.next_cursor))
+
+
+def test_get_page_rejects_nullable_and_unknown_columns() -> None:
+    """Rows with NULL in the order column would be skipped by the seek."""
+    repository = ProfileRepository(MagicMock())
+
+    for order_by in ("last_name", "user", "missing"):
+        with pytest.raises(InvalidRequestError):
+            asyncio.run(repository._get_page_core(order_by=order_by))
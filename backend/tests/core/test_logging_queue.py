@@ -0,0 +1,71 @@
+import logging
+import queue
+import threading
+
+from src.core.config.logging import DroppingQueueHandler, LogQueueListener
+
+
+class RecordingHandler(logging.Handler):
+    """Handler keeping the messages and the threads writing them."""
+
+    def __init__(self) -> None:
+        """Initialize the handler."""
+        super().__init__()
+        self.messages: list[str] = []
+        self.threads: set[str] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Record the message."""
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.current_thread().name)
+
+
+def make_logger(handler: logging.Handler) -> logging.Logger:
+    """Create an isolated logger writing to ``handler``."""
+    logger = logging.getLogger(f"test.logging_queue.{id(handler)}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.handlers = [handler]
+    return logger
+
+
+def test_records_are_written_on_listener_thread() -> None:
+    """Records are written by the listener and flushed on stop."""
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=100)
+    queue_handler = DroppingQueueHandler(log_queue)
+    output = RecordingHandler()
+    listener = LogQueueListener(log_queue, queue_handler, output)
+    logger = make_logger(queue_handler)
+    user = {"id": 1}
+
+    listener.start()
+    logger.info("User %r logged in", user)
+    user["id"] = 2
+    listener.stop()
+
+    assert output.messages == ["User {'id': 1} logged in"]
+    assert threading.current_thread().name not in output.threads
+
+
+def test_full_queue_drops_and_reports_records() -> None:
+    """A full queue drops records and the listener reports the count."""
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=2)
+    queue_handler = DroppingQueueHandler(log_queue)
+    output = RecordingHandler()
+    listener = LogQueueListener(log_queue, queue_handler, output)
+    logger = make_logger(queue_handler)
+
+    for number in range(5):
+        logger.info("Record %d", number)
+    assert queue_handler.dropped == 3
+
+    listener.start()
+    logger.info("After overload")
+    listener.stop()
+
+    assert output.messages == [
+        "Logging queue full, 3 records dropped",
+        "Record 0",
+        "Record 1",
+        "After overload",
+    ]
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import pytest
+
+from src.core.config import SERVER_SETTINGS as SETTINGS
+from src.core.database import DB_MANAGER, DatabaseManager
+from src.core.metrics import METRICS_REGISTRY, MetricsRegistry
+from src.core.metrics.multiprocess import MultiProcessCollector
+
+
+def test_render_prometheus_text() -> None:
+    """Metrics are rendered in the Prometheus text format."""
+    registry = MetricsRegistry()
+    requests = registry.counter("requests", "Handled requests.", ["status"])
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=[1])
+    registry.gauge("in_flight", "In-flight requests.").set(3)
+
+    requests.inc(labels=("ok",))
+    requests.inc(2, labels=("ok",))
+    latency.observe(0.5)
+    latency.observe(2)
+
+    text = registry.render()
+
+    assert "# TYPE requests counter" in text
+    assert 'requests_total{status="ok"} 3.0' in text
+    assert 'latency_seconds_bucket{le="1.0"} 1' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "latency_seconds_sum 2.5" in text
+    assert "in_flight 3.0" in text
+
+
+def test_registry_rejects_conflicting_metric() -> None:
+    """A name cannot be reused for a metric of another type."""
+    registry = MetricsRegistry()
+    counter = registry.counter("events", "Events.")
+
+    assert registry.counter("events", "Events.") is counter
+    with pytest.raises(ValueError, match="registered differently"):
+        registry.gauge("events", "Events.")
+
+
+def test_database_pool_metrics_exported() -> None:
+    """Pool gauges are read from the engine's pool at collection time."""
+    snapshot = DB_MANAGER.pool_snapshot()
+
+    assert snapshot is not None
+    assert snapshot.checked_out == 0
+    assert (
+        'db_pool_checked_out{engine="primary"} 0.0'
+        in METRICS_REGISTRY.render()
+    )
+
+
+def test_replica_pools_are_instrumented() -> None:
+    """Each read replica reports its pool under its own engine label."""
+    registry = MetricsRegistry()
+    manager = DatabaseManager(
+        db_settings=SETTINGS.DATABASE.model_copy(
+            update={"read_replica_hosts": ["replica-a", "replica-b:6432"]}
+        ),
+        metrics_registry=registry,
+    )
+
+    snapshot = manager.pool_snapshot(replica=1)
+
+    assert snapshot is not None
+    assert snapshot.checked_out == 0
+    text = registry.render()
+    for engine in ("primary", "replica0", "replica1"):
+        assert f'db_pool_size{{engine="{engine}"}}' in text
+
+
+def test_multiprocess_collector_merges_workers(tmp_path: Path) -> None:
+    """Counters of all workers are summed, gauges of exited ones dropped."""
+    dead_worker = MetricsRegistry()
+    dead_worker.counter("logins", "Logins.", ["outcome"]).inc(
+        2, labels=("ok",)
+    )
+    dead_worker.gauge("in_flight", "In-flight requests.").set(5)
+    dead_worker.histogram("latency", "Latency.", buckets=[1]).observe(0.5)
+    dead_collector = MultiProcessCollector(dead_worker, tmp_path)
+    dead_collector.write()
+    dead_file = next(tmp_path.iterdir())
+    dead_file.rename(tmp_path / "metrics-999999999.json")
+
+    worker = MetricsRegistry()
+    worker.counter("logins", "Logins.", ["outcome"]).inc(labels=("ok",))
+    worker.gauge("in_flight", "In-flight requests.").set(1)
+    worker.histogram("latency", "Latency.", buckets=[1]).observe(2)
+    collector = MultiProcessCollector(
+        worker, tmp_path, pid_alive=lambda pid: pid != 999999999
+    )
+
+    text = collector.render()
+
+    assert 'logins_total{outcome="ok"} 3.0' in text
+    assert "in_flight 1.0" in text
+    assert 'latency_bucket{le="1.0"} 1' in text
+    assert 'latency_bucket{le="+Inf"} 2' in text
+    assert "latency_count 2" in text
+
+    collector.clear()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,51 @@
+import asyncio
+
+from src.core.cache import InMemoryCache
+from src.core.rate_limit import GCRARateLimiter, InMemoryRateLimiter
+
+
+def test_sliding_window_limits_every_window() -> None:
+    """Events are allowed again once the oldest leaves the window."""
+    now = [0.0]
+    limiter = InMemoryRateLimiter(
+        limit=3, window=10, max_keys=2, clock=lambda: now[0]
+    )
+
+    async def scenario() -> None:
+        for t in (0.0, 4.0, 8.0):
+            now[0] = t
+            assert await limiter.acquire("a") == 0.0
+        now[0] = 9.0
+        assert await limiter.acquire("a") == 1.0
+        now[0] = 10.0
+        assert await limiter.acquire("a") == 0.0
+        assert await limiter.acquire("a") == 4.0
+
+        # The least recently used key is evicted and starts over.
+        await limiter.acquire("b")
+        await limiter.acquire("c")
+        assert len(limiter) == 2
+        assert await limiter.acquire("a") == 0.0
+
+    asyncio.run(scenario())
+
+
+def test_gcra_allows_burst_then_steady_rate() -> None:
+    """A full burst is allowed, then one event per emission interval."""
+    now = [1_000.0]
+    limiter = GCRARateLimiter(
+        InMemoryCache(clock=lambda: now[0]),
+        limit=5,
+        window=10,
+        clock=lambda: now[0],
+    )
+
+    async def scenario() -> None:
+        assert [await limiter.acquire("a") for _ in range(5)] == [0.0] * 5
+        assert await limiter.acquire("a") == 2.0
+        assert await limiter.acquire("b") == 0.0
+        now[0] += 2.0
+        assert await limiter.acquire("a") == 0.0
+        assert await limiter.acquire("a") == 2.0
+
+    asyncio.run(scenario())
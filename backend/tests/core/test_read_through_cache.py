@@ -0,0 +1,44 @@
+import asyncio
+
+from src.core.cache import InMemoryCache, ReadThroughCache
+
+
+def test_cold_key_is_loaded_once() -> None:
+    """Test concurrent lookups of a cold key share one loader call."""
+    cache: ReadThroughCache[str] = ReadThroughCache(
+        local=InMemoryCache(), shared=InMemoryCache()
+    )
+    calls = 0
+
+    async def loader() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def scenario() -> list[str | None]:
+        return await asyncio.gather(
+            *(cache.get_or_load("key", loader) for _ in range(10))
+        )
+
+    assert asyncio.run(scenario()) == ["value"] * 10
+    assert calls == 1
+
+
+def test_invalidation_during_load_is_not_overwritten() -> None:
+    """Test a value loaded before an invalidation is not cached."""
+    shared: InMemoryCache[str] = InMemoryCache()
+    cache: ReadThroughCache[str] = ReadThroughCache(
+        local=InMemoryCache(), shared=shared
+    )
+
+    async def scenario() -> str | None:
+        async def loader() -> str:
+            await cache.invalidate("key")
+            return "stale"
+
+        await cache.get_or_load("key", loader)
+        return await cache.get("key")
+
+    assert asyncio.run(scenario()) is None
+    assert len(shared) == 0
@@ -0,0 +1,138 @@
+import asyncio
+
+from sqlalchemy import column, create_engine, insert, select, table, text
+from starlette.types import Message, Receive, Scope, Send
+
+from src.auth.infra.models.user_orm import UserORM
+from src.core.database.routing import (
+    READ_ONLY_KEY,
+    ROUTER_KEY,
+    ReadYourWritesMiddleware,
+    ReplicaRouter,
+    RoutingSession,
+    read_your_writes,
+    read_your_writes_var,
+)
+from src.core.database.session import UOW_DEPTH_KEY
+
+scratch_table = table("t", column("id"))
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def make_router(clock: FakeClock) -> ReplicaRouter:
+    """Create a router over in-memory databases."""
+    return ReplicaRouter(
+        primary=create_engine("sqlite://"),
+        replicas=[create_engine("sqlite://"), create_engine("sqlite://")],
+        read_your_writes_seconds=5.0,
+        clock=clock,
+    )
+
+
+def test_marked_reads_go_to_replicas_round_robin() -> None:
+    """Marked reads alternate between replicas, others use the primary."""
+    router = make_router(FakeClock())
+    session = RoutingSession(info={ROUTER_KEY: router})
+    stmt = select(UserORM)
+
+    assert session.get_bind(clause=stmt) is router.primary
+
+    session.info[READ_ONLY_KEY] = True
+    assert session.get_bind(clause=stmt) is router.replicas[0]
+    assert session.get_bind(clause=stmt) is router.replicas[1]
+    assert session.get_bind(clause=insert(UserORM)) is router.primary
+
+    session.info[UOW_DEPTH_KEY] = 1
+    assert session.get_bind(clause=stmt) is router.primary
+
+
+def test_commit_with_writes_pins_reads_of_the_writer() -> None:
+    """Only the writer's reads stay on the primary for the window."""
+    clock = FakeClock()
+    router = make_router(clock)
+    session = RoutingSession(info={ROUTER_KEY: router})
+    stmt = select(UserORM)
+
+    with read_your_writes() as pin:
+        session.execute(text("CREATE TABLE t (id INTEGER)"))
+        session.execute(insert(scratch_table).values(id=1))
+        session.commit()
+        assert pin.until == 5.0
+
+        session.info[READ_ONLY_KEY] = True
+        assert session.get_bind(clause=stmt) is router.primary
+
+        with read_your_writes():
+            assert session.get_bind(clause=stmt) in router.replicas
+
+        clock.now = 5.0
+        assert session.get_bind(clause=stmt) in router.replicas
+
+    assert read_your_writes_var.get() is None
+    assert session.get_bind(clause=stmt) in router.replicas
+
+
+def test_middleware_carries_the_window_in_a_cookie() -> None:
+    """A write sets the cookie, which pins the next request's reads."""
+    clock = FakeClock()
+    router = make_router(clock)
+    until: list[float] = []
+
+    async def app(
+        scope: Scope,
+        receive: Receive,  # noqa: ARG001
+        send: Send,
+    ) -> None:
+        pin = read_your_writes_var.get()
+        assert pin is not None
+        until.append(pin.until)
+        if scope["path"] == "/write":
+            router.mark_written()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [],
+        })
+
+    middleware = ReadYourWritesMiddleware(
+        app, read_your_writes_seconds=5.0, clock=clock
+    )
+
+    def call(path: str, cookie: str | None = None) -> list[Message]:
+        headers = [] if cookie is None else [(b"cookie", cookie.encode())]
+        scope = {"type": "http", "path": path, "headers": headers}
+        sent: list[Message] = []
+
+        async def receive() -> Message:  # noqa: RUF029
+            return {"type": "http.request"}
+
+        async def send(message: Message) -> None:  # noqa: RUF029
+            sent.append(message)
+
+        asyncio.run(middleware(scope, receive, send))
+        return sent
+
+    assert call("/read")[0]["headers"] == []
+    clock.now = 1.0
+    (cookie,) = [
+        value.decode()
+        for name, value in call("/write")[0]["headers"]
+        if name == b"set-cookie"
+    ]
+    assert cookie.startswith("primary_reads_until=6.000; Max-Age=5;")
+
+    assert call("/read", cookie.split(";")[0])[0]["headers"] == []
+    assert call("/read", "primary_reads_until=1e9")[0]["headers"] == []
+    assert call("/read", "primary_reads_until=bad")[0]["headers"] == []
+    assert until == [0.0, 0.0, 6.0, 6.0, 0.0]
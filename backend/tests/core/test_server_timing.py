@@ -0,0 +1,47 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.timing import (
+    SERVER_TIMING_HEADER,
+    ServerTimingMiddleware,
+    phase,
+    timed,
+)
+
+
+@timed("db.lookup")
+async def lookup() -> int:  # noqa: RUF029
+    """Stand-in for an instrumented repository method."""
+    return 1
+
+
+def test_phases_are_reported_in_server_timing_header() -> None:
+    """Phases of a request are summed by name and sent in the header."""
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+
+    @app.get("/")
+    async def index() -> dict[str, int]:
+        with phase("password.verify"):
+            await asyncio.sleep(0.01)
+        return {"value": await lookup() + await lookup()}
+
+    with TestClient(app) as client:
+        response = client.get("/")
+
+    assert response.json() == {"value": 2}
+    entries = dict(
+        entry.split(";dur=")
+        for entry in response.headers[SERVER_TIMING_HEADER].split(", ")
+    )
+    assert list(entries) == ["password.verify", "db.lookup", "app"]
+    assert float(entries["password.verify"]) >= 10
+    assert float(entries["app"]) >= float(entries["password.verify"])
+
+
+def test_phase_is_noop_outside_timed_requests() -> None:
+    """Without a request recorder, phases share one no-op context."""
+    assert phase("db.lookup") is phase("jwt.encode")
+    assert asyncio.run(lookup()) == 1
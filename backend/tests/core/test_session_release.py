@@ -0,0 +1,80 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy import column, create_engine, insert, table, text
+
+from src.core.database import (
+    RoutingSession,
+    SQLAUnitOfWork,
+    release_connection,
+)
+from src.core.database.session import EARLY_RELEASE_KEY, WROTE_KEY
+
+
+def make_session(early_release: bool = True) -> MagicMock:
+    """Create a session mock holding a connection with no pending state."""
+    session = MagicMock()
+    session.info = {EARLY_RELEASE_KEY: early_release}
+    session.in_transaction.return_value = True
+    session.new = session.dirty = session.deleted = ()
+    session.close = AsyncMock()
+    session.commit = AsyncMock()
+    return session
+
+
+def test_release_connection_after_read() -> None:
+    """A read outside a unit of work releases the connection."""
+    session = make_session()
+
+    assert asyncio.run(release_connection(session))
+    session.close.assert_awaited_once()
+
+
+def test_release_connection_keeps_connection_in_unit_of_work() -> None:
+    """Reads inside a unit of work keep the transaction open."""
+    session = make_session()
+
+    async def scenario() -> tuple[bool, bool]:
+        async with SQLAUnitOfWork(session):
+            inside = await release_connection(session)
+        return inside, await release_connection(session)
+
+    inside, after = asyncio.run(scenario())
+
+    assert not inside
+    assert after
+    session.commit.assert_awaited_once()
+
+
+def test_release_connection_keeps_pending_changes() -> None:
+    """Pending changes are never discarded by an early release."""
+    session = make_session()
+    session.new = (object(),)
+
+    assert not asyncio.run(release_connection(session))
+    session.close.assert_not_awaited()
+
+
+def test_release_connection_keeps_uncommitted_writes() -> None:
+    """Writes made outside a unit of work are not rolled back."""
+    session = RoutingSession(bind=create_engine("sqlite://"))
+    session.execute(text("CREATE TABLE t (id INTEGER)"))
+    assert WROTE_KEY not in session.info
+
+    session.execute(insert(table("t", column("id"))).values(id=1))
+    assert session.info[WROTE_KEY]
+
+    async_session = make_session()
+    async_session.info[WROTE_KEY] = True
+    assert not asyncio.run(release_connection(async_session))
+    async_session.close.assert_not_awaited()
+
+    session.commit()
+    assert WROTE_KEY not in session.info
+
+
+def test_release_connection_disabled() -> None:
+    """Early release can be turned off in the settings."""
+    session = make_session(early_release=False)
+
+    assert not asyncio.run(release_connection(session))